@@ -0,0 +1,52 @@
+"""Deferred imports of heavy dependencies.
+
+Importing datatable, jsonschema and requests takes a noticeable amount of
+time, which short-lived processes shouldn't pay for unless they use them.
+These proxies import the underlying module on first attribute access.
+"""
+import importlib
+from typing import Any, Callable
+
+
+class LazyModule:
+    """Stand-in for a module, which is imported when first used"""
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._module: Any = None
+
+    def _load(self) -> Any:
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __repr__(self) -> str:
+        return f"<lazy module '{self._name}'>"
+
+
+class LazyObject:
+    """Stand-in for an object (eg `datatable.f`), created when first used"""
+
+    def __init__(self, factory: Callable[[], Any]) -> None:
+        self._factory = factory
+        self._obj: Any = None
+
+    def _load(self) -> Any:
+        if self._obj is None:
+            self._obj = self._factory()
+        return self._obj
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __getitem__(self, item: Any) -> Any:
+        return self._load()[item]
+
+
+dt: Any = LazyModule("datatable")
+f: Any = LazyObject(lambda: dt.f)
+jsonschema: Any = LazyModule("jsonschema")
+requests: Any = LazyModule("requests")
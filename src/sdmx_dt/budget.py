@@ -0,0 +1,182 @@
+"""Limit the memory used to parse large dataSets.
+
+Within the budget, dataSets are parsed in one piece as usual. Otherwise they
+are parsed in chunks (see `SdmxJsonData.iter_observations()`), and if the
+process's memory goes over the budget, the parsed chunks are spilled to
+temporary .jay files. The chunks are then returned as a `ChunkedFrame`, with
+the spilled chunks memory-mapped from disk rather than held in memory.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional, Tuple, Union
+
+from sdmx_dt._lazy import dt
+from sdmx_dt.sdmx_json import DEFAULT_CHUNK_SIZE, SdmxJsonData
+
+# Rough memory needed to parse one observation (Python objects, before the
+# columns are built), from parsing a 1,000,000 observation dataSet
+PARSE_BYTES_PER_ROW = 100
+
+
+class MemoryBudgetExceeded(MemoryError):
+    pass
+
+
+@dataclass
+class MemoryBudget:
+    """Limits for parsing dataSets
+
+    `max_rows` is the most observations parsed at once (also the chunk size),
+    `max_memory` the resident memory (in bytes) of the process above which
+    parsed chunks are spilled to temporary files in `spill_dir`, and
+    `max_input_bytes` the largest message which will be read into memory.
+    """
+
+    max_rows: Optional[int] = None
+    max_memory: Optional[int] = None
+    max_input_bytes: Optional[int] = None
+    spill_dir: Optional[str] = None
+
+    def check_input_size(self, size: Optional[int]) -> None:
+        """Raise `MemoryBudgetExceeded` if input (of known size) is too large"""
+        if self.max_input_bytes is not None and size is not None:
+            if size > self.max_input_bytes:
+                raise MemoryBudgetExceeded(
+                    f"Input is {size} bytes, which is more than the budget of "
+                    f"{self.max_input_bytes} bytes."
+                )
+
+    def read_dataSet(
+        self,
+        data: SdmxJsonData,
+        dataSet_idx: int = 0,
+        all_attributes: bool = False,
+        parse_time_periods: bool = False,
+    ) -> Union[dt.Frame, ChunkedFrame]:
+        """Parse a dataSet into datatable, within the budget
+
+        DataSets parsed in chunks are returned as a `ChunkedFrame`, since
+        concatenating the chunks would read any spilled chunks back into
+        memory. The returned `meta` has "rows", "chunks", "spilled", and the
+        "current_memory" and "peak_memory" of the process (in bytes).
+        """
+        num_rows = data.num_observations(dataSet_idx)
+        if not self._is_exceeded(num_rows):
+            if data.dataSets[dataSet_idx].series:
+                frame = data.get_series_level(dataSet_idx, all_attributes)
+            else:
+                frame = data.get_observations_level(dataSet_idx, all_attributes)
+            if parse_time_periods:
+                frame = data._add_period_columns(frame)
+            frame.meta = self._meta(num_rows, chunks=1, spilled=False)
+            return frame
+
+        chunk_size = self.max_rows or DEFAULT_CHUNK_SIZE
+        chunks: List[dt.Frame] = []
+        num_spilled = 0
+        for chunk in data.iter_observations(dataSet_idx, chunk_size, all_attributes):
+            if parse_time_periods:
+                chunk = data._add_period_columns(chunk)
+            chunks.append(chunk)
+            if self._is_over_memory():
+                chunks[num_spilled:] = map(self._spill, chunks[num_spilled:])
+                num_spilled = len(chunks)
+        meta = self._meta(num_rows, len(chunks), spilled=num_spilled > 0)
+        return ChunkedFrame(chunks, meta)
+
+    def _is_exceeded(self, num_rows: int) -> bool:
+        if self.max_rows is not None and num_rows > self.max_rows:
+            return True
+        return self._is_over_memory(num_rows * PARSE_BYTES_PER_ROW)
+
+    def _is_over_memory(self, extra: int = 0) -> bool:
+        memory = current_memory()
+        if self.max_memory is None or memory is None:
+            return False
+        return memory + extra > self.max_memory
+
+    def _spill(self, frame: dt.Frame) -> dt.Frame:
+        """Write datatable to temporary .jay file, and open it memory-mapped"""
+        fd, path = tempfile.mkstemp(suffix=".jay", dir=self.spill_dir)
+        os.close(fd)
+        frame.to_jay(path)
+        spilled = dt.fread(path)
+        try:
+            # The mapping stays valid after the file is unlinked (except on Windows)
+            os.remove(path)
+        except OSError:
+            pass
+        return spilled
+
+    @staticmethod
+    def _meta(num_rows: int, chunks: int, spilled: bool) -> dict:
+        return {
+            "rows": num_rows,
+            "chunks": chunks,
+            "spilled": spilled,
+            "current_memory": current_memory(),
+            "peak_memory": peak_memory(),
+        }
+
+
+@dataclass
+class ChunkedFrame:
+    """Observations stored as chunks of rows, some of which may be spilled
+
+    Spilled chunks are memory-mapped, so iterating over the chunks does not
+    hold them all in memory. `to_frame()` concatenates the chunks, which
+    reads them all into memory.
+    """
+
+    chunks: List[dt.Frame]
+    meta: dict = field(default_factory=dict)
+
+    @property
+    def nrows(self) -> int:
+        return sum(chunk.nrows for chunk in self.chunks)
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        return self.chunks[0].names if self.chunks else ()
+
+    def __iter__(self) -> Iterator[dt.Frame]:
+        return iter(self.chunks)
+
+    def to_frame(self) -> dt.Frame:
+        frame = dt.rbind(*self.chunks, force=True)
+        frame.meta = self.meta
+        return frame
+
+
+def current_memory() -> Optional[int]:
+    """Resident memory of the process in bytes, excluding memory-mapped files
+
+    Mapped files (eg spilled datatables) can be paged out instead of running
+    out of memory, so are not counted. Outside of Linux, this is the peak.
+    """
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("RssAnon:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return peak_memory()
+
+
+def peak_memory() -> Optional[int]:
+    """Peak resident memory of the process in bytes (None if it is unknown)
+
+    Unlike `current_memory()`, this includes memory-mapped files.
+    """
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux gives kilobytes, macOS gives bytes
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
@@ -0,0 +1,303 @@
+"""Command-line batch converter: `sdmx-dt [options] INPUT...`
+
+Converts SDMX-JSON data messages (files, directories, globs or URLs) to CSV,
+Parquet, Arrow or .jay files in parallel, skipping outputs which are already
+up to date.
+"""
+from __future__ import annotations
+
+import argparse
+import glob
+import hashlib
+import io
+import json
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from sdmx_dt.compression import decompressing_reader
+from sdmx_dt.sdmx_json import DEFAULT_CHUNK_SIZE, SdmxJsonDataMessage, read_bytes
+
+FORMATS = {"csv": ".csv", "parquet": ".parquet", "arrow": ".arrow", "jay": ".jay"}
+# Files picked up from input directories, including compressed messages
+INPUT_PATTERNS = [
+    "*.json",
+    "*.json.gz",
+    "*.json.zst",
+    "*.json.bz2",
+    "*.json.xz",
+    "*.zip",
+]
+
+
+@dataclass
+class Task:
+    source: str
+    is_url: bool
+    output_stem: str
+    format: str
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+    validate: bool = False
+
+
+@dataclass
+class Result:
+    source: str
+    outputs: List[str] = field(default_factory=list)
+    num_rows: int = 0
+    num_bytes: int = 0
+    seconds: float = 0.0
+    skipped: bool = False
+    error: Optional[str] = None
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _parse_args(argv)
+    sources = expand_inputs(args.inputs, args.from_file)
+    if not sources:
+        print("sdmx-dt: no input files found.", file=sys.stderr)
+        return 2
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    stems = unique_stems(sources)
+    tasks = [
+        Task(
+            source=source,
+            is_url=_is_url(source),
+            output_stem=os.path.join(args.output_dir, stems[source]),
+            format=args.format,
+            chunk_size=args.chunk_size,
+            validate=args.validate,
+        )
+        for source in sources
+    ]
+    todo, results = [], []
+    for task in tasks:
+        if args.force or not is_up_to_date(task):
+            todo.append(task)
+        else:
+            results.append(Result(task.source, skipped=True))
+
+    start = time.perf_counter()
+    for result in run_tasks(todo, args.jobs):
+        results.append(result)
+        if not args.quiet:
+            _print_progress(result)
+    elapsed = time.perf_counter() - start
+
+    _print_summary(results, elapsed)
+    return 1 if any(r.error for r in results) else 0
+
+
+def expand_inputs(inputs: Iterable[str], from_file: Optional[str] = None) -> List[str]:
+    """Expand directories (JSON files within) and globs, keeping URLs as they are"""
+    inputs = list(inputs)
+    if from_file:
+        with open(from_file) as f:
+            inputs.extend(line.strip() for line in f if line.strip())
+
+    sources: List[str] = []
+    for item in inputs:
+        if _is_url(item):
+            sources.append(item)
+        elif os.path.isdir(item):
+            sources.extend(
+                sorted(
+                    path
+                    for pattern in INPUT_PATTERNS
+                    for path in glob.glob(os.path.join(glob.escape(item), pattern))
+                )
+            )
+        elif glob.has_magic(item):
+            sources.extend(sorted(glob.glob(item, recursive=True)))
+        else:
+            sources.append(item)
+    # Drop duplicates, but keep order
+    return list(dict.fromkeys(sources))
+
+
+def unique_stems(sources: Sequence[str]) -> Dict[str, str]:
+    """Output file stems, by source
+
+    The stem is the file name without extensions, but sources with the same
+    name (eg in different directories, or URLs differing in their query) get
+    a short hash of the full source appended, so they do not overwrite each
+    other's outputs.
+    """
+    stems = {source: _stem(source) for source in sources}
+    counts = Counter(stems.values())
+    return {
+        source: stem
+        if counts[stem] == 1
+        else f"{stem}-{hashlib.sha1(source.encode()).hexdigest()[:8]}"
+        for source, stem in stems.items()
+    }
+
+
+def output_paths(task: Task, num_dataSets: int) -> List[str]:
+    """Output file names for a message with `num_dataSets` dataSets"""
+    ext = FORMATS[task.format]
+    if num_dataSets == 1:
+        return [task.output_stem + ext]
+    return [f"{task.output_stem}.{i}{ext}" for i in range(num_dataSets)]
+
+
+def existing_outputs(task: Task) -> List[str]:
+    """Outputs of a previous conversion of the task (empty if there are none)"""
+    single = output_paths(task, 1)
+    if os.path.exists(single[0]):
+        return single
+    num_dataSets = 0
+    while os.path.exists(output_paths(task, num_dataSets + 1)[-1]):
+        num_dataSets += 1
+    return output_paths(task, num_dataSets) if num_dataSets > 1 else []
+
+
+def is_up_to_date(task: Task) -> bool:
+    """Whether outputs exist and are newer than the input
+
+    For URLs, existing outputs are always considered up to date.
+    """
+    outputs = existing_outputs(task)
+    if not outputs:
+        return False
+    if task.is_url:
+        return True
+    try:
+        source_mtime = os.path.getmtime(task.source)
+    except OSError:
+        return False
+    return all(os.path.getmtime(output) >= source_mtime for output in outputs)
+
+
+def run_tasks(tasks: List[Task], jobs: int) -> Iterable[Result]:
+    if jobs <= 1 or len(tasks) <= 1:
+        yield from map(convert, tasks)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        yield from executor.map(convert, tasks)
+
+
+def convert(task: Task) -> Result:
+    """Convert one message, capturing (rather than raising) any error"""
+    from sdmx_dt import writers
+
+    result = Result(task.source)
+    tmp_paths: List[str] = []
+    start = time.perf_counter()
+    try:
+        content = read_bytes(task.source, task.is_url)
+        result.num_bytes = len(content)
+        with decompressing_reader(io.BytesIO(content)) as stream:
+            message_obj = json.load(stream)
+        message = SdmxJsonDataMessage(message_obj, validate=task.validate)
+        if message.data is None:
+            raise ValueError("Message does not contain data.")
+
+        writer = getattr(writers, "to_" + task.format)
+        paths = output_paths(task, len(message.data.dataSets))
+        # Write to temporary files, so an interrupted or failed conversion
+        # does not leave outputs which look up to date
+        for i, path in enumerate(paths):
+            tmp_paths.append(path + ".tmp")
+            writer(
+                message.data, tmp_paths[-1], dataSet_idx=i, chunk_size=task.chunk_size
+            )
+            result.num_rows += message.data.num_observations(i)
+        for tmp_path, path in zip(tmp_paths, paths):
+            os.replace(tmp_path, path)
+            result.outputs.append(path)
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+        for tmp_path in tmp_paths:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def _parse_args(argv: Optional[Sequence[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="sdmx-dt",
+        description="Convert SDMX-JSON data messages to CSV/Parquet/Arrow/.jay.",
+    )
+    parser.add_argument(
+        "inputs", nargs="*", help="Files, directories, glob patterns or URLs"
+    )
+    parser.add_argument(
+        "--from-file", help="File listing further inputs (one path/URL per line)"
+    )
+    parser.add_argument("-o", "--output-dir", default=".", help="Output directory")
+    parser.add_argument(
+        "-f", "--format", choices=sorted(FORMATS), default="csv", help="Output format"
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help="Rows per chunk when writing",
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="Convert even if outputs are up to date"
+    )
+    parser.add_argument(
+        "--validate", action="store_true", help="Validate against JSON schema"
+    )
+    parser.add_argument("-q", "--quiet", action="store_true", help="No progress")
+    return parser.parse_args(argv)
+
+
+def _is_url(source: str) -> bool:
+    return source.startswith(("http://", "https://"))
+
+
+def _stem(source: str) -> str:
+    name = source.rstrip("/").split("/")[-1].split("?")[0] or "message"
+    for suffix in [".gz", ".zst", ".bz2", ".xz", ".zip", ".json"]:
+        if name.endswith(suffix):
+            name = name[: -len(suffix)]
+    return name
+
+
+def _print_progress(result: Result) -> None:
+    if result.error:
+        print(f"FAILED {result.source}: {result.error}", file=sys.stderr)
+    else:
+        print(
+            f"{result.source} -> {', '.join(result.outputs)} "
+            f"({result.num_rows:,} rows, {result.seconds:.2f}s)",
+            file=sys.stderr,
+        )
+
+
+def _print_summary(results: List[Result], elapsed: float) -> None:
+    converted = [r for r in results if not r.skipped and not r.error]
+    failed = [r for r in results if r.error]
+    skipped = [r for r in results if r.skipped]
+    num_rows = sum(r.num_rows for r in converted)
+    num_mb = sum(r.num_bytes for r in converted) / 1e6
+    rate = 1 / elapsed if elapsed > 0 else 0.0
+    print(
+        f"Converted {len(converted)}, skipped {len(skipped)}, failed {len(failed)} "
+        f"in {elapsed:.2f}s ({num_rows * rate:,.0f} rows/s, {num_mb * rate:.1f} MB/s)",
+        file=sys.stderr,
+    )
+    if failed:
+        print("Errors:", file=sys.stderr)
+        for r in failed:
+            print(f"  {r.source}: {r.error}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
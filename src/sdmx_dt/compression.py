@@ -0,0 +1,75 @@
+"""Transparent decompression of inputs, detected from their magic bytes.
+
+gzip, bz2, xz and zip are handled with the standard library. zstd needs the
+optional `zstandard` dependency.
+"""
+import bz2
+import gzip
+import io
+import lzma
+import zipfile
+from typing import IO, Optional, cast
+
+MAGIC_NUMBERS = {
+    b"\x1f\x8b": "gzip",
+    b"\x28\xb5\x2f\xfd": "zstd",
+    b"PK\x03\x04": "zip",
+    b"BZh": "bz2",
+    b"\xfd7zXZ\x00": "xz",
+}
+
+
+def detect_compression(header: bytes) -> Optional[str]:
+    """Name of compression format from the first bytes of a file, if any"""
+    for magic, name in MAGIC_NUMBERS.items():
+        if header.startswith(magic):
+            return name
+    return None
+
+
+def decompressing_reader(fileobj: IO[bytes]) -> io.BufferedIOBase:
+    """Wrap binary file object, so reading gives decompressed contents
+
+    Decompression is streamed, so the compressed input is never held in
+    memory as a whole (except for zip archives read from unseekable streams,
+    as zip's directory is at the end of the file). Uncompressed input is
+    returned as it is.
+    """
+    if hasattr(fileobj, "peek"):
+        buffered = cast(io.BufferedReader, fileobj)
+    else:
+        buffered = io.BufferedReader(cast(io.RawIOBase, fileobj))
+    compression = detect_compression(buffered.peek(8)[:8])
+
+    if compression is None:
+        return buffered
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=buffered)
+    if compression == "bz2":
+        return bz2.BZ2File(buffered)
+    if compression == "xz":
+        return lzma.LZMAFile(buffered)
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError(
+                "Reading zstd-compressed input requires zstandard: "
+                "`pip install zstandard`."
+            ) from None
+        reader = zstandard.ZstdDecompressor().stream_reader(buffered)
+        return cast(io.BufferedIOBase, reader)
+    return _open_zip_member(buffered)
+
+
+def _open_zip_member(fileobj: IO[bytes]) -> io.BufferedIOBase:
+    """Open the single (JSON) file within a zip archive"""
+    if not fileobj.seekable():
+        fileobj = io.BytesIO(fileobj.read())
+    archive = zipfile.ZipFile(fileobj)
+    members = [i for i in archive.infolist() if not i.is_dir()]
+    if len(members) > 1:
+        members = [i for i in members if i.filename.endswith(".json")]
+    if len(members) != 1:
+        raise ValueError("Zip archive must contain exactly one (JSON) file.")
+    return cast(io.BufferedIOBase, archive.open(members[0]))
@@ -0,0 +1,99 @@
+"""Combine messages whose structures list values in different orders.
+
+Paginated or per-country responses each have their own "structure", so the
+same code can have a different index in each message. The structures are
+unified into a single structure (the union of their components and values),
+and each message is parsed with lookups that give the unified value index
+rather than the label. The integer columns are concatenated natively, and
+labels are only looked up once, for the combined datatable.
+"""
+from __future__ import annotations
+
+import copy
+from typing import Dict, List, Sequence, Tuple, Union
+
+from sdmx_dt._lazy import dt
+from sdmx_dt.sdmx_json import CompiledStructure, SdmxJsonData
+
+LEVELS = ["dataSet", "series", "observation", "dimensionGroup"]
+
+
+def concat_messages(messages: Sequence[SdmxJsonData], dataSet_idx: int = 0) -> dt.Frame:
+    """Concatenate the observations of a dataSet of each message
+
+    Columns are matched by component id, and named as in the first message
+    with that component. Columns which are not in every message are NA for
+    the observations of the other messages.
+    """
+    structure_obj, remaps = _unify(messages)
+    unified = CompiledStructure.from_structure(structure_obj)
+    names = {
+        c.id: c.name
+        for components in [*unified.dimensions.values(), *unified.attributes.values()]
+        for c in components
+    }
+    frames = [
+        message.get_codes(dataSet_idx, remap, names)
+        for message, remap in zip(messages, remaps)
+    ]
+    combined = dt.rbind(*[frame for frame in frames if frame.ncols], force=True)
+
+    # Translate the unified value indices into labels, with a single gather
+    return unified.decode(combined)
+
+
+def unify_structures(messages: Sequence[SdmxJsonData]) -> dict:
+    """Get "structure" object with the components and values of all messages
+
+    The first message's structure provides the other fields (eg "links").
+    """
+    return _unify(messages)[0]
+
+
+def _unify(
+    messages: Sequence[SdmxJsonData],
+) -> Tuple[dict, List[Dict[str, List[int]]]]:
+    """Helper to unify structures, and map each message's value indices
+
+    Returns the unified "structure" object, and for each message the new
+    index of each value, by component id. Values are matched by id (or
+    name, for values without ids).
+    """
+    structure_obj = copy.deepcopy(messages[0].structure.to_dict())
+    components: Dict[str, dict] = {}
+    value_positions: Dict[str, Dict[Union[str, Tuple[str, str]], int]] = {}
+    remaps: List[Dict[str, List[int]]] = []
+    for kind in ["dimensions", "attributes"]:
+        structure_obj[kind] = {level: [] for level in LEVELS if level in _levels(kind)}
+
+    for message in messages:
+        remap: Dict[str, List[int]] = {}
+        dsd_obj = message.structure.to_dict()
+        for kind in ["dimensions", "attributes"]:
+            for level, level_components in (dsd_obj.get(kind) or {}).items():
+                for component in level_components:
+                    component_id = component["id"]
+                    if component_id not in components:
+                        unified = {**component, "values": []}
+                        components[component_id] = unified
+                        value_positions[component_id] = {}
+                        structure_obj[kind].setdefault(level, []).append(unified)
+                    unified_values = components[component_id]["values"]
+                    positions = value_positions[component_id]
+                    remap[component_id] = []
+                    for value in component.get("values", []):
+                        value_key = _value_key(value)
+                        if value_key not in positions:
+                            positions[value_key] = len(unified_values)
+                            unified_values.append(value)
+                        remap[component_id].append(positions[value_key])
+        remaps.append(remap)
+    return structure_obj, remaps
+
+
+def _levels(kind: str) -> List[str]:
+    return LEVELS if kind == "attributes" else LEVELS[:3]
+
+
+def _value_key(value: dict) -> Union[str, Tuple[str, str]]:
+    return value["id"] if value.get("id") is not None else ("name", value["name"])
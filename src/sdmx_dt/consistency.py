@@ -0,0 +1,246 @@
+"""Check that the keys and indices in dataSets are consistent with the structure.
+
+This is much cheaper than validating the whole message against the JSON
+schema, and catches the problems which would otherwise surface as an
+`IndexError`/`KeyError` while parsing: keys with the wrong number of parts,
+and dimension/attribute value indices outside of the structure's values.
+All of the problems are reported at once.
+"""
+from __future__ import annotations
+
+from typing import List, Optional, Sequence
+
+from sdmx_dt._lazy import dt, f
+from sdmx_dt.sdmx_json import ComponentLookup, DataSet, SdmxJsonData
+
+COLUMNS = [
+    "dataSet",
+    "level",
+    "series",
+    "key",
+    "component",
+    "position",
+    "value",
+    "problem",
+]
+
+
+def check_consistency(data: SdmxJsonData) -> dt.Frame:
+    """Get datatable of problems in all dataSets (no rows if there are none)
+
+    Each problem gives the dataSet index, the level ("dataSet", "series" or
+    "observation"), the series and observation key where the problem is, the
+    component id (if known), position within the key or attributes, the
+    offending value and a description. Problems with observation keys are
+    reported once for each distinct key, without the series key.
+    """
+    checker = _Checker(data)
+    for i, dataSet in enumerate(data.dataSets):
+        checker.check_dataSet(i, dataSet)
+    return checker.to_frame()
+
+
+class _Checker:
+    def __init__(self, data: SdmxJsonData) -> None:
+        self.compiled = data.compiled
+        self.rows: List[tuple] = []
+
+    def to_frame(self) -> dt.Frame:
+        return dt.Frame(
+            {col: [row[i] for row in self.rows] for i, col in enumerate(COLUMNS)},
+            stypes={
+                col: dt.int32 if col in ("dataSet", "position") else dt.str32
+                for col in COLUMNS
+            },
+        )
+
+    def check_dataSet(self, i: int, dataSet: DataSet) -> None:
+        dims = self.compiled.dimensions
+        attrs = self.compiled.attributes
+        self._check_attributes(
+            i, "dataSet", [None], [None], [dataSet.attributes or []], attrs["dataSet"]
+        )
+
+        if dataSet.series is not None:
+            series_keys: List[Optional[str]] = list(dataSet.series)
+            self._check_keys(i, "series", list(dataSet.series), dims["series"])
+            series_attrs = []
+            obs_series: List[Optional[str]] = []
+            obs_keys: List[str] = []
+            obs_vals: List[list] = []
+            for series_key, series_info in dataSet.series.items():
+                series_attrs.append(series_info.get("attributes") or [])
+                observations = series_info.get("observations", {})
+                obs_series.extend([series_key] * len(observations))
+                obs_keys.extend(observations.keys())
+                obs_vals.extend(observations.values())
+            self._check_attributes(
+                i,
+                "series",
+                series_keys,
+                [None] * len(series_keys),
+                series_attrs,
+                attrs["series"],
+            )
+            unique_obs_keys = list(dict.fromkeys(obs_keys))
+        else:
+            obs_keys = list(dataSet.observations or {})
+            obs_vals = list((dataSet.observations or {}).values())
+            obs_series = [None] * len(obs_keys)
+            unique_obs_keys = obs_keys
+
+        self._check_keys(i, "observation", unique_obs_keys, dims["observation"])
+        for j, val in enumerate(obs_vals):
+            # Observations are deleted without giving their value
+            if not val and dataSet.action != "Delete":
+                self._add(
+                    i,
+                    "observation",
+                    obs_series[j],
+                    obs_keys[j],
+                    None,
+                    0,
+                    None,
+                    "no value",
+                )
+        self._check_attributes(
+            i,
+            "observation",
+            obs_series,
+            obs_keys,
+            obs_vals,
+            attrs["observation"],
+            offset=1,
+        )
+
+    def _check_keys(
+        self, i: int, level: str, keys: List[str], dims: List[ComponentLookup]
+    ) -> None:
+        """Helper to check number of parts and value indices of keys"""
+        split_keys = [key.split(":") for key in keys]
+        valid_keys, valid_parts = [], []
+        for key, parts in zip(keys, split_keys):
+            if len(parts) == len(dims):
+                valid_keys.append(key)
+                valid_parts.append(parts)
+            else:
+                self._add(
+                    i,
+                    level,
+                    key if level == "series" else None,
+                    None if level == "series" else key,
+                    None,
+                    None,
+                    key,
+                    f"key has {len(parts)} parts, expected {len(dims)}",
+                )
+
+        for position, dim in enumerate(dims):
+            codes = dt.Frame([parts[position] for parts in valid_parts], stype=dt.str32)
+            indices = codes[:, dt.as_type(f[0], dt.int64)]
+            # Non-numeric codes become NA when converted
+            bad_rows = _bad_rows(indices, len(dim.labels))
+            bad_rows.extend(_na_rows(indices))
+            for row in sorted(set(bad_rows)):
+                value = valid_parts[row][position]
+                key = valid_keys[row]
+                self._add(
+                    i,
+                    level,
+                    key if level == "series" else None,
+                    None if level == "series" else key,
+                    dim.id,
+                    position,
+                    value,
+                    _index_problem(dim, value),
+                )
+
+    def _check_attributes(
+        self,
+        i: int,
+        level: str,
+        series_keys: Sequence[Optional[str]],
+        keys: Sequence[Optional[str]],
+        attr_vals: List[list],
+        attr_structure: List[ComponentLookup],
+        offset: int = 0,
+    ) -> None:
+        """Helper to check attribute value indices, starting at `offset`"""
+        too_long = [
+            j
+            for j, vals in enumerate(attr_vals)
+            if len(vals) > offset + len(attr_structure)
+        ]
+        for j in too_long:
+            self._add(
+                i,
+                level,
+                series_keys[j],
+                keys[j],
+                None,
+                None,
+                str(len(attr_vals[j]) - offset),
+                f"{len(attr_vals[j]) - offset} attributes given, "
+                f"expected at most {len(attr_structure)}",
+            )
+
+        for position, attr in enumerate(attr_structure):
+            col = [
+                vals[position + offset] if len(vals) > position + offset else None
+                for vals in attr_vals
+            ]
+            indices = dt.Frame(col)
+            if indices.ltypes[0] in (dt.ltype.int, dt.ltype.void):
+                bad_rows = _bad_rows(indices, len(attr.labels))
+            else:
+                # Not all integers, so check values one at a time
+                bad_rows = [
+                    j
+                    for j, idx in enumerate(col)
+                    if idx is not None and not _is_index(idx, len(attr.labels))
+                ]
+            for j in bad_rows:
+                self._add(
+                    i,
+                    level,
+                    series_keys[j],
+                    keys[j],
+                    attr.id,
+                    position,
+                    str(col[j]),
+                    _index_problem(attr, col[j]),
+                )
+
+    def _add(self, *row) -> None:
+        self.rows.append(row)
+
+
+def _bad_rows(indices: dt.Frame, size: int) -> List[int]:
+    """Rows of an integer column which are not NA and outside 0 to size - 1"""
+    if indices.ltypes[0] == dt.ltype.void:
+        return []
+    return _rows_where(indices, (f[0] < 0) | (f[0] >= size))
+
+
+def _na_rows(indices: dt.Frame) -> List[int]:
+    return _rows_where(indices, dt.isna(f[0]))
+
+
+def _rows_where(column: dt.Frame, condition) -> List[int]:
+    """Row numbers where `condition` (on the first column) is true"""
+    rows = dt.cbind(
+        column[:, {"value": f[0]}],
+        dt.Frame({"row": range(column.nrows)}, stype=dt.int32),
+    )
+    return rows[condition, "row"].to_list()[0]
+
+
+def _is_index(value, size: int) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool) and 0 <= value < size
+
+
+def _index_problem(component: ComponentLookup, value) -> str:
+    return (
+        f"`{value}` is not a value index of `{component.id}` "
+        f"(0 to {len(component.labels) - 1})"
+    )
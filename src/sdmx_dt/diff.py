@@ -0,0 +1,124 @@
+"""Compare the observations of two releases of an SDMX-JSON dataset.
+
+Observations are matched on their dimension labels with keyed (hash) joins,
+so comparing releases takes roughly linear time, and never leaves datatable.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List
+
+from sdmx_dt._lazy import dt, f
+from sdmx_dt.concat import unify_structures
+from sdmx_dt.json_writer import write_json_dataSets
+from sdmx_dt.sdmx_json import SdmxJsonData
+
+OLD_PREFIX = "Previous "
+
+
+@dataclass
+class Diff:
+    """Observations which differ between releases
+
+    `added` and the changed observations have the columns of the new
+    release, and `removed` has the columns of the old release. Observations
+    whose value changed are not also in `attribute_changed`. Both changed
+    datatables also have the old value, as "Previous Value".
+    """
+
+    added: dt.Frame
+    removed: dt.Frame
+    value_changed: dt.Frame
+    attribute_changed: dt.Frame
+
+    def write_delta(
+        self, old: SdmxJsonData, new: SdmxJsonData, path: str, **kwargs
+    ) -> None:
+        """Write SDMX-JSON message which updates the old release to the new
+
+        The message has a "Replace" dataSet with the added and changed
+        observations, and a "Delete" dataSet with the removed observations.
+        Empty dataSets are left out, so if nothing changed the message has no
+        dataSets. The structure is the union of the releases' structures
+        (see `unify_structures()`), so it has the codes of removed
+        observations too. Keyword arguments are passed to
+        `write_json_dataSets()`.
+        """
+        # rbind onto a copy, so the columns are kept even if there are no rows
+        replace = self.added.copy()
+        replace.rbind(self.value_changed, self.attribute_changed, force=True)
+        delete = self.removed.copy()
+        delete["Value"] = None
+        delete["Value"] = dt.float64
+        dataSets = [
+            (action, frame)
+            for action, frame in [("Replace", replace), ("Delete", delete)]
+            if frame.nrows
+        ]
+        structure = unify_structures([old, new])
+        write_json_dataSets(dataSets, structure, path, **kwargs)
+
+
+def diff(old: SdmxJsonData, new: SdmxJsonData, dataSet_idx: int = 0) -> Diff:
+    """Classify the observations which were added, removed or changed
+
+    Observations are matched by all of the dimensions of the new release
+    (which must also be dimensions of the old release), and attributes are
+    compared when they are in both releases.
+    """
+    new_obs = _get_dataSet(new, dataSet_idx)
+    old_obs = _get_dataSet(old, dataSet_idx)
+    dims = [
+        dim.name
+        for dim in new.compiled.dimensions["series"]
+        + new.compiled.dimensions["observation"]
+    ]
+    missing = [dim for dim in dims if dim not in old_obs.names]
+    if missing:
+        raise ValueError(f"The old release does not have dimensions: {missing}")
+    attrs = [
+        name
+        for name in new_obs.names
+        if name not in dims and name != "Value" and name in old_obs.names
+    ]
+
+    joined = new_obs[:, :, dt.join(_keyed(old_obs, dims, ["Value"] + attrs))]
+    in_old = ~dt.isna(f["__matched"])
+    value_changed = in_old & (f["Value"] != f[OLD_PREFIX + "Value"])
+    attribute_changed = in_old & ~value_changed & _any_differ(attrs)
+    with_old_value = new_obs.names + (OLD_PREFIX + "Value",)
+
+    unmatched = old_obs[:, :, dt.join(_keyed(new_obs, dims, []))]
+    return Diff(
+        added=joined[dt.isna(f["__matched"]), new_obs.names],
+        removed=unmatched[dt.isna(f["__matched"]), old_obs.names],
+        value_changed=joined[value_changed, with_old_value],
+        attribute_changed=joined[attribute_changed, with_old_value],
+    )
+
+
+def _get_dataSet(data: SdmxJsonData, dataSet_idx: int) -> dt.Frame:
+    if data.dataSets[dataSet_idx].series:
+        return data.get_series_level(dataSet_idx)
+    return data.get_observations_level(dataSet_idx)
+
+
+def _keyed(obs: dt.Frame, dims: List[str], compared: List[str]) -> dt.Frame:
+    """Helper to key observations by dimensions, with prefixed compared columns"""
+    keyed = obs[:, dims + compared]
+    keyed.names = dims + [OLD_PREFIX + name for name in compared]
+    keyed["__matched"] = dt.Frame([True] * obs.nrows)
+    try:
+        keyed.key = dims
+    except ValueError:
+        raise ValueError("Observations do not have unique dimensions.") from None
+    return keyed
+
+
+def _any_differ(attrs: List[str]) -> dt.FExpr:
+    """Helper expression for whether any attribute differs (NA equals NA)"""
+    # Without attributes to compare, nothing differs
+    differ = f["__matched"] != f["__matched"]
+    for name in attrs:
+        differ = differ | (f[name] != f[OLD_PREFIX + name])
+    return differ
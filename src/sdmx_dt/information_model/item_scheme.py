@@ -1,7 +1,7 @@
 from __future__ import annotations  # for Item self-reference
 
 from abc import ABC
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Sequence
 
 from sdmx_dt.information_model.base import MaintainableArtefact, NameableArtefact
 
@@ -16,8 +16,168 @@ class Item(NameableArtefact, ABC):
 
 
 class ItemScheme(MaintainableArtefact, ABC):
-    def __init__(self, is_partial: bool, num_items: int = 0, **kwargs) -> None:
+    def __init__(
+        self,
+        is_partial: bool,
+        num_items: int = 0,
+        items: Optional[Sequence[Item]] = None,
+        **kwargs,
+    ) -> None:
         super().__init__(**kwargs)
         self.is_partial = is_partial
         # TODO: how to inherit self.items but use different class (eg Category rather than Item)
-        self.items = [Item() for _ in range(num_items)]  # 0..*
+        if items is not None:
+            self.items = list(items)
+        else:
+            self.items = [Item() for _ in range(num_items)]  # 0..*
+        self._hierarchy: Optional[HierarchyIndex] = None
+
+    @property
+    def hierarchy(self) -> HierarchyIndex:
+        """Index over the parent/child relationships of the items
+
+        This is built on first access, so call `invalidate_hierarchy()` after
+        changing the items.
+        """
+        if self._hierarchy is None:
+            self._hierarchy = HierarchyIndex(
+                [item.id for item in self.items],
+                [item.parent.id if item.parent else None for item in self.items],
+            )
+        return self._hierarchy
+
+    def invalidate_hierarchy(self) -> None:
+        self._hierarchy = None
+
+
+class HierarchyIndex:
+    """Precomputed index for walking a hierarchy of items
+
+    Each item gets a nested-set interval from a depth-first (Euler) tour, so
+    an item's descendants are exactly the items whose `left` falls within its
+    [left, right) interval. This makes descendant tests O(1) and descendant
+    listings a slice. The path from the root is also stored for every item,
+    which makes level-k ancestor lookups O(1).
+    """
+
+    def __init__(self, ids: Sequence[str], parents: Sequence[Optional[str]]) -> None:
+        if len(ids) != len(parents):
+            raise ValueError("`ids` and `parents` must be the same length.")
+
+        self.ids = list(ids)
+        self.positions = {id_: i for i, id_ in enumerate(self.ids)}
+        if len(self.positions) != len(self.ids):
+            raise ValueError("Item ids must be unique.")
+
+        self.parents = [-1] * len(ids)
+        children: List[List[int]] = [[] for _ in ids]
+        roots = []
+        for i, parent in enumerate(parents):
+            if parent is None:
+                roots.append(i)
+                continue
+            if parent not in self.positions:
+                raise ValueError(f"Parent `{parent}` of `{ids[i]}` is not an item.")
+            self.parents[i] = self.positions[parent]
+            children[self.parents[i]].append(i)
+
+        self.left = [-1] * len(ids)
+        self.right = [-1] * len(ids)
+        self.depth = [0] * len(ids)
+        self.paths: List[List[int]] = [[] for _ in ids]
+        self.preorder: List[int] = []
+        # Iterative depth-first tour, as hierarchies can be deeper than the
+        # recursion limit
+        stack = [(root, False) for root in reversed(roots)]
+        while stack:
+            i, is_exit = stack.pop()
+            if is_exit:
+                self.right[i] = len(self.preorder)
+                continue
+            parent_i = self.parents[i]
+            if parent_i >= 0:
+                self.depth[i] = self.depth[parent_i] + 1
+                self.paths[i] = self.paths[parent_i] + [i]
+            else:
+                self.paths[i] = [i]
+            self.left[i] = len(self.preorder)
+            self.preorder.append(i)
+            stack.append((i, True))
+            stack.extend((child, False) for child in reversed(children[i]))
+
+        if len(self.preorder) != len(self.ids):
+            raise ValueError("Items contain a parent/child cycle.")
+
+        self._level_maps: Dict[int, Dict[str, Optional[str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def is_descendant(self, id_: str, ancestor_id: str) -> bool:
+        """Whether `id_` is strictly below `ancestor_id` in the hierarchy"""
+        i, a = self.positions[id_], self.positions[ancestor_id]
+        return self.left[a] < self.left[i] < self.right[a]
+
+    def descendants(self, id_: str) -> List[str]:
+        """All items below `id_`, in depth-first order"""
+        i = self.positions[id_]
+        return [self.ids[j] for j in self.preorder[self.left[i] + 1 : self.right[i]]]
+
+    def children(self, id_: str) -> List[str]:
+        i = self.positions[id_]
+        return [
+            self.ids[j]
+            for j in self.preorder[self.left[i] + 1 : self.right[i]]
+            if self.parents[j] == i
+        ]
+
+    def ancestors(self, id_: str) -> List[str]:
+        """Items above `id_`, starting from its root"""
+        return [self.ids[j] for j in self.paths[self.positions[id_]][:-1]]
+
+    def ancestor_at_level(self, id_: str, level: int) -> Optional[str]:
+        """Ancestor at depth `level` (roots are level 0)
+
+        Items which are shallower than `level` have no such ancestor, so
+        None is returned for them.
+        """
+        path = self.paths[self.positions[id_]]
+        return self.ids[path[level]] if level < len(path) else None
+
+    def level_map(self, level: int) -> Dict[str, Optional[str]]:
+        """Mapping of every item to its ancestor at depth `level`"""
+        if level not in self._level_maps:
+            self._level_maps[level] = {
+                id_: self.ids[path[level]] if level < len(path) else None
+                for id_, path in zip(self.ids, self.paths)
+            }
+        return self._level_maps[level]
+
+    def ancestors_at_level(
+        self, ids: Iterable[Optional[str]], level: int
+    ) -> List[Optional[str]]:
+        """Map many items to their ancestor at depth `level`
+
+        Ids which are None or not in the hierarchy are mapped to None.
+        """
+        level_map = self.level_map(level)
+        return [level_map.get(id_) if id_ is not None else None for id_ in ids]
+
+    def add_ancestor_column(
+        self, frame, column: str, level: int, name: Optional[str] = None
+    ):
+        """Add column of level-`level` ancestors of `column` to a datatable
+
+        The mapping is done with a keyed join, so it runs natively over the
+        rows of `frame`. A new Frame is returned.
+        """
+        from datatable import dt
+
+        name = name or f"{column}_level{level}"
+        level_map = self.level_map(level)
+        lookup = dt.Frame(
+            {column: list(level_map.keys()), name: list(level_map.values())},
+            stypes={column: dt.str32, name: dt.str32},
+        )
+        lookup.key = column
+        return frame[:, :, dt.join(lookup)]
@@ -0,0 +1,390 @@
+"""Long-running ingestion of SDMX-JSON files into a `DataStore`:
+`sdmx-dt-ingest --store ROOT --dataflow ID (--watch DIR | --stdin | PATH...)`
+
+New files (found by polling a landing directory, or read from stdin or any
+other iterable of paths, eg a local queue) are parsed in a pool of worker
+processes, and their dataSets are applied to the store in the order the files
+arrived, according to the dataSet action (see `DataStore.apply()`). Each file
+is recorded in a checkpoint log once it has been applied, so restarting does
+not reprocess files which have not changed since.
+"""
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import (
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+)
+
+from sdmx_dt._lazy import dt
+from sdmx_dt.cli import Result, _print_progress, _print_summary, expand_inputs
+from sdmx_dt.sdmx_json import SdmxJsonData, fread_json
+from sdmx_dt.store import DataStore, message_key_columns
+
+CHECKPOINT_NAME = "ingest_checkpoint.jsonl"
+# Size and modification time (in ns) of a file, to tell whether it changed
+Signature = Tuple[int, int]
+
+
+@dataclass
+class ParsedFile:
+    source: str
+    dataSets: List[Tuple[str, dt.Frame]] = field(default_factory=list)
+    partition_column: Optional[str] = None
+    key_columns: List[str] = field(default_factory=list)
+    num_rows: int = 0
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+
+class Checkpoint:
+    """Log of processed files, with their signature when they were processed
+
+    Entries are appended as JSON lines (so recording a file does not rewrite
+    the log), and the last entry for a path wins. A file is processed if it
+    has an entry with its current signature, including files which failed.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.entries: Dict[str, dict] = {}
+        try:
+            with open(path) as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # Partially written when interrupted
+                    self.entries[entry["path"]] = entry
+        except FileNotFoundError:
+            pass
+
+    def is_processed(self, path: str, signature: Optional[Signature]) -> bool:
+        entry = self.entries.get(os.path.abspath(path))
+        if entry is None or entry["signature"] is None:
+            return False
+        return tuple(entry["signature"]) == signature
+
+    def add(
+        self, path: str, signature: Optional[Signature], error: Optional[str] = None
+    ) -> None:
+        entry: dict = {
+            "path": os.path.abspath(path),
+            "signature": signature,
+            "processed": datetime.now(timezone.utc).isoformat(),
+            "error": error,
+        }
+        self.entries[entry["path"]] = entry
+        with open(self.path, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+
+class Ingester:
+    """Apply SDMX-JSON files to a dataflow of a store
+
+    The checkpoint log is in the store's root directory, unless another
+    `checkpoint_path` is given.
+    """
+
+    def __init__(
+        self,
+        store: DataStore,
+        dataflow: str,
+        checkpoint_path: Optional[str] = None,
+        validate: bool = False,
+    ) -> None:
+        self.store = store
+        self.dataflow = dataflow
+        self.checkpoint = Checkpoint(
+            checkpoint_path or os.path.join(store.root, CHECKPOINT_NAME)
+        )
+        self.validate = validate
+
+    def run(
+        self, sources: Iterable[str], jobs: int = 1, poll_interval: float = 0.1
+    ) -> Iterator[Result]:
+        """Ingest files from `sources`, yielding a result for each file
+
+        `sources` may block (eg `watch_directory()` or `read_paths()`), as it
+        is consumed in a background thread. Up to twice `jobs` files are
+        parsed at once, and results are applied (and checked for every
+        `poll_interval` seconds) in the order that files arrived.
+        """
+        incoming = _read_in_background(sources)
+        pending: Deque[Tuple[str, Optional[Signature], Future]] = deque()
+        executor = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+        finished = False
+        try:
+            while not finished or pending:
+                while pending and pending[0][2].done():
+                    yield self._apply(*pending.popleft())
+                if finished or len(pending) >= 2 * max(jobs, 1):
+                    if pending:
+                        pending[0][2].result()  # Wait for the oldest file
+                    continue
+                try:
+                    item = incoming.get(timeout=poll_interval if pending else None)
+                except queue.Empty:
+                    continue
+                if item is _END:
+                    finished = True
+                elif isinstance(item, BaseException):
+                    raise item
+                else:
+                    signature = file_signature(item)
+                    if self.checkpoint.is_processed(item, signature):
+                        yield Result(item, skipped=True)
+                    else:
+                        future = _submit(executor, parse_file, item, self.validate)
+                        pending.append((item, signature, future))
+        finally:
+            for _, _, future in pending:
+                future.cancel()
+            if executor is not None:
+                executor.shutdown()
+
+    def _apply(
+        self, source: str, signature: Optional[Signature], future: Future
+    ) -> Result:
+        parsed: ParsedFile = future.result()
+        result = Result(
+            source,
+            num_rows=parsed.num_rows,
+            num_bytes=signature[0] if signature else 0,
+            seconds=parsed.seconds,
+            error=parsed.error,
+        )
+        if result.error is None:
+            try:
+                for action, frame in parsed.dataSets:
+                    if not frame.ncols:
+                        continue
+                    written = self.store.apply(
+                        self.dataflow,
+                        action,
+                        frame,
+                        parsed.partition_column or "",
+                        parsed.key_columns,
+                    )
+                    result.outputs.extend(f"{self.dataflow}/{p}" for p in written)
+            except Exception as e:
+                result.error = f"{type(e).__name__}: {e}"
+        self.checkpoint.add(source, signature, result.error)
+        return result
+
+
+def parse_file(source: str, validate: bool = False) -> ParsedFile:
+    """Parse the dataSets of a file, capturing (rather than raising) any error
+
+    The observations of "Delete" dataSets are parsed too, as they give the
+    keys to delete.
+    """
+    parsed = ParsedFile(source)
+    start = time.perf_counter()
+    try:
+        data = fread_json(source, is_url=False, validate=validate).data
+        if data is None:
+            raise ValueError("Message does not contain data.")
+        for i, dataSet in enumerate(data.dataSets):
+            frame = _read_dataSet(data, i)
+            parsed.dataSets.append((dataSet.action, frame))
+            parsed.num_rows += frame.nrows
+            if parsed.partition_column is None and frame.ncols:
+                parsed.partition_column, parsed.key_columns = message_key_columns(
+                    data, frame
+                )
+    except Exception as e:
+        parsed.error = f"{type(e).__name__}: {e}"
+    parsed.seconds = time.perf_counter() - start
+    return parsed
+
+
+def watch_directory(
+    directory: str,
+    poll_interval: float = 1.0,
+    min_age: float = 1.0,
+    once: bool = False,
+    stop: Optional[threading.Event] = None,
+) -> Iterator[str]:
+    """Poll a directory for new or modified SDMX-JSON files
+
+    Files are yielded (oldest first) once they have not been modified for
+    `min_age` seconds, so files which are still being written are left until
+    later. If `once` is True, the directory is only polled once. Otherwise
+    polling continues until `stop` is set.
+    """
+    seen: Dict[str, Optional[Signature]] = {}
+    while True:
+        now = time.time()
+        ready = []
+        for path in expand_inputs([directory]):
+            signature = file_signature(path)
+            if signature is None or seen.get(path) == signature:
+                continue
+            mtime = signature[1] / 1e9
+            if now - mtime >= min_age:
+                ready.append((mtime, path))
+                seen[path] = signature
+        for _, path in sorted(ready):
+            yield path
+        if once or (stop is not None and stop.wait(poll_interval)):
+            return
+        if stop is None:
+            time.sleep(poll_interval)
+
+
+def read_paths(stream: TextIO) -> Iterator[str]:
+    """Paths from a stream (eg stdin), one per line"""
+    for line in stream:
+        if line.strip():
+            yield line.strip()
+
+
+def file_signature(path: str) -> Optional[Signature]:
+    """Size and modification time (in ns) of a file (None if it is missing)"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _parse_args(argv)
+    ingester = Ingester(
+        DataStore(args.store), args.dataflow, args.checkpoint, args.validate
+    )
+    sources: Iterable[str]
+    if args.watch:
+        sources = watch_directory(
+            args.watch, args.poll_interval, args.min_age, once=args.once
+        )
+    elif args.stdin:
+        sources = read_paths(sys.stdin)
+    else:
+        sources = expand_inputs(args.inputs)
+
+    results = []
+    start = time.perf_counter()
+    try:
+        for result in ingester.run(sources, args.jobs):
+            results.append(result)
+            if not args.quiet and not result.skipped:
+                _print_progress(result)
+    except KeyboardInterrupt:
+        pass
+    _print_summary(results, time.perf_counter() - start)
+    return 1 if any(r.error for r in results) else 0
+
+
+# Put on the queue when the sources are exhausted
+_END = object()
+
+
+def _read_in_background(sources: Iterable[str]) -> queue.Queue:
+    """Helper to consume an iterable in a thread, so it can be polled"""
+    items: queue.Queue = queue.Queue()
+
+    def read() -> None:
+        try:
+            for item in sources:
+                items.put(item)
+        except BaseException as e:
+            items.put(e)
+        items.put(_END)
+
+    threading.Thread(target=read, daemon=True).start()
+    return items
+
+
+def _submit(executor: Optional[Executor], fn, *args) -> Future:
+    """Helper to submit to an executor, or run now if there is no executor"""
+    if executor is not None:
+        return executor.submit(fn, *args)
+    future: Future = Future()
+    future.set_result(fn(*args))
+    return future
+
+
+def _read_dataSet(data: SdmxJsonData, dataSet_idx: int) -> dt.Frame:
+    dataSet = data.dataSets[dataSet_idx]
+    if dataSet.action == "Delete":
+        # Parse the observations to delete like any others
+        data.dataSets[dataSet_idx] = dataclasses.replace(dataSet, action="Replace")
+    try:
+        if data.dataSets[dataSet_idx].series:
+            return data.get_series_level(dataSet_idx)
+        return data.get_observations_level(dataSet_idx)
+    finally:
+        data.dataSets[dataSet_idx] = dataSet
+
+
+def _parse_args(argv: Optional[Sequence[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="sdmx-dt-ingest",
+        description="Continuously apply SDMX-JSON data messages to a data store.",
+    )
+    parser.add_argument("inputs", nargs="*", help="Files, directories or globs")
+    parser.add_argument("--store", required=True, help="Root directory of the store")
+    parser.add_argument("--dataflow", required=True, help="Dataflow to update")
+    parser.add_argument("--watch", help="Landing directory to poll for new files")
+    parser.add_argument(
+        "--stdin", action="store_true", help="Read paths from stdin, one per line"
+    )
+    parser.add_argument(
+        "--once", action="store_true", help="Poll the landing directory only once"
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=1.0,
+        help="Seconds between polls of the landing directory",
+    )
+    parser.add_argument(
+        "--min-age",
+        type=float,
+        default=1.0,
+        help="Seconds since a file was modified before it is ingested",
+    )
+    parser.add_argument(
+        "--checkpoint", help=f"Checkpoint log (default: STORE/{CHECKPOINT_NAME})"
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--validate", action="store_true", help="Validate against JSON schema"
+    )
+    parser.add_argument("-q", "--quiet", action="store_true", help="No progress")
+    args = parser.parse_args(argv)
+    if sum([bool(args.watch), args.stdin, bool(args.inputs)]) != 1:
+        parser.error("give exactly one of --watch, --stdin or input paths")
+    return args
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,263 @@
+"""Write datatables of observations back into SDMX-JSON data messages.
+
+The input has the columns of `SdmxJsonData.get_observations()` (ie labels),
+which are encoded into indices of the structure's values with keyed joins.
+The message is then written to file one chunk of rows at a time, so the
+nested "series"/"observations" objects are never built in memory.
+"""
+from __future__ import annotations
+
+import itertools
+import json
+from typing import IO, Dict, List, Optional, Sequence, Tuple, Union
+
+from sdmx_dt._lazy import dt, f
+from sdmx_dt.sdmx_json import (
+    DEFAULT_CHUNK_SIZE,
+    CompiledStructure,
+    ComponentLookup,
+    DataStructureDefinition,
+    SdmxJsonData,
+    compile_structure,
+)
+
+LEVELS = ["series", "observation"]
+
+
+def write_json(
+    frame: dt.Frame,
+    structure: Union[SdmxJsonData, CompiledStructure, DataStructureDefinition, dict],
+    path: str,
+    level: Optional[str] = None,
+    action: str = "Information",
+    meta: Optional[dict] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> None:
+    """Write observations to an SDMX-JSON data message
+
+    `structure` provides the dimension/attribute values which the labels in
+    `frame` are encoded against. With `level="series"` (the default, if the
+    structure has series-level dimensions) observations are grouped into
+    series, otherwise they are written at observation-level, with all
+    dimensions and attributes moved to the observation-level of the written
+    structure.
+    """
+    write_json_dataSets([(action, frame)], structure, path, level, meta, chunk_size)
+
+
+def write_json_dataSets(
+    dataSets: Sequence[Tuple[str, dt.Frame]],
+    structure: Union[SdmxJsonData, CompiledStructure, DataStructureDefinition, dict],
+    path: str,
+    level: Optional[str] = None,
+    meta: Optional[dict] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> None:
+    """Write (action, observations) pairs as the dataSets of a message
+
+    See `write_json()`, which writes a single dataSet.
+    """
+    compiled = compile_structure(structure)
+    structure_obj = compiled.dsd.to_dict()
+    if level is None:
+        level = "series" if compiled.dimensions["series"] else "observation"
+    if level not in LEVELS:
+        raise ValueError(f"`level` must be one of {LEVELS}, not {level!r}.")
+
+    if level == "series":
+        if not compiled.dimensions["series"]:
+            raise ValueError("The structure does not have series-level dimensions.")
+        series_dims = compiled.dimensions["series"]
+        series_attrs = compiled.attributes["series"]
+        obs_dims = compiled.dimensions["observation"]
+        obs_attrs = compiled.attributes["observation"]
+    else:
+        series_dims, series_attrs = [], []
+        obs_dims = compiled.dimensions["series"] + compiled.dimensions["observation"]
+        obs_attrs = compiled.attributes["series"] + compiled.attributes["observation"]
+        structure_obj = _all_at_observation_level(structure_obj)
+
+    encoded_dataSets = []
+    for action, frame in dataSets:
+        encoded = _encode_frame(frame, series_dims, obs_dims, series_attrs, obs_attrs)
+        if level == "series":
+            # Group observations by series, so each series is written in one piece
+            encoded = encoded[:, :, dt.sort(f["__series"])]
+        encoded_dataSets.append((action, encoded))
+
+    with open(path, "w", encoding="utf-8") as out:
+        out.write("{")
+        if meta is not None:
+            out.write(f'"meta": {json.dumps(meta)}, ')
+        out.write(f'"data": {{"structure": {json.dumps(structure_obj)}, ')
+        out.write('"dataSets": [')
+        for i, (action, encoded) in enumerate(encoded_dataSets):
+            if i:
+                out.write(", ")
+            out.write(f'{{"action": {json.dumps(action)}, ')
+            out.write('"series": {' if level == "series" else '"observations": {')
+            _write_observations(
+                out,
+                encoded,
+                [a.name for a in series_attrs] if level == "series" else None,
+                [a.name for a in obs_attrs],
+                chunk_size,
+            )
+            out.write("}}")
+        out.write("]}}")
+
+
+def _write_observations(
+    out: IO[str],
+    encoded: dt.Frame,
+    series_attrs: Optional[List[str]],
+    obs_attrs: List[str],
+    chunk_size: int,
+) -> None:
+    """Helper to write "series" (or observation-level "observations") object
+
+    The JSON text either side of each value (keys, attribute indices, and
+    the start of a new series) is built with datatable expressions, so only
+    the values are formatted in Python. For series, rows must be sorted by
+    series key.
+    """
+    head = '"' + f["__obs"] + '": ['
+    if series_attrs is None:
+        head = ", " + head
+    else:
+        series_head = '"' + f["__series"] + '": {"attributes": ['
+        if series_attrs:
+            series_head = series_head + _attributes_text(series_attrs)
+        series_head = series_head + '], "observations": {'
+        encoded = encoded.copy()
+        encoded["__new"] = encoded[:, f["__series"] != dt.shift(f["__series"])]
+        head = dt.ifelse(f["__new"], "}}, " + series_head + head, ", " + head)
+    tail = ", " + _attributes_text(obs_attrs) + "]" if obs_attrs else None
+
+    # JSON text of floats (and ints) is the same as their repr
+    is_numeric = encoded["Value"].ltypes[0] in (dt.ltype.int, dt.ltype.real)
+    dump = repr if is_numeric else json.dumps
+    for start in range(0, encoded.nrows, chunk_size):
+        chunk = encoded[start : start + chunk_size, :]
+        heads = _to_str_list(chunk[:, head])
+        if start == 0:
+            # Nothing precedes the first observation
+            heads[0] = heads[0][4:] if series_attrs is not None else heads[0][2:]
+        tails = itertools.repeat("]") if tail is None else _to_str_list(chunk[:, tail])
+        values = [
+            "null" if value is None else dump(value)
+            for value in chunk["Value"].to_list()[0]
+        ]
+        out.write("".join(map("".join, zip(heads, values, tails))))
+    if series_attrs is not None and encoded.nrows:
+        out.write("}}")
+
+
+def _to_str_list(frame: dt.Frame) -> List[str]:
+    """Helper to get string column as list, via (multithreaded) CSV writer
+
+    This is much faster than `to_list()` for many short strings, which must
+    not contain newlines.
+    """
+    return frame.to_csv(header=False, quoting="none").split("\n")[:-1]
+
+
+def _attributes_text(names: List[str]):
+    """Helper expression for attribute indices as JSON array items"""
+    items = [
+        dt.ifelse(dt.isna(f[name]), "null", dt.as_type(f[name], dt.str32))
+        for name in names
+    ]
+    text = items[0]
+    for item in items[1:]:
+        text = text + ", " + item
+    return text
+
+
+def _encode_frame(
+    frame: dt.Frame,
+    series_dims: List[ComponentLookup],
+    obs_dims: List[ComponentLookup],
+    series_attrs: List[ComponentLookup],
+    obs_attrs: List[ComponentLookup],
+) -> dt.Frame:
+    """Helper to encode labels into keys and value indices
+
+    The returned datatable has columns: series key, observation key, value,
+    series attribute indices, observation attribute indices.
+    """
+    for dim in series_dims + obs_dims:
+        if dim.name not in frame.names:
+            raise ValueError(f"Observations do not have `{dim.name}` column.")
+    if "Value" not in frame.names:
+        raise ValueError("Observations do not have `Value` column.")
+
+    encoded = _encode_key(frame, series_dims, "__series")
+    encoded.cbind(_encode_key(frame, obs_dims, "__obs"), frame[:, "Value"])
+    for attr in series_attrs + obs_attrs:
+        if attr.name in frame.names:
+            encoded.cbind(_encode_column(frame, attr))
+        else:
+            encoded.cbind(dt.Frame({attr.name: [None] * frame.nrows}, stype=dt.int32))
+    return encoded
+
+
+def _encode_key(frame: dt.Frame, dims: List[ComponentLookup], name: str) -> dt.Frame:
+    """Helper to encode dimension labels into "0:1:2" style keys"""
+    if not dims:
+        return dt.Frame({name: [""] * frame.nrows}, stype=dt.str32)
+    indices = dt.cbind(*[_encode_column(frame, dim) for dim in dims])
+    if any(indices.countna().to_tuples()[0]):
+        raise ValueError("Observations have missing dimension values.")
+    key = dt.as_type(f[0], dt.str32)
+    for i in range(1, len(dims)):
+        key = key + ":" + dt.as_type(f[i], dt.str32)
+    return indices[:, {name: key}]
+
+
+def _encode_column(frame: dt.Frame, component: ComponentLookup) -> dt.Frame:
+    """Helper to translate labels into indices of values, using keyed join
+
+    Labels shared by several values (eg codes with the same name) cannot be
+    translated, so it is an error if observations have them.
+    """
+    name = component.name
+    positions: Dict[str, int] = {}
+    ambiguous = set()
+    for i, label in enumerate(component.labels):
+        if label in positions:
+            ambiguous.add(label)
+        positions.setdefault(label, i)
+    lookup = dt.Frame(
+        {name: list(positions), "__idx": list(positions.values())},
+        stypes={name: dt.str32, "__idx": dt.int32},
+    )
+    lookup.key = name
+
+    labels = frame[:, {name: dt.as_type(f[name], dt.str32)}]
+    joined = labels[:, :, dt.join(lookup)]
+    unknown = joined[~dt.isna(f[name]) & dt.isna(f["__idx"]), name]
+    if unknown.nrows:
+        examples = sorted(set(unknown.to_list()[0]))[:5]
+        raise ValueError(f"Values of `{name}` are not in the structure: {examples}")
+    if ambiguous:
+        used = ambiguous.intersection(labels.to_list()[0])
+        if used:
+            raise ValueError(
+                f"Values of `{name}` are the name of several codes: {sorted(used)}"
+            )
+    return joined[:, {name: f["__idx"]}]
+
+
+def _all_at_observation_level(structure_obj: dict) -> dict:
+    """Helper to move series-level components in "structure" to observation-level"""
+    structure_obj = dict(structure_obj)
+    for kind in ["dimensions", "attributes"]:
+        components = dict(structure_obj.get(kind) or {})
+        components["observation"] = [
+            *components.get("series", []),
+            *components.get("observation", []),
+        ]
+        components["series"] = []
+        structure_obj[kind] = components
+    return structure_obj
@@ -0,0 +1,111 @@
+"""Aggregate observations up the hierarchies of dimension codelists.
+
+Observations are parsed as value indices (`SdmxJsonData.get_codes()`), each
+rolled-up dimension's indices are mapped to the indices of their ancestors
+with a single gather, and the values are aggregated with datatable's native
+grouping. Labels are only looked up for the aggregated rows.
+"""
+from __future__ import annotations
+
+from typing import Dict, List, Optional
+
+from sdmx_dt._lazy import dt, f
+from sdmx_dt.information_model.item_scheme import HierarchyIndex
+from sdmx_dt.sdmx_json import ComponentLookup, SdmxJsonData
+
+# Names of datatable reducers
+AGGREGATIONS = ["sum", "mean", "min", "max", "count"]
+
+
+def rollup(
+    data: SdmxJsonData,
+    levels: Dict[str, int],
+    hierarchies: Optional[Dict[str, HierarchyIndex]] = None,
+    agg: str = "sum",
+    dataSet_idx: int = 0,
+) -> dt.Frame:
+    """Aggregate values to the given hierarchy level of some dimensions
+
+    `levels` gives the level (roots are level 0) to aggregate each dimension
+    to, by dimension id. The hierarchies are taken from `hierarchies` (eg
+    `CodeList.hierarchy`), or otherwise from the "parent" of the dimension's
+    values in the structure. The result has a column for each dimension and
+    the aggregated "Value", but no attributes.
+
+    Observations of codes above the level are dropped. Codes below the level
+    are all aggregated, so if the data has both a code and its descendants
+    (eg a country and its regions) they are counted twice.
+    """
+    if agg not in AGGREGATIONS:
+        raise ValueError(f"`agg` must be one of {AGGREGATIONS}, not {agg!r}.")
+    dims = {
+        c.id: c
+        for c in data.compiled.dimensions["series"]
+        + data.compiled.dimensions["observation"]
+    }
+    unknown = [dim_id for dim_id in levels if dim_id not in dims]
+    if unknown:
+        raise ValueError(f"Dimensions are not in the structure: {unknown}")
+
+    codes = data.get_codes(dataSet_idx)
+    if not codes.ncols:
+        return codes
+    ancestor_labels = {}
+    for dim_id, level in levels.items():
+        dim = dims[dim_id]
+        hierarchy = (hierarchies or {}).get(dim_id) or structure_hierarchy(data, dim_id)
+        ancestors = hierarchy.ancestors_at_level(_ids(dim), level)
+        targets = list(dict.fromkeys(a for a in ancestors if a is not None))
+        positions = {target: i for i, target in enumerate(targets)}
+        mapping = dt.Frame(
+            {dim.name: [positions[a] if a else None for a in ancestors]}, stype=dt.int32
+        )
+        dim_codes = codes[:, dim.name]
+        dim_codes[dim.name] = dt.int32
+        codes[dim.name] = mapping[dim_codes, :]
+        ancestor_labels[dim.name] = _labels(dim, targets)
+
+    for dim_id in levels:
+        codes = codes[~dt.isna(f[dims[dim_id].name]), :]
+    group_names = [c.name for c in dims.values()]
+    reducer = getattr(dt, agg)
+    aggregated = codes[:, {"Value": reducer(f["Value"])}, dt.by(*group_names)]
+
+    # Rolled-up dimensions are indices of ancestors, not of the structure's values
+    other_names = [name for name in group_names if name not in ancestor_labels]
+    decoded = data.compiled.decode(aggregated[:, other_names])
+    for name, labels in ancestor_labels.items():
+        lookup = dt.Frame({name: labels}, stype=dt.str32)
+        decoded[name] = lookup[aggregated[:, name], :]
+    decoded["Value"] = aggregated["Value"]
+    return decoded[:, group_names + ["Value"]]
+
+
+def structure_hierarchy(data: SdmxJsonData, dimension_id: str) -> HierarchyIndex:
+    """Hierarchy of a dimension's values, from their "parent" in the structure
+
+    The values of a message's structure are only the codes used in that
+    message, so parents may not be values. They are added to the hierarchy
+    as roots, since their own parents are unknown.
+    """
+    for level in ["series", "observation"]:
+        for component in data.structure.dimensions.get(level, []):
+            if component["id"] == dimension_id:
+                values = component.get("values", [])
+                ids = [value["id"] for value in values]
+                parents = [value.get("parent") for value in values]
+                missing = [p for p in dict.fromkeys(parents) if p and p not in ids]
+                return HierarchyIndex(ids + missing, parents + [None] * len(missing))
+    raise ValueError(f"Dimension `{dimension_id}` is not in the structure.")
+
+
+def _ids(dim: ComponentLookup) -> List[str]:
+    return [
+        id_ if id_ is not None else label for id_, label in zip(dim.ids, dim.labels)
+    ]
+
+
+def _labels(dim: ComponentLookup, ids: List[str]) -> List[str]:
+    """Labels of codes (or the id, for ancestors which are not in the structure)"""
+    labels = dict(zip(_ids(dim), dim.labels))
+    return [labels.get(id_, id_) for id_ in ids]
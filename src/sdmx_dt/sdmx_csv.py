@@ -0,0 +1,91 @@
+"""Read SDMX-CSV data into the same datatables as `SdmxJsonData`.
+
+SDMX-CSV has one column per dimension/attribute (holding codes), plus
+DATAFLOW and OBS_VALUE columns. The payload is parsed with datatable's
+multithreaded `fread`, and codes are translated into labels with keyed joins
+against the lookup tables compiled from an SDMX-JSON "structure".
+"""
+from __future__ import annotations
+
+from typing import Union
+
+from sdmx_dt._lazy import dt, f
+from sdmx_dt.sdmx_json import (
+    CompiledStructure,
+    ComponentLookup,
+    SdmxJsonData,
+    compile_structure,
+)
+
+VALUE_COLUMN = "OBS_VALUE"
+TIME_DIMENSION = "TIME_PERIOD"
+
+
+def fread_sdmx_csv(
+    source, structure: Union[SdmxJsonData, CompiledStructure, dict], **kwargs
+) -> dt.Frame:
+    """Read SDMX-CSV file into datatable with `get_observations()` columns
+
+    `source` is anything accepted by `dt.fread()` (eg a file path or URL).
+    `structure` provides the dimension/attribute labels, either as parsed
+    SDMX-JSON data, a compiled structure, or a raw "structure" object. Extra
+    keyword arguments are passed to `dt.fread()`.
+    """
+    compiled = compile_structure(structure)
+    frame = dt.fread(source, columns=str, na_strings=[""], **kwargs)
+    return decode_sdmx_csv(frame, compiled)
+
+
+def decode_sdmx_csv(frame: dt.Frame, compiled: CompiledStructure) -> dt.Frame:
+    """Translate SDMX-CSV codes (as a datatable of strings) into labels"""
+    output_names = []
+    for name, component in compiled.observation_columns():
+        if component is None:
+            if VALUE_COLUMN not in frame.names:
+                raise ValueError(f"SDMX-CSV does not have `{VALUE_COLUMN}` column.")
+            frame[:, name] = _as_numeric(frame[VALUE_COLUMN])
+        elif component.id in frame.names:
+            frame = _add_labels(frame, component)
+        else:
+            frame[:, name] = dt.Frame([None] * frame.nrows, stype=dt.str32)
+        output_names.append(name)
+
+    return frame[:, output_names]
+
+
+def _add_labels(frame: dt.Frame, component: ComponentLookup) -> dt.Frame:
+    """Add column with the labels for a component's codes, using keyed join"""
+    code_col = f"__code_{component.id}"
+    frame.names = {component.id: code_col}
+
+    # Values without ids (eg free-text attributes) are given as they are
+    if not any(i is not None for i in component.ids):
+        frame[:, component.name] = frame[:, f[code_col]]
+        return frame
+
+    ids, labels = zip(
+        *[(i, label) for i, label in zip(component.ids, component.labels) if i]
+    )
+    lookup = dt.Frame(
+        {code_col: list(ids), component.name: list(labels)},
+        stypes={code_col: dt.str32, component.name: dt.str32},
+    )
+    lookup = lookup[0, :, dt.by(code_col)]  # ids must be unique to key
+    lookup.key = code_col
+    frame = frame[:, :, dt.join(lookup)]
+
+    if component.id == TIME_DIMENSION:
+        # The time periods in the structure might not cover all of the data
+        label = f[component.name]
+        frame[:, component.name] = frame[
+            :, dt.ifelse(dt.isna(label), f[code_col], label)
+        ]
+    return frame
+
+
+def _as_numeric(column: dt.Frame) -> dt.Frame:
+    """Convert column to float64, unless it has non-numeric values"""
+    numeric = column[:, dt.as_type(f[0], dt.float64)]
+    if numeric.countna1() == column.countna1():
+        return numeric
+    return column
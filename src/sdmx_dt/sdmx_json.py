@@ -1,40 +1,161 @@
+from __future__ import annotations
+
+import contextlib
+import copy
+import io
 import itertools
 import json
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Union
-
-import jsonschema
-import requests
-from datatable import dt, f
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from sdmx_dt._lazy import dt, f, jsonschema, requests
+from sdmx_dt.compression import decompressing_reader
+from sdmx_dt.time_periods import add_period_columns
+
+if TYPE_CHECKING:
+    from sdmx_dt.budget import ChunkedFrame, MemoryBudget
+
+# Default number of rows per chunk when parsing observations incrementally
+DEFAULT_CHUNK_SIZE = 100_000
+DEFAULT_SCHEMA_URL = (
+    "https://github.com/sdmx-twg/sdmx-json/raw/master/metadata-message/"
+    "tools/schemas/2.0.0/sdmx-json-metadata-schema.json"
+)
 
 
 class InvalidSdmxJsonException(ValueError):
     pass
 
 
-def fread_json(path, is_url=True):
-    if is_url:
+def fread_json(
+    path,
+    is_url=True,
+    validate=True,
+    budget: Optional[MemoryBudget] = None,
+    context: Optional[ParserContext] = None,
+):
+    """Read SDMX-JSON data message from URL or file path
+
+    If a `budget` is given, input larger than its `max_input_bytes` is not
+    read, and the budget is used when getting observations from the message.
+    `context` provides the caches, HTTP session and JSON decoder (see
+    `ParserContext`).
+    """
+    return SdmxJsonDataMessage(
+        load_json(path, is_url, budget, context),
+        validate=validate,
+        budget=budget,
+        context=context,
+    )
+
+
+def load_json(
+    path,
+    is_url=True,
+    budget: Optional[MemoryBudget] = None,
+    context: Optional[ParserContext] = None,
+):
+    """Read and decode JSON from URL or file path
+
+    Compressed input (gzip, zstd, zip, bz2 or xz) is detected from its magic
+    bytes and decompressed as it is read, without temporary files.
+    """
+    context = context or DEFAULT_CONTEXT
+    with open_source(path, is_url, budget, context) as stream:
         try:
-            r = requests.get(path)
-        except requests.exceptions.MissingSchema:
-            raise ValueError(
-                "Invalid URL: No scheme supplied. If you are using a file path set `is_url` to False."
-            )
-        if r.status_code == 404:
-            raise InvalidSdmxJsonException("That URL `path` is not a real place.")
-        try:
-            raw = json.loads(r.content)
-        except json.decoder.JSONDecodeError:
-            raise InvalidSdmxJsonException("Response contents is not JSON.")
+            return context.loads(stream.read())
+        except ValueError:
+            source = "Response contents" if is_url else "File contents"
+            raise InvalidSdmxJsonException(f"{source} is not JSON.")
+
+
+@contextlib.contextmanager
+def open_source(
+    path,
+    is_url=True,
+    budget: Optional[MemoryBudget] = None,
+    context: Optional[ParserContext] = None,
+) -> Iterator[io.BufferedIOBase]:
+    """Open URL or file path as binary stream, decompressing if necessary
+
+    If a `budget` is given, the (compressed) size of the input is checked
+    against it before anything is read.
+    """
+    if is_url:
+        r = _get_url(path, (context or DEFAULT_CONTEXT).session, stream=True)
+        if budget is not None:
+            length = r.headers.get("Content-Length")
+            budget.check_input_size(int(length) if length else None)
+        # Undo any HTTP Content-Encoding, as well as file compression
+        r.raw.decode_content = True
+        # Otherwise, urllib3 closes the stream at the end of the body, which
+        # breaks the buffered reader if the whole body fits in its buffer
+        r.raw.auto_close = False
+        raw_stream = r.raw
     else:
-        with open(path) as f:
-            raw = json.load(f)
-    return SdmxJsonDataMessage(raw)
+        if budget is not None:
+            budget.check_input_size(os.path.getsize(path))
+        raw_stream = open(path, "rb")
+
+    with raw_stream, decompressing_reader(raw_stream) as stream:
+        yield stream
+
+
+def read_bytes(path, is_url=True, context: Optional[ParserContext] = None) -> bytes:
+    """Read raw (possibly compressed) contents from URL or file path"""
+    if is_url:
+        return _get_url(path, (context or DEFAULT_CONTEXT).session).content
+
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _get_url(path, session=None, **kwargs):
+    try:
+        r = (session or requests).get(path, **kwargs)
+    except requests.exceptions.MissingSchema:
+        raise ValueError(
+            "Invalid URL: No scheme supplied. If you are using a file path set `is_url` to False."
+        )
+    if r.status_code == 404:
+        raise InvalidSdmxJsonException("That URL `path` is not a real place.")
+    return r
 
 
 class SdmxJsonDataMessage:
-    def __init__(self, message_obj) -> None:
-        self.validate_with_schema(message_obj)
+    def __init__(
+        self,
+        message_obj,
+        validate: Union[bool, str] = True,
+        budget: Optional[MemoryBudget] = None,
+        context: Optional[ParserContext] = None,
+    ) -> None:
+        """Parse SDMX-JSON data message
+
+        If `validate` is True, the message is validated against the JSON
+        schema. If it is "consistency", only the dataSets' keys and indices
+        are checked against the structure (see `check_consistency()`), which
+        is much cheaper. `budget` is the default for `get_observations()`.
+        `context` provides the schema and structure caches.
+        """
+        context = context or DEFAULT_CONTEXT
+        if validate and validate != "consistency":
+            self.validate_with_schema(message_obj, context)
 
         if "meta" in message_obj.keys():
             self.meta: Optional[SdmxJsonMeta] = SdmxJsonMeta(message_obj["meta"])
@@ -42,13 +163,22 @@ class SdmxJsonDataMessage:
             self.meta = None
 
         if "data" in message_obj.keys():
-            self.data: Optional[SdmxJsonData] = SdmxJsonData(message_obj["data"])
+            self.data: Optional[SdmxJsonData] = SdmxJsonData(
+                message_obj["data"],
+                structure_cache=context.structure_cache,
+                budget=budget,
+            )
         else:
             self.data = None
 
         self.errors = [SdmxJsonError(err) for err in message_obj.get("errors", [])]
 
-    def validate_with_schema(self, message_obj: dict) -> None:
+        if validate == "consistency" and self.data is not None:
+            self.data.validate_consistency()
+
+    def validate_with_schema(
+        self, message_obj: dict, context: Optional[ParserContext] = None
+    ) -> None:
         """Validate using JSON schema.
 
         If "schema" (URL) is provided under "meta" top-level object then that will be
@@ -58,13 +188,11 @@ class SdmxJsonDataMessage:
             schema_loc = message_obj["meta"]["schema"]
         else:
             # TODO: does this detect if both data & errors being present?
-            schema_loc = (
-                "https://github.com/sdmx-twg/sdmx-json/raw/master/metadata-message/"
-                "tools/schemas/2.0.0/sdmx-json-metadata-schema.json"
-            )
-        r = requests.get(schema_loc)
-        schema = json.loads(r.content)
-        jsonschema.validate(message_obj, schema, cls=jsonschema.Draft202012Validator)
+            schema_loc = DEFAULT_SCHEMA_URL
+        validator = (context or DEFAULT_CONTEXT).get_validator(schema_loc)
+        error = jsonschema.exceptions.best_match(validator.iter_errors(message_obj))
+        if error is not None:
+            raise error
 
     def __eq__(self, other) -> bool:
         return (
@@ -73,11 +201,19 @@ class SdmxJsonDataMessage:
             and self.errors == other.errors
         )
 
-    def get_observations(self):
+    def get_observations(
+        self,
+        all_attributes: bool = False,
+        parse_time_periods: bool = False,
+        shape: str = "long",
+        budget: Optional[MemoryBudget] = None,
+    ):
         if self.data is None:
             return None
 
-        return self.data.get_observations()
+        return self.data.get_observations(
+            all_attributes, parse_time_periods, shape, budget
+        )
 
 
 class SdmxJsonMeta:
@@ -101,12 +237,27 @@ class DataStructureDefinition:
         self.attributes = attributes
         self.annotations = annotations
         self.custom = kwargs
+        # get_dimensions()/get_attributes() results, by arguments
+        self._components_cache: Dict[Tuple[str, bool, Optional[str]], dt.Frame] = {}
 
     def __eq__(self, other):
         if other.__class__ is self.__class__:
-            return self.__dict__ == other.__dict__
+            return _without_cache(self.__dict__) == _without_cache(other.__dict__)
         return NotImplemented
 
+    def to_dict(self) -> dict:
+        """Get the "structure" object that this was created from"""
+        components = {
+            "links": self.links,
+            "dimensions": self.dimensions,
+            "attributes": self.attributes,
+            "annotations": self.annotations,
+        }
+        return {
+            **{name: val for name, val in components.items() if val is not None},
+            **self.custom,
+        }
+
     def get_dimensions(
         self, include_values: bool = False, locale: Optional[str] = None
     ) -> dt.Frame:
@@ -115,7 +266,7 @@ class DataStructureDefinition:
         If `include_values` is True and series or observation level dimensions
         have multiple values, then each of these will be on a different row.
         """
-        return self._parse_components(self.dimensions, True, include_values, locale)
+        return self._parse_components("dimensions", include_values, locale)
 
     def get_attributes(
         self, include_values: bool = False, locale: Optional[str] = None
@@ -125,61 +276,434 @@ class DataStructureDefinition:
         If `include_values` is True and series or observation level dimensions
         have multiple values, then each of these will be on a different row.
         """
-        return self._parse_components(self.attributes, False, include_values, locale)
+        return self._parse_components("attributes", include_values, locale)
 
     def _parse_components(
-        self,
-        components: dict,
-        include_keyPosition: bool,
-        include_values: bool,
-        locale: Optional[str],
-    ):
-        levels = ["dataSet", "series", "observation"]
-        nested_rows = [
-            self._get_components_rows(
-                dimension, include_keyPosition, level, include_values, locale
+        self, kind: str, include_values: bool, locale: Optional[str]
+    ) -> dt.Frame:
+        """Helper to get datatable of "dimensions" or "attributes" at all levels
+
+        The columns are built one list at a time, with each component's base
+        columns repeated for its values. Dimensions are ordered by
+        keyPosition. The result is cached for each set of arguments.
+        """
+        cache_key = (kind, include_values, locale)
+        if cache_key not in self._components_cache:
+            self._components_cache[cache_key] = self._build_components(
+                kind, include_values, locale
             )
-            for level in levels
-            for dimension in components[level]
+        return self._components_cache[cache_key].copy()
+
+    def _build_components(
+        self, kind: str, include_values: bool, locale: Optional[str]
+    ) -> dt.Frame:
+        include_keyPosition = kind == "dimensions"
+        components = [
+            (level, component)
+            for level in ["dataSet", "series", "observation"]
+            for component in getattr(self, kind)[level]
         ]
-        rows = list(itertools.chain.from_iterable(nested_rows))
-        tidy_component = dt.Frame(rows)
         if include_keyPosition:
-            tidy_component = tidy_component[:, :, dt.sort(f.keyPosition)]
-        return tidy_component
+            # Stable, so components with equal keyPositions keep their order
+            components.sort(key=lambda item: item[1]["keyPosition"])
 
-    def _get_components_rows(
-        self,
-        component: dict,
-        include_keyPosition: bool,
-        level: str,
-        include_values: bool,
-        locale: Optional[str],
-    ) -> List[dict]:
-        """Helper method to parse information from given component"""
-        base_cols = {
-            "id": component["id"],
-            "name": component["names"].get(locale) if locale else component["name"],
-            "level": level,
-        }
+        columns: Dict[str, list] = {"id": [], "name": [], "level": []}
         if include_keyPosition:
             # If present, keyPosition is first column
-            base_cols = {"keyPosition": component["keyPosition"], **base_cols}
+            columns = {"keyPosition": [], **columns}
+        if include_values:
+            columns.update(value_id=[], value_name=[])
+        for level, component in components:
+            values: List[dict] = component.get("values", [])
+            num_rows = len(values) if include_values else 1
+            if include_keyPosition:
+                columns["keyPosition"].extend([component["keyPosition"]] * num_rows)
+            columns["id"].extend([component["id"]] * num_rows)
+            name = component["names"].get(locale) if locale else component["name"]
+            columns["name"].extend([name] * num_rows)
+            columns["level"].extend([level] * num_rows)
+            if include_values:
+                # TODO: should value_id be able to be None?
+                columns["value_id"].extend(v.get("id") for v in values)
+                columns["value_name"].extend(
+                    v["names"].get(locale) if locale else v["name"] for v in values
+                )
 
-        if not include_values:
-            return [base_cols]
+        if not columns["id"]:
+            return dt.Frame()
+        return dt.Frame(columns)
+
+
+def _without_cache(attributes: dict) -> dict:
+    return {
+        name: val for name, val in attributes.items() if name != "_components_cache"
+    }
+
+
+@dataclass
+class ComponentLookup:
+    """Lookup table for a single dimension/attribute in a "structure" object"""
 
-        # TODO: should value_id be able to be None?
-        value_ids = [v.get("id") for v in component["values"]]
-        value_names = [
-            v["names"].get(locale) if locale else v["name"] for v in component["values"]
+    id: str
+    name: str
+    labels: List[str]
+    default_label: Optional[str] = None
+    # Value ids, which can be None (eg for free-text attributes)
+    ids: List[Optional[str]] = field(default_factory=list)
+
+
+@dataclass
+class CompiledStructure:
+    """Lookup tables compiled once from a "structure" object
+
+    These are shared between all messages with an identical "structure", so
+    only the dataSet payload needs to be processed for each message.
+    """
+
+    key: Tuple[Optional[str], tuple]
+    dsd: DataStructureDefinition
+    dimensions: Dict[str, List[ComponentLookup]] = field(default_factory=dict)
+    attributes: Dict[str, List[ComponentLookup]] = field(default_factory=dict)
+
+    @classmethod
+    def from_structure(cls, structure_obj: dict, key=None) -> "CompiledStructure":
+        dsd = DataStructureDefinition(**structure_obj)
+        compiled = cls(key or structure_key(structure_obj), dsd)
+        for level in ["dataSet", "series", "observation"]:
+            compiled.dimensions[level] = [
+                cls._compile_component(c) for c in (dsd.dimensions or {}).get(level, [])
+            ]
+            compiled.attributes[level] = [
+                cls._compile_component(c) for c in (dsd.attributes or {}).get(level, [])
+            ]
+        compiled.attributes["dimensionGroup"] = [
+            cls._compile_component(c)
+            for c in (dsd.attributes or {}).get("dimensionGroup", [])
         ]
-        # Get a row for each dimension value
-        rows = [
-            {**base_cols, "value_id": val_id, "value_name": val_name}
-            for val_id, val_name in zip(value_ids, value_names)
+        return compiled
+
+    @staticmethod
+    def _compile_component(component: dict) -> ComponentLookup:
+        values = component.get("values", [])
+        default_label = None
+        if "default" in component:
+            default_label = next(
+                (v["name"] for v in values if v.get("id") == component["default"]),
+                None,
+            )
+        return ComponentLookup(
+            id=component["id"],
+            name=component["name"],
+            labels=[v["name"] for v in values],
+            default_label=default_label,
+            ids=[v.get("id") for v in values],
+        )
+
+    def observation_columns(self) -> List[Tuple[str, Optional[ComponentLookup]]]:
+        """Column names of `get_observations()` output and their components
+
+        The component is None for the "Value" column. Columns are ordered as:
+        series dimensions, observation dimensions, "Value", series attributes,
+        observation attributes.
+        """
+        columns: List[Tuple[str, Optional[ComponentLookup]]] = [
+            (c.name, c)
+            for c in self.dimensions["series"] + self.dimensions["observation"]
         ]
-        return rows
+        columns.append(("Value", None))
+        columns.extend(
+            (c.name, c)
+            for c in self.attributes["series"] + self.attributes["observation"]
+        )
+        return columns
+
+    def coded(
+        self,
+        codes: Optional[Dict[str, List[int]]] = None,
+        names: Optional[Dict[str, str]] = None,
+    ) -> "CompiledStructure":
+        """Copy whose lookups give value indices rather than labels
+
+        `codes` gives the index for each value of a component (by default,
+        its position in the component's values) and `names` gives the
+        column names (by default, the component names), by component id.
+        """
+
+        def coded_lookup(component: ComponentLookup) -> ComponentLookup:
+            indices = (codes or {}).get(component.id, range(len(component.labels)))
+            indices = list(indices)
+            default = None
+            if component.default_label is not None:
+                default = indices[component.labels.index(component.default_label)]
+            return ComponentLookup(
+                id=component.id,
+                name=(names or {}).get(component.id, component.name),
+                labels=indices,  # type: ignore[arg-type]
+                default_label=default,  # type: ignore[arg-type]
+                ids=component.ids,
+            )
+
+        return CompiledStructure(
+            key=self.key,
+            dsd=self.dsd,
+            dimensions={
+                level: [coded_lookup(c) for c in components]
+                for level, components in self.dimensions.items()
+            },
+            attributes={
+                level: [coded_lookup(c) for c in components]
+                for level, components in self.attributes.items()
+            },
+        )
+
+    def decode(self, frame: dt.Frame) -> dt.Frame:
+        """Replace value indices (see `coded()`) with labels, in place
+
+        Each component's labels are gathered by index in a single native
+        operation, for the columns of `frame` named after a component.
+        """
+        for components in [*self.dimensions.values(), *self.attributes.values()]:
+            for component in components:
+                if component.name not in frame.names:
+                    continue
+                labels = dt.Frame({component.name: component.labels}, stype=dt.str32)
+                codes = frame[:, component.name]
+                codes[component.name] = dt.int32
+                frame[component.name] = labels[codes, :]
+        return frame
+
+    def __eq__(self, other):
+        if other.__class__ is self.__class__:
+            return self.key == other.key and self.dsd == other.dsd
+        return NotImplemented
+
+
+def structure_key(structure_obj: dict) -> Tuple[Optional[str], tuple]:
+    """Cheap key for a "structure" object: (DSD URN, shape of components)
+
+    The shape is the id and number of values of each component, so it does
+    not depend on the size of the "values" arrays. Structures with the same
+    key can still differ (eg in which codes are used), so `StructureCache`
+    also compares the structures themselves.
+    """
+    dsd_urn = next(
+        (
+            link.get("urn")
+            for link in structure_obj.get("links") or []
+            if link.get("rel") == "datastructure"
+        ),
+        None,
+    )
+    shape = tuple(
+        (kind, level, component.get("id"), len(component.get("values", [])))
+        for kind in ["dimensions", "attributes"]
+        for level, components in (structure_obj.get(kind) or {}).items()
+        for component in components
+    )
+    return dsd_urn, shape
+
+
+_STRUCTURE_CACHES: "weakref.WeakSet[StructureCache]" = weakref.WeakSet()
+
+
+class StructureCache:
+    """Thread-safe LRU cache of compiled structures, shared across messages
+
+    Entries are found by `structure_key()`, then compared with the structure
+    (a native comparison of dicts and lists, which is cheaper than hashing or
+    compiling the structure).
+    """
+
+    def __init__(self, maxsize: int = 32) -> None:
+        self.maxsize = maxsize
+        # Compiled structures (and the structure compiled), by key
+        self._entries: "OrderedDict[tuple, List[Tuple[dict, CompiledStructure]]]"
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks: Dict[tuple, threading.Lock] = {}
+        _STRUCTURE_CACHES.add(self)
+
+    def get(self, structure_obj: dict) -> CompiledStructure:
+        """Get compiled structure, compiling (and caching) it if necessary
+
+        A copy of the structure is compiled and cached, so later changes to
+        `structure_obj` do not change the cached entry.
+        """
+        key = structure_key(structure_obj)
+        if self.maxsize <= 0:
+            return CompiledStructure.from_structure(
+                copy.deepcopy(structure_obj), key=key
+            )
+        with self._lock:
+            compiled = self._find(key, structure_obj)
+            if compiled is not None:
+                return compiled
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        # Each key has its own lock, held while compiling, so concurrent
+        # misses compile once without blocking lookups of other structures
+        with key_lock:
+            with self._lock:
+                compiled = self._find(key, structure_obj)
+                if compiled is not None:
+                    return compiled
+            snapshot = copy.deepcopy(structure_obj)
+            compiled = CompiledStructure.from_structure(snapshot, key=key)
+            with self._lock:
+                self._entries.setdefault(key, []).append((snapshot, compiled))
+                self._entries.move_to_end(key)
+                self._key_locks.pop(key, None)
+                while self._len() > self.maxsize:
+                    oldest_key = next(iter(self._entries))
+                    candidates = self._entries[oldest_key]
+                    candidates.pop(0)
+                    if not candidates:
+                        del self._entries[oldest_key]
+        return compiled
+
+    def invalidate(self, dsd_urn: Optional[str] = None) -> None:
+        """Drop cached structures for the given DSD URN, or all if not given"""
+        with self._lock:
+            if dsd_urn is None:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if k[0] == dsd_urn]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._len()
+
+    def __contains__(self, structure_obj: dict) -> bool:
+        key = structure_key(structure_obj)
+        with self._lock:
+            return self._find(key, structure_obj, touch=False) is not None
+
+    def _find(
+        self, key: tuple, structure_obj: dict, touch: bool = True
+    ) -> Optional[CompiledStructure]:
+        """Helper to find a cached structure (the lock must be held)"""
+        candidates = self._entries.get(key, [])
+        for i, (cached_obj, compiled) in enumerate(candidates):
+            if cached_obj == structure_obj:
+                if touch:
+                    candidates.append(candidates.pop(i))
+                    self._entries.move_to_end(key)
+                return compiled
+        return None
+
+    def _len(self) -> int:
+        return sum(len(candidates) for candidates in self._entries.values())
+
+    def _reset_after_fork(self) -> None:
+        # Locks may have been held by other threads of the parent
+        self._lock = threading.Lock()
+        self._key_locks = {}
+
+
+# Process-wide cache used by SdmxJsonData unless another cache is given
+STRUCTURE_CACHE = StructureCache()
+
+
+class ParserContext:
+    """Everything reused between messages, safe to share across threads
+
+    This holds a cache of JSON schema validators (by URL), a cache of
+    compiled structures, the HTTP session and the JSON decoder (`loads`,
+    which takes bytes, eg `orjson.loads`). Each thread gets its own HTTP
+    session, and a forked child process gets new sessions and locks, so a
+    context made before forking workers can be used by all of them. The
+    sessions are closed by `close()`, or when used as a context manager.
+    """
+
+    def __init__(
+        self,
+        structure_cache: Optional[StructureCache] = None,
+        loads: Callable[[bytes], Any] = json.loads,
+    ) -> None:
+        self.structure_cache = (
+            structure_cache if structure_cache is not None else StructureCache()
+        )
+        self.loads = loads
+        self._validators: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._url_locks: Dict[str, threading.Lock] = {}
+        self._local = threading.local()
+        self._sessions: List[Any] = []
+        _CONTEXTS.add(self)
+
+    @property
+    def session(self):
+        """HTTP session for the current thread"""
+        if not hasattr(self._local, "session"):
+            self._local.session = requests.Session()
+            with self._lock:
+                self._sessions.append(self._local.session)
+        return self._local.session
+
+    def get_validator(self, schema_url: str):
+        """JSON schema validator, fetching (and caching) the schema if necessary"""
+        validator = self._validators.get(schema_url)
+        if validator is not None:
+            return validator
+        # Each URL has its own lock, held while fetching, so concurrent first
+        # requests fetch only once without blocking requests for other URLs
+        with self._lock:
+            url_lock = self._url_locks.setdefault(schema_url, threading.Lock())
+        with url_lock:
+            if schema_url not in self._validators:
+                schema = json.loads(_get_url(schema_url, self.session).content)
+                self._validators[schema_url] = jsonschema.Draft202012Validator(schema)
+            return self._validators[schema_url]
+
+    def close(self) -> None:
+        """Close the HTTP sessions of all threads"""
+        with self._lock:
+            sessions = self._sessions
+            self._sessions = []
+            self._local = threading.local()
+        for session in sessions:
+            session.close()
+
+    def __enter__(self) -> "ParserContext":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _after_fork(self) -> None:
+        # Locks may have been held, and connections are shared with the parent
+        self._lock = threading.Lock()
+        self._url_locks = {}
+        self._local = threading.local()
+        self._sessions = []
+
+
+def _reset_after_fork() -> None:
+    for cache in _STRUCTURE_CACHES:
+        cache._reset_after_fork()
+    for context in _CONTEXTS:
+        context._after_fork()
+
+
+_CONTEXTS: "weakref.WeakSet[ParserContext]" = weakref.WeakSet()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+# Used when no context is given
+DEFAULT_CONTEXT = ParserContext(structure_cache=STRUCTURE_CACHE)
+
+
+def compile_structure(
+    structure: Union[SdmxJsonData, CompiledStructure, DataStructureDefinition, dict]
+) -> CompiledStructure:
+    """Get compiled structure from parsed data, or a raw "structure" object"""
+    if isinstance(structure, SdmxJsonData):
+        return structure.compiled
+    if isinstance(structure, CompiledStructure):
+        return structure
+    if isinstance(structure, DataStructureDefinition):
+        return STRUCTURE_CACHE.get(structure.to_dict())
+    return STRUCTURE_CACHE.get(structure)
 
 
 @dataclass
@@ -196,6 +720,8 @@ class DataSet:
     attributes: Optional[List[int]] = None
     series: Optional[Dict] = None
     observations: Optional[Dict] = None
+    # Group attributes (SDMX-JSON 2.0), by partial key eg "0::1"
+    dimensionGroupAttributes: Optional[Dict[str, List[Optional[int]]]] = None
 
     def __post_init__(self):
         # TODO: need to add fields to Link dataclass
@@ -205,10 +731,57 @@ class DataSet:
         assert (self.series is None) != (self.observations is None)
 
 
+@dataclass
+class RunLengthFrame:
+    """Datatable with some columns stored as runs of repeated rows
+
+    `runs` has one row per run (eg the series-level dimensions & attributes of
+    each series), which is repeated `run_lengths[i]` times. `rows` has the
+    remaining columns, with one row per expanded row. `names` gives the
+    column order after expanding.
+    """
+
+    runs: dt.Frame
+    run_lengths: List[int]
+    rows: dt.Frame
+    names: List[str]
+
+    @property
+    def nrows(self) -> int:
+        return sum(self.run_lengths)
+
+    def run_index(self) -> dt.Frame:
+        """Index into `runs` for each expanded row"""
+        return dt.Frame(
+            list(
+                itertools.chain.from_iterable(
+                    itertools.repeat(i, n) for i, n in enumerate(self.run_lengths)
+                )
+            ),
+            stype=dt.int32,
+        )
+
+    def expand(self) -> dt.Frame:
+        """Repeat the runs (natively) and combine with the other columns"""
+        if self.runs.ncols == 0:
+            return self.rows[:, self.names]
+        expanded = self.runs[self.run_index(), :]
+        expanded.cbind(self.rows)
+        return expanded[:, self.names]
+
+
 class SdmxJsonData:
-    def __init__(self, data_obj) -> None:
+    def __init__(
+        self,
+        data_obj,
+        structure_cache: Optional[StructureCache] = None,
+        budget: Optional[MemoryBudget] = None,
+    ) -> None:
         # TODO: Is "structure" truly optional?
-        self.structure = DataStructureDefinition(**data_obj["structure"])
+        self.budget = budget
+        cache = STRUCTURE_CACHE if structure_cache is None else structure_cache
+        self.compiled = cache.get(data_obj["structure"])
+        self.structure = self.compiled.dsd
 
         if "dataSets" in data_obj.keys():
             self.dataSets = [DataSet(**d) for d in data_obj["dataSets"]]
@@ -220,35 +793,84 @@ class SdmxJsonData:
             return self.__dict__ == other.__dict__
         return NotImplemented
 
-    def get_observations(self) -> Union[List[dt.Frame], dt.Frame]:
+    def get_observations(
+        self,
+        all_attributes: bool = False,
+        parse_time_periods: bool = False,
+        shape: str = "long",
+        budget: Optional[MemoryBudget] = None,
+    ) -> Union[dt.Frame, ChunkedFrame, List[Union[dt.Frame, ChunkedFrame]]]:
         """Parse dataset(s) from message into datatable(s)
 
         These datatables will contain dimensions, observations values,
         and attributes, but NOT annotations. Empty datatables will be
         returned for datasets with "Delete" action.
 
+        If `all_attributes` is True, dataSet-level and group attributes are
+        also included (after the other columns), repeated for every
+        observation they apply to.
+
+        If `parse_time_periods` is True, "Period start" and "Period end"
+        (date) and "Period frequency" columns are added for the TIME_PERIOD
+        dimension.
+
+        If `shape` is "wide", there is a column of values for each time
+        period instead of a row for each observation (see `get_wide()`).
+
+        If a `budget` is given (or was given when the data was read), large
+        dataSets are parsed in chunks, which may be spilled to disk, and
+        returned as a `ChunkedFrame` (see `MemoryBudget.read_dataSet()`).
+
         Returns single datatable if the message only contains one "dataSet".
         Returns list of datatables if the message contains multiple dataSets.
         """
         # TODO: add support for localised name and values-name
+        if shape not in ("long", "wide"):
+            raise ValueError(f'`shape` must be "long" or "wide", not {shape!r}.')
+        if shape == "wide":
+            if parse_time_periods:
+                raise ValueError("Time periods cannot be parsed for wide shape.")
+            frames = [
+                self.get_wide(dataSet_idx=i, all_attributes=all_attributes)
+                for i in range(len(self.dataSets))
+            ]
+            return frames if len(frames) > 1 else frames[0]
+
+        budget = budget if budget is not None else self.budget
+        if budget is not None:
+            budgeted = [
+                budget.read_dataSet(self, i, all_attributes, parse_time_periods)
+                for i in range(len(self.dataSets))
+            ]
+            return budgeted if len(budgeted) > 1 else budgeted[0]
+
         if len(self.dataSets) > 1:
-            return self.get_dataSets_level()
+            frames = self.get_dataSets_level(all_attributes=all_attributes)
+            if parse_time_periods:
+                return [self._add_period_columns(frame) for frame in frames]
+            return frames
         elif self.dataSets[0].series:
-            return self.get_series_level()
+            frame = self.get_series_level(all_attributes=all_attributes)
         elif self.dataSets[0].observations:
-            return self.get_observations_level()
+            frame = self.get_observations_level(all_attributes=all_attributes)
+        else:
+            return dt.Frame()
 
-        return dt.Frame()
+        return self._add_period_columns(frame) if parse_time_periods else frame
 
-    def get_dataSets_level(self) -> List[dt.Frame]:
+    def get_dataSets_level(self, all_attributes: bool = False) -> List[dt.Frame]:
         return [
-            self.get_series_level(dataSet_idx=i)
+            self.get_series_level(dataSet_idx=i, all_attributes=all_attributes)
             if self.dataSets[i].series
-            else self.get_observations_level(dataSet_idx=i)
+            else self.get_observations_level(
+                dataSet_idx=i, all_attributes=all_attributes
+            )
             for i in range(len(self.dataSets))
         ]
 
-    def get_series_level(self, dataSet_idx: int = 0) -> dt.Frame:
+    def get_series_level(
+        self, dataSet_idx: int = 0, all_attributes: bool = False
+    ) -> dt.Frame:
         """Get observations datatable from series-level"""
         dataSet = self.dataSets[dataSet_idx]
         if dataSet.action == "Delete":
@@ -258,106 +880,475 @@ class SdmxJsonData:
         if vals is None:
             return dt.Frame()
 
-        series_tables = []
-        for series_dims_joined, series_info in vals.items():
-            num_datapoints = len(series_info["observations"].keys())
-
-            # series-level dimensions
-            series_dims = series_dims_joined.split(":")
-            series_dim_ref = self.structure.dimensions["series"]
+        return self._parse_series(vals.items(), dataSet if all_attributes else None)
 
-            series_dim_cols = {
-                series_dim_ref[dim_num]["name"]: num_datapoints
-                * [series_dim_ref[dim_num]["values"][int(val)]["name"]]
-                for dim_num, val in enumerate(series_dims)
-            }
+    def get_observations_level(
+        self, dataSet_idx: int = 0, all_attributes: bool = False
+    ) -> dt.Frame:
+        """Get observations datatable from observation-level"""
+        dataSet = self.dataSets[dataSet_idx]
+        if dataSet.action == "Delete":
+            return dt.Frame()
 
-            # observation-level dimensions
-            obs_dim_cols = self._parse_observations_dimensions(
-                series_info["observations"].keys()
-            )
+        vals = dataSet.observations
+        if vals is None:
+            return dt.Frame()
 
-            # values
-            values = [v[0] for v in series_info["observations"].values()]
+        return self._parse_observations(
+            vals.items(), dataSet if all_attributes else None
+        )
 
-            # series-level attributes
-            if series_info.get("attributes"):
-                series_attr_cols = self._parse_attributes(
-                    series_info["attributes"],
-                    self.structure.attributes["series"],
-                    num_repeats=num_datapoints,
-                )
-            else:
-                series_attr_cols = {}
+    def get_codes(
+        self,
+        dataSet_idx: int = 0,
+        codes: Optional[Dict[str, List[int]]] = None,
+        names: Optional[Dict[str, str]] = None,
+    ) -> dt.Frame:
+        """Get observations datatable of value indices, rather than labels
 
-            # observation-level attributes
-            obs_attr_cols = self._parse_attributes(
-                [v[1:] for v in series_info["observations"].values()],
-                self.structure.attributes["observation"],
+        Dimension and attribute columns are integers, which are much cheaper
+        to group or join on (see `CompiledStructure.coded()` for `codes` and
+        `names`, and `CompiledStructure.decode()` to get the labels).
+        """
+        coded = copy.copy(self)
+        coded.compiled = self.compiled.coded(codes, names)
+        if self.dataSets[dataSet_idx].series:
+            return coded.get_series_level(dataSet_idx)
+        return coded.get_observations_level(dataSet_idx)
+
+    def get_wide(self, dataSet_idx: int = 0, all_attributes: bool = False) -> dt.Frame:
+        """Get datatable with a column of values for each time period
+
+        For series-level dataSets, there is a row for each series (with its
+        dimensions and attributes) and a column for each observation-level
+        key. For observation-level dataSets, the TIME_PERIOD dimension (or
+        the last dimension) is used for the columns and the other dimensions
+        for the rows. Values are placed straight into the output columns, so
+        the long datatable is never built. Observation-level attributes are
+        not included, and group attributes are only included for series.
+        """
+        dataSet = self.dataSets[dataSet_idx]
+        if dataSet.action == "Delete":
+            return dt.Frame()
+        if dataSet.series:
+            return self._parse_series_wide(
+                list(dataSet.series.items()), dataSet if all_attributes else None
             )
-
-            series_tables.append(
-                {
-                    **series_dim_cols,
-                    **obs_dim_cols,
-                    "Value": values,
-                    **series_attr_cols,
-                    **obs_attr_cols,
-                }
+        if dataSet.observations:
+            return self._parse_observations_wide(
+                dataSet.observations.items(), dataSet if all_attributes else None
             )
+        return dt.Frame()
 
-        col_names = series_tables[0].keys()
-        full_table = {
-            col_name: list(
-                itertools.chain.from_iterable(s[col_name] for s in series_tables)
-            )
-            for col_name in col_names
-        }
-        return dt.Frame(full_table)
+    def num_observations(self, dataSet_idx: int = 0) -> int:
+        """Number of observations (ie rows) in a dataSet, without parsing it"""
+        dataSet = self.dataSets[dataSet_idx]
+        if dataSet.action == "Delete":
+            return 0
+        if dataSet.series:
+            return sum(len(s["observations"]) for s in dataSet.series.values())
+        return len(dataSet.observations or {})
 
-    def get_observations_level(self, dataSet_idx: int = 0) -> dt.Frame:
-        """Get observations datatable from observation-level"""
+    def iter_observations(
+        self,
+        dataSet_idx: int = 0,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        all_attributes: bool = False,
+    ) -> Iterator[dt.Frame]:
+        """Parse a dataSet into datatables of roughly `chunk_size` rows
+
+        The chunks have the same columns as `get_observations()`, so only one
+        chunk needs to be held in memory at a time. Series are never split
+        between chunks, so a chunk can be longer than `chunk_size` if it
+        contains a very long series. Nothing is yielded for datasets with
+        "Delete" action.
+        """
         dataSet = self.dataSets[dataSet_idx]
         if dataSet.action == "Delete":
-            return dt.Frame()
+            return
+
+        broadcast = dataSet if all_attributes else None
+        if dataSet.series:
+            batch: List[Tuple[str, dict]] = []
+            num_rows = 0
+            for series_item in dataSet.series.items():
+                batch.append(series_item)
+                num_rows += len(series_item[1]["observations"])
+                if num_rows >= chunk_size:
+                    yield self._parse_series(batch, broadcast)
+                    batch, num_rows = [], 0
+            if batch:
+                yield self._parse_series(batch, broadcast)
+        elif dataSet.observations:
+            obs_items = iter(dataSet.observations.items())
+            while True:
+                obs_batch = list(itertools.islice(obs_items, chunk_size))
+                if not obs_batch:
+                    break
+                yield self._parse_observations(obs_batch, broadcast)
+
+    def get_annotations(self, locale: Optional[str] = None) -> dt.Frame:
+        """Get datatable of the annotations attached to dataSets and series
+
+        There is a row for each annotation of each dataSet (with "series" as
+        NA) and each series (identified by its key, eg "0:1"). Only the
+        series' "annotations" are read, not their observations.
+        """
+        annotations = self.structure.annotations or []
+        dataSet_col: List[int] = []
+        series_col: List[Optional[str]] = []
+        annotation_idxs: List[int] = []
+        for i, dataSet in enumerate(self.dataSets):
+            for idx in dataSet.annotations or []:
+                dataSet_col.append(i)
+                series_col.append(None)
+                annotation_idxs.append(idx)
+            for series_key, series_info in (dataSet.series or {}).items():
+                for idx in series_info.get("annotations") or []:
+                    dataSet_col.append(i)
+                    series_col.append(series_key)
+                    annotation_idxs.append(idx)
+
+        rows = [annotations[idx] for idx in annotation_idxs]
+        return dt.Frame(
+            {
+                "dataSet": dataSet_col,
+                "series": series_col,
+                "id": [a.get("id") for a in rows],
+                "title": [a.get("title") for a in rows],
+                "type": [a.get("type") for a in rows],
+                "text": [
+                    a.get("texts", {}).get(locale) if locale else a.get("text")
+                    for a in rows
+                ],
+            },
+            stypes={
+                "dataSet": dt.int32,
+                "series": dt.str32,
+                "id": dt.str32,
+                "title": dt.str32,
+                "type": dt.str32,
+                "text": dt.str32,
+            },
+        )
 
-        vals = dataSet.observations
-        if vals is None:
-            return dt.Frame()
+    def get_links(self) -> dt.Frame:
+        """Get datatable of the links of the structure and dataSets
+
+        "dataSet" is NA for the links of the structure.
+        """
+        owners: List[Tuple[Optional[int], list]] = [(None, self.structure.links or [])]
+        owners.extend((i, d.links or []) for i, d in enumerate(self.dataSets))
+        rows = [(owner, link) for owner, links in owners for link in links]
+        columns = ["rel", "href", "urn", "title", "type"]
+        return dt.Frame(
+            {
+                "dataSet": [owner for owner, _ in rows],
+                **{col: [link.get(col) for _, link in rows] for col in columns},
+            },
+            stypes={"dataSet": dt.int32, **{col: dt.str32 for col in columns}},
+        )
+
+    def _parse_series(
+        self,
+        series_items: Iterable[Tuple[str, dict]],
+        broadcast: Optional[DataSet] = None,
+    ) -> dt.Frame:
+        """Helper to translate series (and their observations) into datatable"""
+        return self._parse_series_runs(series_items, broadcast).expand()
+
+    def _parse_series_runs(
+        self,
+        series_items: Iterable[Tuple[str, dict]],
+        broadcast: Optional[DataSet] = None,
+    ) -> "RunLengthFrame":
+        """Helper to translate series into run-length encoded datatable
+
+        Series-level dimensions and attributes are parsed once per series,
+        and only expanded to one row per observation (natively) at the end.
+        If `broadcast` is given, the dataSet-level and group attributes of
+        that dataSet are added to the series-level columns.
+        """
+        series_dim_ref = self.compiled.dimensions["series"]
+        series_keys = []
+        series_attrs = []
+        run_lengths = []
+        obs_keys: List[str] = []
+        obs_vals: List[list] = []
+        for series_dims_joined, series_info in series_items:
+            series_keys.append(series_dims_joined.split(":"))
+            series_attrs.append(series_info.get("attributes") or [])
+            run_lengths.append(len(series_info["observations"]))
+            obs_keys.extend(series_info["observations"].keys())
+            obs_vals.extend(series_info["observations"].values())
+
+        # series-level dimensions & attributes: one row per series
+        num_series_dims = len(series_keys[0]) if series_keys else 0
+        series_cols = {
+            series_dim_ref[dim_num].name: [
+                series_dim_ref[dim_num].labels[int(key[dim_num])] for key in series_keys
+            ]
+            for dim_num in range(num_series_dims)
+        }
+        series_attr_cols = self._parse_attributes(
+            series_attrs, self.compiled.attributes["series"]
+        )
+        broadcast_cols = {}
+        if broadcast is not None:
+            broadcast_cols = {
+                name: vals * len(series_keys)
+                for name, vals in self._parse_dataSet_attributes(broadcast).items()
+            }
+            broadcast_cols.update(self._parse_group_attributes(broadcast, series_keys))
+
+        # observation-level dimensions, values & attributes: one row per obs
+        obs_dim_cols = self._parse_observations_dimensions(obs_keys)
+        values = [v[0] for v in obs_vals]
+        obs_attr_cols = self._parse_attributes(
+            obs_vals, self.compiled.attributes["observation"], offset=1
+        )
+
+        return RunLengthFrame(
+            runs=dt.Frame({**series_cols, **series_attr_cols, **broadcast_cols}),
+            run_lengths=run_lengths,
+            rows=dt.Frame({**obs_dim_cols, "Value": values, **obs_attr_cols}),
+            names=[*series_cols, *obs_dim_cols, "Value", *series_attr_cols]
+            + [*obs_attr_cols, *broadcast_cols],
+        )
+
+    def _parse_observations(
+        self,
+        obs_items: Iterable[Tuple[str, list]],
+        broadcast: Optional[DataSet] = None,
+    ) -> dt.Frame:
+        """Helper to translate observation-level observations into datatable
 
-        obs_dim_cols = self._parse_observations_dimensions(vals.keys())
-        values = [v[0] for v in vals.values()]
+        If `broadcast` is given, the dataSet-level and group attributes of
+        that dataSet are added as columns.
+        """
+        obs_keys, obs_vals = zip(*obs_items)
+        obs_dim_cols = self._parse_observations_dimensions(obs_keys)
+        values = [v[0] for v in obs_vals]
         obs_attr_cols = self._parse_attributes(
-            [v[1:] for v in vals.values()], self.structure.attributes["observation"]
+            obs_vals, self.compiled.attributes["observation"], offset=1
         )
 
         observations = {**obs_dim_cols, "Value": values, **obs_attr_cols}
-        return dt.Frame(observations)
+        if broadcast is None:
+            return dt.Frame(observations)
 
-    def _parse_observations_dimensions(self, obs_dim_keys):
+        # dataSet-level attributes are a single run of all the observations
+        group_cols = self._parse_group_attributes(
+            broadcast, [key.split(":") for key in obs_keys]
+        )
+        dataSet_attr_cols = self._parse_dataSet_attributes(broadcast)
+        return RunLengthFrame(
+            runs=dt.Frame(dataSet_attr_cols),
+            run_lengths=[len(obs_keys)],
+            rows=dt.Frame({**observations, **group_cols}),
+            names=[*observations, *dataSet_attr_cols, *group_cols],
+        ).expand()
+
+    def _parse_observations_dimensions(
+        self, obs_dim_keys: Iterable[str]
+    ) -> Dict[str, list]:
         """Helper to translate observation-level dimensions into columns"""
-        dim_structure = self.structure.dimensions["observation"]
+        dim_structure = self.compiled.dimensions["observation"]
+
+        # The same keys recur in every series, so only parse each key once
+        parsed_keys: Dict[str, tuple] = {}
+        obs_dim_vals = []
+        for key in obs_dim_keys:
+            vals = parsed_keys.get(key)
+            if vals is None:
+                vals = parsed_keys[key] = tuple(
+                    dim_structure[dim_num].labels[int(val)]
+                    for dim_num, val in enumerate(key.split(":"))
+                )
+            obs_dim_vals.append(vals)
 
-        obs_dim_vals = [o.split(":") for o in obs_dim_keys]
-        num_dims = len(obs_dim_vals[0])
+        num_dims = len(obs_dim_vals[0]) if obs_dim_vals else len(dim_structure)
         obs_dim_columns = {
-            dim_structure[dim_num]["name"]: [
-                dim_structure[dim_num]["values"][int(vals[dim_num])]["name"]
-                for vals in obs_dim_vals
-            ]
+            dim_structure[dim_num].name: [vals[dim_num] for vals in obs_dim_vals]
             for dim_num in range(num_dims)
         }
         return obs_dim_columns
 
-    def _parse_attributes(self, attr_vals, attr_structure, num_repeats=1):
+    def _parse_series_wide(
+        self, series_items: List[Tuple[str, dict]], broadcast: Optional[DataSet]
+    ) -> dt.Frame:
+        """Helper to translate series into a row per series"""
+        series_dim_ref = self.compiled.dimensions["series"]
+        series_keys = []
+        series_attrs = []
+        # Value columns, by observation-level key
+        value_cols: Dict[str, list] = {}
+        for row, (series_dims_joined, series_info) in enumerate(series_items):
+            series_keys.append(series_dims_joined.split(":"))
+            series_attrs.append(series_info.get("attributes") or [])
+            for obs_key, obs_val in series_info["observations"].items():
+                col = value_cols.get(obs_key)
+                if col is None:
+                    col = value_cols[obs_key] = [None] * len(series_items)
+                col[row] = obs_val[0]
+
+        series_cols = {
+            dim.name: [dim.labels[int(key[dim_num])] for key in series_keys]
+            for dim_num, dim in enumerate(series_dim_ref[: len(series_keys[0])])
+        }
+        series_attr_cols = self._parse_attributes(
+            series_attrs, self.compiled.attributes["series"]
+        )
+        if broadcast is not None:
+            series_attr_cols.update(
+                {
+                    name: vals * len(series_keys)
+                    for name, vals in self._parse_dataSet_attributes(broadcast).items()
+                }
+            )
+            series_attr_cols.update(
+                self._parse_group_attributes(broadcast, series_keys)
+            )
+        columns = {**series_cols, **series_attr_cols}
+        columns.update(
+            self._name_value_columns(
+                value_cols, self.compiled.dimensions["observation"], columns
+            )
+        )
+        return dt.Frame(columns)
+
+    def _parse_observations_wide(
+        self, obs_items: Iterable[Tuple[str, list]], broadcast: Optional[DataSet]
+    ) -> dt.Frame:
+        """Helper to translate observation-level observations into wide shape"""
+        dim_structure = self.compiled.dimensions["observation"]
+        time_dims = [i for i, d in enumerate(dim_structure) if d.id == "TIME_PERIOD"]
+        pivot = time_dims[0] if time_dims else len(dim_structure) - 1
+
+        # Positions of each row & column are found before filling the columns
+        row_positions: Dict[Tuple[str, ...], int] = {}
+        col_keys: Dict[str, List[Tuple[int, Any]]] = {}
+        for obs_key, obs_val in obs_items:
+            key = obs_key.split(":")
+            row_key = tuple(key[:pivot] + key[pivot + 1 :])
+            row = row_positions.setdefault(row_key, len(row_positions))
+            col_keys.setdefault(key[pivot], []).append((row, obs_val[0]))
+
+        value_cols: Dict[str, list] = {}
+        for col_key, row_vals in col_keys.items():
+            col = value_cols[col_key] = [None] * len(row_positions)
+            for row, val in row_vals:
+                col[row] = val
+
+        row_dims = dim_structure[:pivot] + dim_structure[pivot + 1 :]
+        row_cols = {
+            dim.name: [dim.labels[int(key[dim_num])] for key in row_positions]
+            for dim_num, dim in enumerate(row_dims)
+        }
+        if broadcast is not None:
+            row_cols.update(
+                {
+                    name: vals * len(row_positions)
+                    for name, vals in self._parse_dataSet_attributes(broadcast).items()
+                }
+            )
+        row_cols.update(
+            self._name_value_columns(value_cols, [dim_structure[pivot]], row_cols)
+        )
+        return dt.Frame(row_cols)
+
+    @staticmethod
+    def _name_value_columns(
+        value_cols: Dict[str, list],
+        dims: List[ComponentLookup],
+        other_names: Iterable[str],
+    ) -> Dict[str, list]:
+        """Helper to order value columns by key, and name them with labels
+
+        It is an error if a name is also the name of another column (eg a
+        time period labelled like a dimension), as one would overwrite the
+        other.
+        """
+        ordered = sorted(value_cols, key=lambda k: [int(i) for i in k.split(":")])
+        named = {
+            ", ".join(
+                dims[dim_num].labels[int(i)] for dim_num, i in enumerate(key.split(":"))
+            ): value_cols[key]
+            for key in ordered
+        }
+        clashes = sorted(set(named).intersection(other_names))
+        if clashes:
+            raise ValueError(
+                f"Value columns would have the same name as other columns: {clashes}"
+            )
+        return named
+
+    def _add_period_columns(self, frame: dt.Frame) -> dt.Frame:
+        """Helper to add start/end dates and frequency of the TIME_PERIOD"""
+        time_dims = [
+            c
+            for level in ["series", "observation"]
+            for c in self.compiled.dimensions[level]
+            if c.id == "TIME_PERIOD" and c.name in frame.names
+        ]
+        if not time_dims:
+            return frame
+        dim = time_dims[0]
+        return add_period_columns(frame, dim.name, labels=dim.labels, ids=dim.ids)
+
+    def _parse_dataSet_attributes(self, dataSet: DataSet) -> Dict[str, list]:
+        """Helper to translate dataSet-level attributes into single-row columns"""
+        return self._parse_attributes(
+            [dataSet.attributes or []], self.compiled.attributes["dataSet"]
+        )
+
+    def _parse_group_attributes(
+        self, dataSet: DataSet, keys: List[List[str]]
+    ) -> Dict[str, list]:
+        """Helper to translate group attributes into columns, for each key
+
+        A key is in a group if it has the same value at every position given
+        by the group's partial key, eg "0::1" contains "0:2:1". Keys are the
+        series keys for series-level dataSets, so only groups of series-level
+        dimensions are matched there.
+        """
+        group_structure = self.compiled.attributes["dimensionGroup"]
+        if not group_structure:
+            return {}
+        groups = [
+            (
+                [(i, val) for i, val in enumerate(group_key.split(":")) if val],
+                attr_indices,
+            )
+            for group_key, attr_indices in (
+                dataSet.dimensionGroupAttributes or {}
+            ).items()
+        ]
+        key_attrs = []
+        for key in keys:
+            attrs: List[Optional[int]] = [None] * len(group_structure)
+            for positions, attr_indices in groups:
+                if all(i < len(key) and key[i] == val for i, val in positions):
+                    # The first group which gives an attribute takes precedence
+                    attrs = [
+                        idx if idx is not None else group_idx
+                        for idx, group_idx in zip(
+                            attrs, itertools.chain(attr_indices, itertools.repeat(None))
+                        )
+                    ]
+            key_attrs.append(attrs)
+        return self._parse_attributes(key_attrs, group_structure)
+
+    def _parse_attributes(self, attr_vals, attr_structure, offset=0):
         """Helper to translate attributes into columns
 
         This can be used for observation-level or series-level attributes.
+        The attribute indices start at position `offset` of each element of
+        `attr_vals` (ie 1 for observations, which start with the value).
         """
         attr_columns = {
-            structure_i["name"]: num_repeats
-            * [
-                self._parse_single_attribute(obs_val_j, i, structure_i)
+            structure_i.name: [
+                self._parse_single_attribute(obs_val_j, i + offset, structure_i)
                 for obs_val_j in attr_vals
             ]
             for i, structure_i in enumerate(attr_structure)
@@ -367,19 +1358,61 @@ class SdmxJsonData:
     def _parse_single_attribute(self, attr_indices, attr_num, attr_structure_i):
         if attr_num > len(attr_indices) - 1:
             # Take default "name", when attribute index not specified
-            default_id = attr_structure_i["default"]
-            default_info = next(
-                val for val in attr_structure_i["values"] if val["id"] == default_id
-            )
-            return default_info["name"]
+            return attr_structure_i.default_label
 
         attr_idx = attr_indices[attr_num]
         if attr_idx is None:
             return None  # TODO: check this is correct
 
-        attr_name = attr_structure_i["values"][attr_idx]["name"]
+        attr_name = attr_structure_i.labels[attr_idx]
         return attr_name
 
+    def check_consistency(self) -> dt.Frame:
+        """Get datatable of keys/indices in the dataSets which are not in the
+        structure, with a row for each problem
+        """
+        from sdmx_dt.consistency import check_consistency
+
+        return check_consistency(self)
+
+    def validate_consistency(self, max_problems: int = 10) -> None:
+        """Raise exception describing any problems from `check_consistency()`"""
+        problems = self.check_consistency()
+        if problems.nrows == 0:
+            return
+        lines = [
+            f"dataSet {row['dataSet']}, {row['level']} "
+            + ":".join(k for k in [row["series"], row["key"]] if k is not None)
+            + f": {row['problem']}"
+            for row in [
+                dict(zip(problems.names, values))
+                for values in problems[:max_problems, :].to_tuples()
+            ]
+        ]
+        if problems.nrows > max_problems:
+            lines.append(f"... and {problems.nrows - max_problems} more")
+        raise InvalidSdmxJsonException(
+            f"{problems.nrows} inconsistencies with structure:\n" + "\n".join(lines)
+        )
+
+    def to_arrow(self, dataSet_idx: int = 0):
+        """Get observations of a dataSet as a dictionary-encoded `pyarrow.Table`"""
+        from sdmx_dt import writers
+
+        return writers.to_arrow(self, dataSet_idx=dataSet_idx)
+
+    def to_polars(self, dataSet_idx: int = 0):
+        """Get observations of a dataSet as a `polars.DataFrame`, via Arrow"""
+        from sdmx_dt import writers
+
+        return writers.to_polars(self, dataSet_idx=dataSet_idx)
+
+    def to_pandas(self, dataSet_idx: int = 0):
+        """Get observations of a dataSet as a `pandas.DataFrame`, via Arrow"""
+        from sdmx_dt import writers
+
+        return writers.to_pandas(self, dataSet_idx=dataSet_idx)
+
     def get_dimensions(
         self, include_values: bool = False, locale: Optional[str] = None
     ) -> dt.Frame:
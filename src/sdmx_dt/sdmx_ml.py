@@ -0,0 +1,136 @@
+"""Streaming reader for SDMX-ML 2.1 data messages.
+
+Both StructureSpecific and Generic data messages are read with `iterparse`,
+clearing each element once it has been read, so memory use is bounded by the
+chunk size rather than the size of the file. Codes are collected per chunk
+and translated into labels with the same lookups as SDMX-CSV, so the chunks
+have the columns of `SdmxJsonData.get_observations()`.
+"""
+from __future__ import annotations
+
+from typing import Dict, Iterator, List, Optional, Union
+from xml.etree import ElementTree
+
+from sdmx_dt._lazy import dt
+from sdmx_dt.sdmx_csv import VALUE_COLUMN, decode_sdmx_csv
+from sdmx_dt.sdmx_json import (
+    DEFAULT_CHUNK_SIZE,
+    CompiledStructure,
+    SdmxJsonData,
+    compile_structure,
+    open_source,
+)
+
+
+def fread_sdmx_ml(
+    path,
+    structure: Union[SdmxJsonData, CompiledStructure, dict],
+    is_url: bool = False,
+) -> dt.Frame:
+    """Read SDMX-ML data message into datatable with `get_observations()` columns
+
+    `structure` provides the dimension/attribute labels, as for
+    `fread_sdmx_csv()`. The observations of all dataSets in the message are
+    combined.
+    """
+    frame = dt.Frame()
+    frame.rbind(*iter_sdmx_ml(path, structure, is_url, chunk_size=DEFAULT_CHUNK_SIZE))
+    return frame
+
+
+def iter_sdmx_ml(
+    path,
+    structure: Union[SdmxJsonData, CompiledStructure, dict],
+    is_url: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[dt.Frame]:
+    """Parse SDMX-ML data message into datatables of up to `chunk_size` rows"""
+    compiled = compile_structure(structure)
+    reader = _ObsReader(compiled)
+    rows: List[Dict[str, Optional[str]]] = []
+    with open_source(path, is_url) as stream:
+        for row in reader.iter_rows(stream):
+            rows.append(row)
+            if len(rows) >= chunk_size:
+                yield reader.to_frame(rows)
+                rows = []
+        if rows:
+            yield reader.to_frame(rows)
+
+
+class _ObsReader:
+    """Turns SDMX-ML elements into rows of {component id: code}"""
+
+    def __init__(self, compiled: CompiledStructure) -> None:
+        self.compiled = compiled
+        self.ids = [c.id for _, c in compiled.observation_columns() if c]
+        self.ids.append(VALUE_COLUMN)
+        obs_dims = compiled.dimensions["observation"]
+        # Generic messages don't give the id of the observation dimension
+        self.obs_dim_id = obs_dims[0].id if obs_dims else "TIME_PERIOD"
+
+    def iter_rows(self, stream) -> Iterator[Dict[str, Optional[str]]]:
+        series: Dict[str, Optional[str]] = {}
+        stack: List[ElementTree.Element] = []
+        for event, elem in ElementTree.iterparse(stream, events=("start", "end")):
+            name = _local_name(elem.tag)
+            if event == "start":
+                stack.append(elem)
+                if name == "Series":
+                    # StructureSpecific: series codes are XML attributes
+                    series = dict(elem.attrib)
+                continue
+
+            stack.pop()
+            parent = stack[-1] if stack else None
+            if name == "Obs":
+                yield {**series, **self._parse_obs(elem)}
+            elif name == "SeriesKey" or (
+                name == "Attributes"
+                and parent is not None
+                and _local_name(parent.tag) == "Series"
+            ):
+                # Generic: series codes are child elements
+                series.update(_parse_values(elem))
+                continue
+            elif name == "Series":
+                series = {}
+            else:
+                continue
+
+            # Free memory of elements which have been read
+            elem.clear()
+            if parent is not None:
+                parent.remove(elem)
+
+    def _parse_obs(self, elem: ElementTree.Element) -> Dict[str, Optional[str]]:
+        obs: Dict[str, Optional[str]] = dict(elem.attrib)
+        for child in elem:
+            name = _local_name(child.tag)
+            if name == "ObsDimension":
+                obs[child.get("id", self.obs_dim_id)] = child.get("value")
+            elif name == "ObsValue":
+                obs[VALUE_COLUMN] = child.get("value")
+            elif name in ("ObsKey", "Attributes"):
+                obs.update(_parse_values(child))
+        return obs
+
+    def to_frame(self, rows: List[Dict[str, Optional[str]]]) -> dt.Frame:
+        codes = dt.Frame(
+            {id_: [row.get(id_) for row in rows] for id_ in self.ids},
+            stypes={id_: dt.str32 for id_ in self.ids},
+        )
+        return decode_sdmx_csv(codes, self.compiled)
+
+
+def _parse_values(elem: ElementTree.Element) -> Dict[str, Optional[str]]:
+    """Codes from Generic <Value id="..." value="..."/> elements"""
+    return {
+        child.get("id", ""): child.get("value")
+        for child in elem
+        if _local_name(child.tag) == "Value"
+    }
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
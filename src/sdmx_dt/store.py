@@ -0,0 +1,259 @@
+"""On-disk store of converted datasets, as memory-mapped .jay partitions.
+
+Each dataflow is a directory containing one .jay file per time partition (the
+year of the time period, by default) and a small JSON manifest:
+
+    <root>/<dataflow>/manifest.json
+    <root>/<dataflow>/<partition>.jay
+
+Reading a partition with `dt.fread()` memory-maps the .jay file, so opening
+historic data is zero-copy, and updates only rewrite the partitions which
+contain incoming observations.
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sdmx_dt._lazy import dt, f
+from sdmx_dt.sdmx_json import SdmxJsonData
+
+MANIFEST_NAME = "manifest.json"
+NULL_PARTITION = "unknown"
+
+
+class DataStore:
+    def __init__(self, root: str) -> None:
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+
+    def dataflows(self) -> List[str]:
+        return sorted(
+            name
+            for name in os.listdir(self.root)
+            if os.path.exists(os.path.join(self.root, name, MANIFEST_NAME))
+        )
+
+    def get_manifest(self, dataflow: str) -> dict:
+        try:
+            with open(self._manifest_path(dataflow)) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            raise KeyError(f"Dataflow `{dataflow}` is not in the store.") from None
+
+    def partitions(self, dataflow: str) -> List[str]:
+        return sorted(self.get_manifest(dataflow)["partitions"].keys())
+
+    def read(
+        self, dataflow: str, partitions: Optional[Iterable[str]] = None
+    ) -> dt.Frame:
+        """Open (some of) the partitions of a dataflow as a single datatable
+
+        When a single partition is requested, the returned Frame is backed
+        directly by the memory-mapped file.
+        """
+        frames = list(self.read_partitions(dataflow, partitions).values())
+        if len(frames) == 1:
+            return frames[0]
+        combined = dt.Frame()
+        combined.rbind(*frames)
+        return combined
+
+    def read_partitions(
+        self, dataflow: str, partitions: Optional[Iterable[str]] = None
+    ) -> Dict[str, dt.Frame]:
+        """Open partitions of a dataflow, each as a memory-mapped datatable"""
+        manifest = self.get_manifest(dataflow)
+        names = sorted(manifest["partitions"]) if partitions is None else partitions
+        return {
+            name: dt.fread(
+                file=os.path.join(
+                    self._dir(dataflow), manifest["partitions"][name]["file"]
+                )
+            )
+            for name in names
+        }
+
+    def write(
+        self,
+        dataflow: str,
+        frame: dt.Frame,
+        partition_column: str,
+        key_columns: Sequence[str],
+        period_length: int = 4,
+    ) -> List[str]:
+        """Replace a dataflow with the given observations
+
+        Rows are partitioned by the first `period_length` characters of
+        `partition_column` (the year, for SDMX time periods). The key columns
+        identify an observation when updating it later.
+        """
+        manifest = {
+            "dataflow": dataflow,
+            "partition_column": partition_column,
+            "period_length": period_length,
+            "key_columns": list(key_columns),
+            "partitions": {},
+        }
+        os.makedirs(self._dir(dataflow), exist_ok=True)
+        for name in os.listdir(self._dir(dataflow)):
+            if name.endswith(".jay"):
+                os.remove(os.path.join(self._dir(dataflow), name))
+
+        written = self._write_partitions(dataflow, manifest, frame, replace=True)
+        self._write_manifest(dataflow, manifest)
+        return written
+
+    def update(self, dataflow: str, frame: dt.Frame) -> List[str]:
+        """Insert or replace observations, rewriting only affected partitions
+
+        Existing rows with the same key as an incoming row are replaced.
+        Returns the names of the partitions which were rewritten.
+        """
+        manifest = self.get_manifest(dataflow)
+        written = self._write_partitions(dataflow, manifest, frame, replace=False)
+        self._write_manifest(dataflow, manifest)
+        return written
+
+    def delete(self, dataflow: str, frame: dt.Frame) -> List[str]:
+        """Delete observations with the same key as rows of `frame`"""
+        manifest = self.get_manifest(dataflow)
+        rewritten = []
+        for name, incoming in self._split(manifest, frame).items():
+            if name not in manifest["partitions"]:
+                continue
+            existing = self.read_partitions(dataflow, [name])[name]
+            kept = _anti_join(existing, incoming, manifest["key_columns"])
+            if kept.nrows == existing.nrows:
+                continue
+            self._write_partition(dataflow, manifest, name, kept)
+            rewritten.append(name)
+        self._write_manifest(dataflow, manifest)
+        return rewritten
+
+    def write_message(
+        self,
+        dataflow: str,
+        data: SdmxJsonData,
+        dataSet_idx: int = 0,
+        update: bool = False,
+    ) -> List[str]:
+        """Write (or update) a dataflow from a parsed SDMX-JSON dataSet
+
+        The time dimension is used for partitioning and all dimensions are
+        used as the key.
+        """
+        if data.dataSets[dataSet_idx].series:
+            frame = data.get_series_level(dataSet_idx)
+        else:
+            frame = data.get_observations_level(dataSet_idx)
+        if update and os.path.exists(self._manifest_path(dataflow)):
+            return self.update(dataflow, frame)
+        return self.write(dataflow, frame, *message_key_columns(data, frame))
+
+    def apply(
+        self,
+        dataflow: str,
+        action: str,
+        frame: dt.Frame,
+        partition_column: str,
+        key_columns: Sequence[str],
+    ) -> List[str]:
+        """Apply observations with a dataSet action to a dataflow
+
+        "Delete" deletes observations with the same key, and any other action
+        ("Information", "Append" or "Replace") inserts or replaces them. The
+        partition and key columns are only used if the dataflow is new.
+        """
+        exists = os.path.exists(self._manifest_path(dataflow))
+        if action == "Delete":
+            return self.delete(dataflow, frame) if exists else []
+        if exists:
+            return self.update(dataflow, frame)
+        return self.write(dataflow, frame, partition_column, key_columns)
+
+    def _write_partitions(
+        self, dataflow: str, manifest: dict, frame: dt.Frame, replace: bool
+    ) -> List[str]:
+        written = []
+        for name, incoming in self._split(manifest, frame).items():
+            if not replace and name in manifest["partitions"]:
+                existing = self.read_partitions(dataflow, [name])[name]
+                kept = _anti_join(existing, incoming, manifest["key_columns"])
+                kept.rbind(incoming)
+                incoming = kept
+            self._write_partition(dataflow, manifest, name, incoming)
+            written.append(name)
+        return written
+
+    def _write_partition(
+        self, dataflow: str, manifest: dict, name: str, frame: dt.Frame
+    ) -> None:
+        file_name = _safe_file_name(name) + ".jay"
+        path = os.path.join(self._dir(dataflow), file_name)
+        # Write then rename, so readers never see a partially written file
+        tmp_path = path + ".tmp"
+        frame.to_jay(tmp_path)
+        os.replace(tmp_path, path)
+        manifest["partitions"][name] = {
+            "file": file_name,
+            "nrows": frame.nrows,
+            "updated": datetime.now(timezone.utc).isoformat(),
+        }
+
+    def _split(self, manifest: dict, frame: dt.Frame) -> Dict[str, dt.Frame]:
+        """Split rows of `frame` by partition"""
+        column = manifest["partition_column"]
+        period = f[column][: manifest["period_length"]]
+        partition_ids = frame[:, period].to_list()[0]
+        rows: Dict[str, List[int]] = {}
+        for i, partition_id in enumerate(partition_ids):
+            rows.setdefault(partition_id or NULL_PARTITION, []).append(i)
+        return {name: frame[row_idx, :] for name, row_idx in rows.items()}
+
+    def _write_manifest(self, dataflow: str, manifest: dict) -> None:
+        path = self._manifest_path(dataflow)
+        with open(path + ".tmp", "w") as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(path + ".tmp", path)
+
+    def _dir(self, dataflow: str) -> str:
+        return os.path.join(self.root, _safe_file_name(dataflow))
+
+    def _manifest_path(self, dataflow: str) -> str:
+        return os.path.join(self._dir(dataflow), MANIFEST_NAME)
+
+
+def message_key_columns(data: SdmxJsonData, frame: dt.Frame) -> Tuple[str, List[str]]:
+    """Partition column (the time dimension) and key columns of parsed data"""
+    dimensions = [
+        lookup
+        for level in ["series", "observation"]
+        for lookup in data.compiled.dimensions[level]
+        if lookup.name in frame.names
+    ]
+    time_dims = [d.name for d in dimensions if d.id == "TIME_PERIOD"]
+    if not time_dims:
+        raise ValueError("The dataSet does not have a TIME_PERIOD dimension.")
+    return time_dims[0], [d.name for d in dimensions]
+
+
+def _anti_join(
+    frame: dt.Frame, other: dt.Frame, key_columns: Sequence[str]
+) -> dt.Frame:
+    """Rows of `frame` whose key is not in `other`"""
+    if frame.nrows == 0:
+        return frame.copy()
+    keys = other[:, {"__matched": dt.count()}, dt.by(*key_columns)]
+    keys.key = list(key_columns)
+    matched = frame[:, :, dt.join(keys)]
+    kept = matched[dt.isna(f["__matched"]), :]
+    del kept["__matched"]
+    return kept
+
+
+def _safe_file_name(name: str) -> str:
+    return re.sub(r"[^\w.-]", "_", name)
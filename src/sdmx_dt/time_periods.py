@@ -0,0 +1,143 @@
+"""Parse SDMX time periods into start/end dates and a frequency code.
+
+Periods can be given in any of the SDMX formats, eg "2014", "2020-S2",
+"2020-Q1", "2021-M03", "2021-03", "2019-W05", "2013-01-18" or "2020-D032".
+Each distinct period is only parsed once (there are usually far fewer
+distinct periods than observations), and the results are joined onto the
+observations natively.
+"""
+from __future__ import annotations
+
+import calendar
+import re
+from datetime import date, timedelta
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+from sdmx_dt._lazy import dt, f
+
+PERIOD_PATTERN = re.compile(
+    r"^(?P<year>\d{4})"
+    r"(?:-(?P<freq>[ASTQMWD])(?P<num>\d{1,3})"
+    r"|-(?P<month>\d{2})(?:-(?P<day>\d{2}))?)?$"
+)
+# Number of months in each period, for frequencies made of whole months
+MONTHS = {"A": 12, "S": 6, "T": 4, "Q": 3, "M": 1}
+
+Period = Tuple[Optional[date], Optional[date], Optional[str]]
+
+
+def parse_period(period: Optional[str]) -> Period:
+    """Get (start date, end date, frequency) of a time period
+
+    All are None if the period is not in a recognised format.
+    """
+    match = PERIOD_PATTERN.match(period or "")
+    if match is None:
+        return None, None, None
+    year = int(match["year"])
+    try:
+        if match["freq"] in MONTHS:
+            months = MONTHS[match["freq"]]
+            end_month = int(match["num"]) * months
+            if not 0 < end_month <= 12:
+                return None, None, None
+            start = date(year, end_month - months + 1, 1)
+            return start, _month_end(year, end_month), match["freq"]
+        if match["freq"] == "W":
+            week = int(match["num"])
+            if not 0 < week <= _num_iso_weeks(year):
+                return None, None, None
+            start = _iso_week_start(year) + timedelta(weeks=week - 1)
+            return start, start + timedelta(days=6), "W"
+        if match["freq"] == "D":
+            day = date(year, 1, 1) + timedelta(days=int(match["num"]) - 1)
+            if day.year != year or int(match["num"]) == 0:
+                return None, None, None
+            return day, day, "D"
+        if match["day"]:
+            day = date(year, int(match["month"]), int(match["day"]))
+            return day, day, "D"
+        if match["month"]:
+            month = int(match["month"])
+            return date(year, month, 1), _month_end(year, month), "M"
+    except ValueError:
+        return None, None, None
+    return date(year, 1, 1), date(year, 12, 31), "A"
+
+
+def parse_periods(periods: Iterable[Optional[str]], prefix: str = "Period") -> dt.Frame:
+    """Get datatable of start/end dates and frequencies of time periods
+
+    The columns are "<prefix> start", "<prefix> end" and "<prefix> frequency".
+    """
+    parsed = [parse_period(period) for period in periods]
+    names = [f"{prefix} start", f"{prefix} end", f"{prefix} frequency"]
+    return dt.Frame(
+        {name: [p[i] for p in parsed] for i, name in enumerate(names)},
+        types={
+            names[0]: dt.Type.date32,
+            names[1]: dt.Type.date32,
+            names[2]: dt.Type.str32,
+        },
+    )
+
+
+def add_period_columns(
+    frame: dt.Frame,
+    column: str,
+    prefix: str = "Period",
+    labels: Optional[Sequence[str]] = None,
+    ids: Optional[Sequence[Optional[str]]] = None,
+) -> dt.Frame:
+    """Add start/end date and frequency columns for the periods in `column`
+
+    If the `labels` in `column` and the `ids` of the TIME_PERIOD codelist
+    are given, the ids are parsed (in one pass over the codelist), since the
+    labels need not be SDMX periods. Otherwise, the distinct values of
+    `column` are parsed. Either way, the results are added with a keyed join.
+    """
+    if labels is None:
+        periods = dt.unique(frame[:, dt.as_type(f[column], dt.str32)])
+        labels = periods[~dt.isna(f[0]), :].to_list()[0]
+    if ids is None:
+        ids = labels
+
+    periods_by_label: Dict[str, Optional[str]] = {}
+    repeated = set()
+    for label, id_ in zip(labels, ids):
+        period = id_ if id_ is not None else label
+        if periods_by_label.setdefault(label, period) != period:
+            repeated.add(label)
+    if repeated:
+        raise ValueError(
+            f"Values of `{column}` are the name of several periods: {sorted(repeated)}"
+        )
+    lookup = dt.cbind(
+        dt.Frame({column: list(periods_by_label)}, stype=dt.str32),
+        parse_periods(periods_by_label.values(), prefix),
+    )
+    lookup.key = column
+
+    if frame[column].types[0] == dt.Type.str32:
+        return frame[:, :, dt.join(lookup)]
+    # Key columns must have the same type
+    joined = frame.copy()
+    joined[column] = dt.Type.str32
+    joined = joined[:, :, dt.join(lookup)]
+    joined[column] = frame[column]
+    return joined
+
+
+def _month_end(year: int, month: int) -> date:
+    return date(year, month, calendar.monthrange(year, month)[1])
+
+
+def _iso_week_start(year: int) -> date:
+    """Monday of the first ISO week, which is the week containing 4 January"""
+    jan_4 = date(year, 1, 4)
+    return jan_4 - timedelta(days=jan_4.weekday())
+
+
+def _num_iso_weeks(year: int) -> int:
+    # 28 December is always in the last ISO week of the year
+    return date(year, 12, 28).isocalendar()[1]
@@ -0,0 +1,200 @@
+"""Write observations to files chunk by chunk, without building a full datatable.
+
+Each writer is driven by `SdmxJsonData.iter_observations()`, so only one chunk
+of parsed observations is held in memory at a time. Arrow and Parquet output
+needs the optional `pyarrow` dependency, and polars/pandas output also needs
+the respective library.
+"""
+from __future__ import annotations
+
+from typing import Dict, Iterator, List, Optional
+
+from sdmx_dt._lazy import dt
+from sdmx_dt.sdmx_json import DEFAULT_CHUNK_SIZE, SdmxJsonData
+
+
+def to_csv(
+    data: SdmxJsonData,
+    path: str,
+    dataSet_idx: int = 0,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> None:
+    """Write observations of a dataSet to CSV, appending one chunk at a time"""
+    is_first = True
+    for chunk in data.iter_observations(dataSet_idx, chunk_size):
+        if is_first:
+            chunk.to_csv(path)
+            is_first = False
+        else:
+            chunk.to_csv(path, append=True, header=False)
+
+    if is_first:
+        dt.Frame().to_csv(path)
+
+
+def to_jay(
+    data: SdmxJsonData,
+    path: str,
+    dataSet_idx: int = 0,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> None:
+    """Write observations of a dataSet to datatable's binary .jay format
+
+    The .jay format cannot be appended to, so the chunks are combined with a
+    single (native) rbind before writing.
+    """
+    frame = dt.Frame()
+    frame.rbind(*data.iter_observations(dataSet_idx, chunk_size))
+    frame.to_jay(path)
+
+
+def to_arrow(
+    data: SdmxJsonData,
+    path: Optional[str] = None,
+    dataSet_idx: int = 0,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+):
+    """Write observations of a dataSet to an Arrow IPC file
+
+    Dimension/attribute columns are dictionary-encoded against the labels in
+    the message's structure. If `path` is not given, a `pyarrow.Table` is
+    returned instead.
+    """
+    pa = _import_pyarrow()
+    batches = iter_record_batches(data, dataSet_idx, chunk_size)
+    if path is None:
+        batch_list = list(batches)
+        if not batch_list:
+            return pa.table({})
+        return pa.Table.from_batches(batch_list)
+
+    first = next(batches, None)
+    if first is None:
+        pa.ipc.new_file(path, pa.schema([])).close()
+        return None
+    with pa.ipc.new_file(path, first.schema) as writer:
+        writer.write_batch(first)
+        for batch in batches:
+            writer.write_batch(batch)
+    return None
+
+
+def to_parquet(
+    data: SdmxJsonData,
+    path: str,
+    dataSet_idx: int = 0,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **kwargs,
+) -> None:
+    """Write observations of a dataSet to Parquet, one row group per chunk
+
+    Extra keyword arguments are passed to `pyarrow.parquet.ParquetWriter`.
+    """
+    pa = _import_pyarrow()
+    import pyarrow.parquet as pq
+
+    batches = iter_record_batches(data, dataSet_idx, chunk_size)
+    first = next(batches, None)
+    if first is None:
+        pq.write_table(pa.table({}), path, **kwargs)
+        return
+    with pq.ParquetWriter(path, first.schema, **kwargs) as writer:
+        writer.write_table(pa.Table.from_batches([first]))
+        for batch in batches:
+            writer.write_table(pa.Table.from_batches([batch]))
+
+
+def to_polars(
+    data: SdmxJsonData, dataSet_idx: int = 0, chunk_size: int = DEFAULT_CHUNK_SIZE
+):
+    """Get observations of a dataSet as a `polars.DataFrame`
+
+    The Arrow record batches from `to_arrow()` are handed over without
+    copying, with dimension/attribute columns as categoricals.
+    """
+    try:
+        import polars as pl
+    except ImportError:
+        raise ImportError(
+            "polars output requires polars: `pip install polars`."
+        ) from None
+    table = to_arrow(data, dataSet_idx=dataSet_idx, chunk_size=chunk_size)
+    return pl.from_arrow(table, rechunk=False)
+
+
+def to_pandas(
+    data: SdmxJsonData, dataSet_idx: int = 0, chunk_size: int = DEFAULT_CHUNK_SIZE
+):
+    """Get observations of a dataSet as a `pandas.DataFrame`
+
+    Dimension/attribute columns are categoricals, whose codes are the Arrow
+    dictionary indices, and the Arrow buffers are released as each column
+    is converted, so the data is not held twice.
+    """
+    try:
+        import pandas  # noqa: F401
+    except ImportError:
+        raise ImportError(
+            "pandas output requires pandas: `pip install pandas`."
+        ) from None
+    table = to_arrow(data, dataSet_idx=dataSet_idx, chunk_size=chunk_size)
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def iter_record_batches(
+    data: SdmxJsonData, dataSet_idx: int = 0, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator:
+    """Yield `pyarrow.RecordBatch` for each chunk of observations
+
+    Every batch has the same schema, so they can be written to a single file.
+    """
+    pa = _import_pyarrow()
+    dictionaries = {
+        name: pa.array(labels, pa.string())
+        for name, labels in _label_dictionaries(data).items()
+    }
+    for chunk in data.iter_observations(dataSet_idx, chunk_size):
+        yield _to_record_batch(pa, chunk, dictionaries)
+
+
+def _to_record_batch(pa, chunk: dt.Frame, dictionaries: Dict):
+    import pyarrow.compute as pc
+
+    table = chunk.to_arrow()
+    arrays = []
+    for name, column in zip(table.column_names, table.columns):
+        if name in dictionaries:
+            indices = pc.index_in(
+                column.cast(pa.string()), value_set=dictionaries[name]
+            )
+            arrays.append(
+                pa.DictionaryArray.from_arrays(
+                    indices.combine_chunks().cast(pa.int32()), dictionaries[name]
+                )
+            )
+        elif pa.types.is_string(column.type) or pa.types.is_large_string(column.type):
+            arrays.append(column.combine_chunks().cast(pa.string()))
+        else:
+            # Keep numeric values as float64, so all chunks have the same type
+            arrays.append(column.combine_chunks().cast(pa.float64()))
+    return pa.RecordBatch.from_arrays(arrays, names=table.column_names)
+
+
+def _label_dictionaries(data: SdmxJsonData) -> Dict[str, List[str]]:
+    """Labels of all dimensions/attributes in the structure, by column name"""
+    compiled = data.compiled
+    return {
+        component.name: component.labels
+        for lookups in [*compiled.dimensions.values(), *compiled.attributes.values()]
+        for component in lookups
+    }
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ImportError(
+            "Arrow/Parquet output requires pyarrow: `pip install pyarrow`."
+        ) from None
+    return pa
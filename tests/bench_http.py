@@ -0,0 +1,58 @@
+"""Benchmark reading SDMX-JSON over HTTP, against the local fixture server.
+
+Run with `python -m tests.bench_http`. Each repeat fetches a synthetic
+series-level message (see `FixtureServer`) with `fread_json()` and parses
+its observations, so the timings cover the download, decompression, JSON
+decoding and parsing, with deterministic latency and bandwidth.
+"""
+import argparse
+import statistics
+import time
+
+from sdmx_dt import sdmx_json
+from tests.fixture_server import FixtureServer
+
+
+def bench(server: FixtureServer, num_series: int, num_obs: int, repeat: int) -> dict:
+    url = f"{server.url}/data/SYNTH/all?series={num_series}&observations={num_obs}"
+    context = sdmx_json.ParserContext()
+    fetch_seconds, parse_seconds = [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        message = sdmx_json.fread_json(url, validate=False, context=context)
+        fetched = time.perf_counter()
+        observations = message.get_observations()
+        fetch_seconds.append(fetched - start)
+        parse_seconds.append(time.perf_counter() - fetched)
+    return {
+        "rows": observations.nrows,
+        "fetch": statistics.median(fetch_seconds),
+        "parse": statistics.median(parse_seconds),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--series", type=int, default=1000)
+    parser.add_argument("--observations", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--bytes-per-second", type=float, default=None)
+    parser.add_argument("--no-gzip", action="store_true")
+    args = parser.parse_args()
+
+    with FixtureServer() as server:
+        server.latency = args.latency
+        server.bytes_per_second = args.bytes_per_second
+        server.gzip = not args.no_gzip
+        result = bench(server, args.series, args.observations, args.repeat)
+
+    total = result["fetch"] + result["parse"]
+    print(
+        f"{result['rows']:,} rows: fetch {result['fetch']:.3f}s, "
+        f"parse {result['parse']:.3f}s ({result['rows'] / total:,.0f} rows/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import copy
 from typing import Set
 
 import pytest
@@ -37,3 +38,134 @@ class Helpers:
 @pytest.fixture
 def helpers():
     return Helpers
+
+
+def _values(*pairs):
+    return [{"id": id_, "name": name} for id_, name in pairs]
+
+
+# Small series-level SDMX-JSON "data" object, so tests can run without network
+EXR_DATA_OBJ = {
+    "structure": {
+        "links": [
+            {
+                "urn": "urn:sdmx:org.sdmx.infomodel.datastructure."
+                "DataStructure=ECB:ECB_EXR1(1.0)",
+                "rel": "datastructure",
+            }
+        ],
+        "name": "Exchange rates",
+        "dimensions": {
+            "dataSet": [
+                {
+                    "id": "CURRENCY_DENOM",
+                    "name": "Currency denominator",
+                    "keyPosition": 2,
+                    "values": _values(("EUR", "Euro")),
+                },
+            ],
+            "series": [
+                {
+                    "id": "FREQ",
+                    "name": "Frequency",
+                    "keyPosition": 0,
+                    "values": _values(("D", "Daily"), ("M", "Monthly")),
+                },
+                {
+                    "id": "CURRENCY",
+                    "name": "Currency",
+                    "keyPosition": 1,
+                    "values": _values(
+                        ("NZD", "New Zealand dollar"), ("RUB", "Russian rouble")
+                    ),
+                },
+            ],
+            "observation": [
+                {
+                    "id": "TIME_PERIOD",
+                    "name": "Time period or range",
+                    "keyPosition": 3,
+                    "role": "time",
+                    "values": _values(
+                        ("2013-01-18", "2013-01-18"),
+                        ("2013-01-21", "2013-01-21"),
+                        ("2013-01", "2013-01"),
+                    ),
+                },
+            ],
+        },
+        "attributes": {
+            "dataSet": [
+                {
+                    "id": "UNIT_MULT",
+                    "name": "Unit multiplier",
+                    "values": _values(("0", "Units")),
+                },
+            ],
+            "series": [
+                {
+                    "id": "TITLE",
+                    "name": "Series title",
+                    "values": [
+                        {"name": "New Zealand dollar (NZD)"},
+                        {"name": "Russian rouble (RUB)"},
+                    ],
+                },
+            ],
+            "observation": [
+                {
+                    "id": "OBS_STATUS",
+                    "name": "Observation status",
+                    "default": "A",
+                    "values": _values(("A", "Normal value"), ("E", "Estimated value")),
+                },
+            ],
+        },
+        "annotations": [
+            {"id": "A1", "title": "Rates are indicative", "type": "NOTE"},
+        ],
+    },
+    "dataSets": [
+        {
+            "action": "Information",
+            "attributes": [0],
+            "annotations": [0],
+            "series": {
+                "0:0": {
+                    "attributes": [0],
+                    "observations": {"0": [1.5931, 0], "1": [1.5925]},
+                },
+                "0:1": {
+                    "attributes": [1],
+                    "annotations": [0],
+                    "observations": {"0": [40.3426, 1], "1": [40.3, 0]},
+                },
+                "1:1": {
+                    "attributes": [1],
+                    "observations": {"2": [41.0, None]},
+                },
+            },
+        }
+    ],
+}
+
+
+@pytest.fixture
+def exr_data_obj():
+    return copy.deepcopy(EXR_DATA_OBJ)
+
+
+@pytest.fixture(scope="session")
+def _fixture_server():
+    # Imported here, as the fixture server uses EXR_DATA_OBJ
+    from tests.fixture_server import FixtureServer
+
+    with FixtureServer() as server:
+        yield server
+
+
+@pytest.fixture
+def fixture_server(_fixture_server):
+    """Local SDMX REST server (see tests/fixture_server.py), with default knobs"""
+    _fixture_server.reset()
+    return _fixture_server
@@ -0,0 +1,228 @@
+"""Local SDMX REST server, so tests and benchmarks of the HTTP path are offline.
+
+Routes:
+    /files/<path>           files under `root` (eg "expected_data/agri.json/...")
+    /data/EXR/all           the small EXR message from conftest
+    /data/SYNTH/all         synthetic series-level message, with query
+                            parameters "series" and "observations" (per series)
+    /schema                 minimal SDMX-JSON message schema (top-level only)
+
+Every response has an ETag (requests with a matching If-None-Match get 304),
+and is gzipped if the client accepts it and `gzip` is True. `latency` (in
+seconds, before responding) and `bytes_per_second` throttle responses, so
+benchmarks can mimic a slow network deterministically. Run it directly with
+`python -m tests.fixture_server` to benchmark against it.
+"""
+import argparse
+import copy
+import functools
+import gzip
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from tests.conftest import EXR_DATA_OBJ
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+SCHEMA = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "object",
+    "properties": {
+        "meta": {"type": "object"},
+        "data": {
+            "type": "object",
+            "properties": {
+                "structure": {"type": "object"},
+                "dataSets": {"type": "array", "items": {"type": "object"}},
+            },
+            "required": ["structure"],
+        },
+        "errors": {"type": "array"},
+    },
+}
+CHUNK_SIZE = 64 * 1024
+
+
+class FixtureServer:
+    def __init__(self, root: str = TESTS_DIR, port: int = 0) -> None:
+        self.root = root
+        self.gzip = True
+        self.latency = 0.0
+        self.bytes_per_second: Optional[float] = None
+        self.requests: List[dict] = []
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), _Handler)
+        self._server.fixture = self  # type: ignore[attr-defined]
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def reset(self) -> None:
+        """Restore the default knobs, and clear the request log"""
+        self.gzip = True
+        self.latency = 0.0
+        self.bytes_per_second = None
+        self.requests.clear()
+
+    def start(self) -> "FixtureServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FixtureServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def get_body(self, path: str, query: dict) -> Optional[bytes]:
+        """Response body for a path (None if there is nothing there)"""
+        if path == "/schema":
+            return json.dumps(SCHEMA).encode()
+        if path == "/data/EXR/all":
+            return _message_bytes(json.dumps(EXR_DATA_OBJ), self.url)
+        if path == "/data/SYNTH/all":
+            num_series = int(query.get("series", ["100"])[0])
+            num_obs = int(query.get("observations", ["10"])[0])
+            return _synthetic_bytes(num_series, num_obs, self.url)
+        if path.startswith("/files/"):
+            file_path = os.path.realpath(
+                os.path.join(self.root, path[len("/files/") :])
+            )
+            if file_path.startswith(os.path.realpath(self.root)) and os.path.isfile(
+                file_path
+            ):
+                with open(file_path, "rb") as f:
+                    return f.read()
+        return None
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        fixture: FixtureServer = self.server.fixture  # type: ignore[attr-defined]
+        url = urlsplit(self.path)
+        fixture.requests.append({"path": url.path, "headers": dict(self.headers)})
+        time.sleep(fixture.latency)
+
+        body = fixture.get_body(url.path, parse_qs(url.query))
+        if body is None:
+            self._respond(404, b"Not found", {"Content-Type": "text/plain"})
+            return
+
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self._respond(304, b"", {"ETag": etag})
+            return
+        headers = {"Content-Type": "application/json", "ETag": etag}
+        if fixture.gzip and "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = _gzip(body)
+            headers["Content-Encoding"] = "gzip"
+        self._respond(200, body, headers, fixture.bytes_per_second)
+
+    def _respond(
+        self,
+        status: int,
+        body: bytes,
+        headers: dict,
+        bytes_per_second: Optional[float] = None,
+    ) -> None:
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        for start in range(0, len(body), CHUNK_SIZE):
+            chunk = body[start : start + CHUNK_SIZE]
+            self.wfile.write(chunk)
+            if bytes_per_second:
+                time.sleep(len(chunk) / bytes_per_second)
+
+    def log_message(self, format, *args) -> None:
+        pass  # Keep test output quiet
+
+
+def synthetic_data_obj(num_series: int, num_obs: int, seed: int = 0) -> dict:
+    """EXR-like "data" object with `num_series` series of `num_obs` observations"""
+    data_obj = copy.deepcopy(EXR_DATA_OBJ)
+    num_currencies = (num_series + 1) // 2
+    dims = data_obj["structure"]["dimensions"]
+    dims["series"][1]["values"] = [
+        {"id": f"C{i}", "name": f"Currency {i}"} for i in range(num_currencies)
+    ]
+    dims["observation"][0]["values"] = [
+        {"id": str(2000 + t), "name": str(2000 + t)} for t in range(num_obs)
+    ]
+    data_obj["structure"]["attributes"]["series"][0]["values"] = [
+        {"name": f"Currency {i} title"} for i in range(num_currencies)
+    ]
+    rnd = random.Random(seed)
+    data_obj["dataSets"] = [
+        {
+            "action": "Information",
+            "series": {
+                f"{s % 2}:{s // 2}": {
+                    "attributes": [s // 2],
+                    "observations": {
+                        str(t): [round(rnd.random() * 100, 4), rnd.randint(0, 1)]
+                        for t in range(num_obs)
+                    },
+                }
+                for s in range(num_series)
+            },
+        }
+    ]
+    return data_obj
+
+
+@functools.lru_cache(maxsize=8)
+def _synthetic_bytes(num_series: int, num_obs: int, url: str) -> bytes:
+    # Cached, so benchmarks do not time the generation of the message
+    data_json = json.dumps(synthetic_data_obj(num_series, num_obs))
+    return _message_bytes(data_json, url)
+
+
+def _message_bytes(data_json: str, url: str) -> bytes:
+    meta = {"schema": f"{url}/schema"}
+    return f'{{"meta": {json.dumps(meta)}, "data": {data_json}}}'.encode()
+
+
+@functools.lru_cache(maxsize=8)
+def _gzip(body: bytes) -> bytes:
+    return gzip.compress(body, compresslevel=1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--bytes-per-second", type=float, default=None)
+    parser.add_argument("--no-gzip", action="store_true")
+    args = parser.parse_args()
+
+    server = FixtureServer(port=args.port)
+    server.latency = args.latency
+    server.bytes_per_second = args.bytes_per_second
+    server.gzip = not args.no_gzip
+    print(f"Serving on {server.url}")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import json
+import os
+
+import pytest
+
+from sdmx_dt import sdmx_json
+from sdmx_dt.budget import ChunkedFrame, MemoryBudget, MemoryBudgetExceeded
+from tests import DATA_DIR
+
+
+@pytest.fixture
+def data(exr_data_obj):
+    return sdmx_json.SdmxJsonData(exr_data_obj)
+
+
+@pytest.fixture
+def spill_dir():
+    path = os.path.join(DATA_DIR, "spill")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+@pytest.mark.parametrize(
+    "max_rows, max_memory, chunks, spilled",
+    [(100, None, 1, False), (2, None, 3, False), (2, 1, 3, True)],
+)
+def test_get_observations(
+    data, spill_dir, max_rows, max_memory, chunks, spilled, helpers
+):
+    budget = MemoryBudget(max_rows, max_memory, spill_dir=spill_dir)
+    observations = data.get_observations(budget=budget)
+
+    if chunks > 1:
+        assert isinstance(observations, ChunkedFrame)
+        assert [chunk.nrows for chunk in observations] == [2, 2, 1]
+        observations = observations.to_frame()
+    helpers.check_dt_Frames_eq(observations, data.get_observations())
+    assert observations.meta["chunks"] == chunks
+    assert observations.meta["spilled"] == spilled
+    assert observations.meta["peak_memory"] >= observations.meta["current_memory"]
+    # Spilled files are only kept open, not left behind
+    assert os.listdir(spill_dir) == []
+
+
+def test_parse_time_periods_in_chunks(data, spill_dir):
+    budget = MemoryBudget(max_rows=2, max_memory=1, spill_dir=spill_dir)
+    observations = data.get_observations(parse_time_periods=True, budget=budget)
+
+    expected = data.get_observations(parse_time_periods=True)
+    assert observations.names == expected.names
+    assert observations.to_frame().to_list() == expected.to_list()
+
+
+def test_fread_json_input_size(exr_data_obj):
+    path = os.path.join(DATA_DIR, "budget-exr.json")
+    with open(path, "w") as f:
+        json.dump({"data": exr_data_obj}, f)
+
+    with pytest.raises(MemoryBudgetExceeded):
+        sdmx_json.fread_json(path, is_url=False, budget=MemoryBudget(max_input_bytes=1))
+
+    budget = MemoryBudget(max_rows=2, max_input_bytes=os.path.getsize(path))
+    message = sdmx_json.fread_json(path, is_url=False, validate=False, budget=budget)
+    assert message.get_observations().meta["chunks"] == 3
@@ -0,0 +1,102 @@
+import json
+import os
+
+import pytest
+from datatable import dt
+
+from sdmx_dt import cli, writers
+from tests import DATA_DIR
+
+
+@pytest.fixture
+def input_dir(request, exr_data_obj):
+    path = os.path.join(DATA_DIR, "cli", request.node.name)
+    os.makedirs(os.path.join(path, "in"))
+    for name in ["a", "b"]:
+        with open(os.path.join(path, "in", f"{name}.json"), "w") as f:
+            json.dump({"data": exr_data_obj}, f)
+    return path
+
+
+def test_expand_inputs(input_dir):
+    in_dir = os.path.join(input_dir, "in")
+    url = "https://example.org/data/a.json"
+    sources = cli.expand_inputs([in_dir, os.path.join(in_dir, "a*"), url])
+
+    assert sources == [
+        os.path.join(in_dir, "a.json"),
+        os.path.join(in_dir, "b.json"),
+        url,
+    ]
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_convert_directory(input_dir, jobs, capsys):
+    out_dir = os.path.join(input_dir, "out")
+    argv = [os.path.join(input_dir, "in"), "-o", out_dir, "-f", "jay", "-j", jobs]
+    assert cli.main(argv) == 0
+
+    assert sorted(os.listdir(out_dir)) == ["a.jay", "b.jay"]
+    assert dt.fread(file=os.path.join(out_dir, "a.jay")).shape == (5, 6)
+    assert "Converted 2, skipped 0, failed 0" in capsys.readouterr().err
+
+    # Outputs are up to date, so nothing is converted again
+    assert cli.main(argv) == 0
+    assert "Converted 0, skipped 2, failed 0" in capsys.readouterr().err
+
+
+def test_errors_reported(input_dir, capsys):
+    bad_path = os.path.join(input_dir, "in", "bad.json")
+    with open(bad_path, "w") as f:
+        f.write("{not json")
+
+    out_dir = os.path.join(input_dir, "out")
+    assert cli.main([os.path.join(input_dir, "in"), "-o", out_dir, "-j", "1"]) == 1
+
+    err = capsys.readouterr().err
+    assert "Converted 2, skipped 0, failed 1" in err
+    assert f"{bad_path}: JSONDecodeError" in err
+    assert sorted(os.listdir(out_dir)) == ["a.csv", "b.csv"]
+
+
+def test_outputs_matched_exactly(input_dir, exr_data_obj):
+    in_dir = os.path.join(input_dir, "in")
+    os.rename(os.path.join(in_dir, "b.json"), os.path.join(in_dir, "ab.json"))
+    out_dir = os.path.join(input_dir, "out")
+    assert cli.main([os.path.join(in_dir, "ab.json"), "-o", out_dir, "-q"]) == 0
+
+    # "ab.csv" is not an output of "a.json"
+    task = cli.Task(os.path.join(in_dir, "a.json"), False, f"{out_dir}/a", "csv")
+    assert not cli.is_up_to_date(task)
+
+
+def test_same_names_do_not_collide(input_dir, exr_data_obj):
+    other_dir = os.path.join(input_dir, "other")
+    os.makedirs(other_dir)
+    with open(os.path.join(other_dir, "a.json"), "w") as f:
+        json.dump({"data": exr_data_obj}, f)
+    sources = [
+        os.path.join(input_dir, "in", "a.json"),
+        os.path.join(other_dir, "a.json"),
+    ]
+
+    stems = cli.unique_stems(sources + [os.path.join(input_dir, "in", "b.json")])
+    assert len(set(stems.values())) == 3
+    assert stems[sources[0]].startswith("a-") and stems[sources[1]].startswith("a-")
+
+    out_dir = os.path.join(input_dir, "out")
+    assert cli.main(sources + ["-o", out_dir, "-q", "-j", "1"]) == 0
+    assert len(os.listdir(out_dir)) == 2
+
+
+def test_failed_conversion_leaves_no_output(input_dir, monkeypatch):
+    def interrupted_to_csv(data, path, **kwargs):
+        with open(path, "w") as f:
+            f.write("Frequency,Currency\n")
+        raise KeyError("interrupted")
+
+    monkeypatch.setattr(writers, "to_csv", interrupted_to_csv)
+    out_dir = os.path.join(input_dir, "out")
+    in_path = os.path.join(input_dir, "in", "a.json")
+    assert cli.main([in_path, "-o", out_dir, "-q", "-j", "1"]) == 1
+    assert os.listdir(out_dir) == []
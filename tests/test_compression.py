@@ -0,0 +1,77 @@
+import bz2
+import gzip
+import io
+import json
+import lzma
+import os
+import zipfile
+
+import pytest
+
+from sdmx_dt import sdmx_json
+from sdmx_dt.compression import decompressing_reader, detect_compression
+from tests import DATA_DIR
+
+
+def zstd_compress(content: bytes) -> bytes:
+    zstandard = pytest.importorskip("zstandard")
+    return zstandard.ZstdCompressor().compress(content)
+
+
+def zip_compress(content: bytes) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("message.json", content)
+    return buffer.getvalue()
+
+
+COMPRESSORS = {
+    None: lambda content: content,
+    "gzip": gzip.compress,
+    "bz2": bz2.compress,
+    "xz": lzma.compress,
+    "zstd": zstd_compress,
+    "zip": zip_compress,
+}
+
+
+@pytest.mark.parametrize("compression", COMPRESSORS.keys())
+def test_load_json_compressed(compression, exr_data_obj, helpers):
+    content = COMPRESSORS[compression](json.dumps({"data": exr_data_obj}).encode())
+    assert detect_compression(content[:8]) == compression
+
+    path = os.path.join(DATA_DIR, f"compressed-{compression}.json")
+    with open(path, "wb") as f:
+        f.write(content)
+    message = sdmx_json.fread_json(path, is_url=False, validate=False)
+
+    expected = sdmx_json.SdmxJsonData(exr_data_obj).get_observations()
+    helpers.check_dt_Frames_eq(message.data.get_observations(), expected)
+
+
+def test_decompressing_unseekable_stream():
+    content = b'{"data": 1}'
+
+    class Unseekable(io.RawIOBase):
+        def __init__(self, raw):
+            self.raw = io.BytesIO(raw)
+
+        def readable(self):
+            return True
+
+        def readinto(self, b):
+            return self.raw.readinto(b)
+
+    for compress in [gzip.compress, zip_compress]:
+        with decompressing_reader(Unseekable(compress(content))) as stream:
+            assert stream.read() == content
+
+
+def test_zip_with_several_members():
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("a.json", b"{}")
+        archive.writestr("b.json", b"{}")
+
+    with pytest.raises(ValueError):
+        decompressing_reader(io.BytesIO(buffer.getvalue()))
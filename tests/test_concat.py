@@ -0,0 +1,38 @@
+import copy
+
+from sdmx_dt import sdmx_json
+from sdmx_dt._lazy import dt
+from sdmx_dt.concat import concat_messages, unify_structures
+
+
+def _reordered(exr_data_obj):
+    """EXR message with currencies in a different order, plus a new currency"""
+    currencies = exr_data_obj["structure"]["dimensions"]["series"][1]["values"]
+    currencies.reverse()
+    currencies.insert(0, {"id": "USD", "name": "US dollar"})
+    new_keys = {"0:0": "0:2", "0:1": "0:1", "1:1": "1:1"}
+    dataSet = exr_data_obj["dataSets"][0]
+    dataSet["series"] = {new_keys[k]: v for k, v in dataSet["series"].items()}
+    dataSet["series"]["0:0"] = {"attributes": [0], "observations": {"0": [1.1, 0]}}
+    return exr_data_obj
+
+
+def test_concat_messages(exr_data_obj):
+    first = sdmx_json.SdmxJsonData(copy.deepcopy(exr_data_obj))
+    second = sdmx_json.SdmxJsonData(_reordered(exr_data_obj))
+    expected = dt.rbind(first.get_observations(), second.get_observations())
+
+    actual = concat_messages([first, second])
+
+    assert actual.names == expected.names
+    assert actual.to_list() == expected.to_list()
+
+
+def test_unify_structures(exr_data_obj):
+    first = sdmx_json.SdmxJsonData(copy.deepcopy(exr_data_obj))
+    second = sdmx_json.SdmxJsonData(_reordered(exr_data_obj))
+
+    unified = unify_structures([first, second])
+
+    currencies = unified["dimensions"]["series"][1]["values"]
+    assert [v["id"] for v in currencies] == ["NZD", "RUB", "USD"]
@@ -0,0 +1,54 @@
+import pytest
+
+from sdmx_dt import sdmx_json
+from sdmx_dt.consistency import check_consistency
+
+
+def test_consistent(exr_data_obj):
+    problems = check_consistency(sdmx_json.SdmxJsonData(exr_data_obj))
+
+    assert problems.nrows == 0
+    assert problems.names[-1] == "problem"
+
+
+def test_all_problems_reported(exr_data_obj):
+    dataSet = exr_data_obj["dataSets"][0]
+    series = dataSet["series"]
+    series["0:5"] = series.pop("0:1")  # only 2 currencies
+    series["1"] = series.pop("1:1")  # missing part
+    series["0:0"]["attributes"] = [0, 0]  # only 1 series attribute
+    series["0:0"]["observations"]["1"] = [1.5925, 2]  # only 2 statuses
+    series["0:5"]["observations"]["7"] = [1.0]  # only 3 time periods
+    dataSet["attributes"] = [-1]
+    problems = check_consistency(sdmx_json.SdmxJsonData(exr_data_obj))
+
+    actual = sorted(
+        zip(
+            *[
+                problems[col].to_list()[0]
+                for col in ["level", "series", "key", "component", "value"]
+            ]
+        ),
+        key=str,
+    )
+    assert actual == sorted(
+        [
+            ("dataSet", None, None, "UNIT_MULT", "-1"),
+            ("series", "0:5", None, "CURRENCY", "5"),
+            ("series", "1", None, None, "1"),
+            ("series", "0:0", None, None, "2"),
+            ("observation", None, "7", "TIME_PERIOD", "7"),
+            ("observation", "0:0", "1", "OBS_STATUS", "2"),
+        ],
+        key=str,
+    )
+
+
+def test_validate_consistency(exr_data_obj):
+    exr_data_obj["dataSets"][0]["series"]["0:0"]["observations"]["x"] = [1.0]
+    message_obj = {"data": exr_data_obj}
+
+    with pytest.raises(sdmx_json.InvalidSdmxJsonException, match="TIME_PERIOD"):
+        sdmx_json.SdmxJsonDataMessage(message_obj, validate="consistency")
+    # Not checked without validation
+    sdmx_json.SdmxJsonDataMessage(message_obj, validate=False)
@@ -0,0 +1,121 @@
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from sdmx_dt import sdmx_json
+from tests import DATA_DIR
+
+# Context shared with forked worker processes
+CONTEXT = sdmx_json.ParserContext()
+
+
+def _num_observations(url):
+    message = sdmx_json.fread_json(url, context=CONTEXT)
+    return message.data.num_observations()
+
+
+def test_shared_across_threads(fixture_server):
+    context = sdmx_json.ParserContext()
+    url = f"{fixture_server.url}/data/EXR/all"
+    with ThreadPoolExecutor(4) as executor:
+        messages = list(
+            executor.map(lambda _: sdmx_json.fread_json(url, context=context), range(8))
+        )
+
+    assert all(message == messages[0] for message in messages)
+    # The schema is only fetched once, and the structure only compiled once
+    schema_requests = [r for r in fixture_server.requests if r["path"] == "/schema"]
+    assert len(schema_requests) == 1
+    assert len(context.structure_cache) == 1
+    assert messages[0].data.compiled is messages[-1].data.compiled
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="Needs fork")
+def test_shared_with_forked_workers(fixture_server):
+    url = f"{fixture_server.url}/data/EXR/all"
+    # Use the context's session and caches before forking
+    assert _num_observations(url) == 5
+
+    with multiprocessing.get_context("fork").Pool(2) as pool:
+        assert pool.map(_num_observations, [url] * 4) == [5] * 4
+
+
+def test_custom_decoder(exr_data_obj):
+    calls = []
+
+    def loads(content):
+        calls.append(len(content))
+        return json.loads(content)
+
+    context = sdmx_json.ParserContext(loads=loads)
+    path = os.path.join(DATA_DIR, "context-exr.json")
+    with open(path, "w") as f:
+        json.dump({"data": exr_data_obj}, f)
+    message = sdmx_json.fread_json(path, is_url=False, validate=False, context=context)
+
+    assert calls == [os.path.getsize(path)]
+    assert message.data.num_observations() == 5
+
+
+def test_default_context_shares_structure_cache():
+    assert sdmx_json.DEFAULT_CONTEXT.structure_cache is sdmx_json.STRUCTURE_CACHE
+    # An empty cache is still used
+    cache = sdmx_json.StructureCache()
+    assert sdmx_json.ParserContext(structure_cache=cache).structure_cache is cache
+
+
+def test_slow_schema_does_not_block_others(fixture_server):
+    context = sdmx_json.ParserContext()
+    cached = context.get_validator(f"{fixture_server.url}/schema")
+    fixture_server.latency = 1.0
+    with ThreadPoolExecutor(1) as executor:
+        slow = executor.submit(
+            context.get_validator, f"{fixture_server.url}/schema?v=2"
+        )
+        time.sleep(0.1)
+        start = time.perf_counter()
+        assert context.get_validator(f"{fixture_server.url}/schema") is cached
+        assert time.perf_counter() - start < 0.5
+        assert slow.result() is not cached
+
+
+def test_close_sessions():
+    with sdmx_json.ParserContext() as context:
+        session = context.session
+        with ThreadPoolExecutor(1) as executor:
+            other = executor.submit(lambda: context.session).result()
+        assert other is not session
+
+    assert context._sessions == []
+    assert context.session is not session
+
+
+def test_new_context_keeps_cache_lock():
+    cache = sdmx_json.StructureCache()
+    lock = cache._lock
+    sdmx_json.ParserContext(structure_cache=cache)
+    assert cache._lock is lock
+
+
+def test_concurrent_misses_compile_once(exr_data_obj, monkeypatch):
+    from_structure = sdmx_json.CompiledStructure.from_structure
+
+    def slow_from_structure(*args, **kwargs):
+        time.sleep(0.05)
+        return from_structure(*args, **kwargs)
+
+    monkeypatch.setattr(
+        sdmx_json.CompiledStructure, "from_structure", slow_from_structure
+    )
+    cache = sdmx_json.StructureCache(maxsize=4)
+    with ThreadPoolExecutor(6) as executor:
+        compiled = list(
+            executor.map(lambda _: cache.get(exr_data_obj["structure"]), range(6))
+        )
+
+    assert len(cache) == 1
+    assert all(c is compiled[0] for c in compiled)
@@ -0,0 +1,92 @@
+import copy
+import json
+import os
+
+import pytest
+
+from sdmx_dt import sdmx_json
+from sdmx_dt.diff import diff
+from tests import DATA_DIR
+
+
+@pytest.fixture
+def releases(exr_data_obj):
+    old = sdmx_json.SdmxJsonData(copy.deepcopy(exr_data_obj))
+    series = exr_data_obj["dataSets"][0]["series"]
+    series["0:0"]["observations"]["0"][0] = 1.6  # value changed
+    series["0:0"]["observations"]["2"] = [1.7, 0]  # added
+    series["0:1"]["observations"]["1"][1] = 1  # status changed
+    del series["1:1"]  # removed
+    return old, sdmx_json.SdmxJsonData(exr_data_obj)
+
+
+def test_diff(releases):
+    differences = diff(*releases)
+
+    assert differences.added[:, "Value"].to_list() == [[1.7]]
+    assert differences.removed[:, ["Frequency", "Value"]].to_list() == [
+        ["Monthly"],
+        [41.0],
+    ]
+    assert differences.value_changed[:, ["Value", "Previous Value"]].to_list() == [
+        [1.6],
+        [1.5931],
+    ]
+    assert differences.attribute_changed[:, "Value"].to_list() == [[40.3]]
+
+
+def test_no_differences(releases):
+    differences = diff(releases[0], releases[0])
+
+    for frame in [
+        differences.added,
+        differences.removed,
+        differences.value_changed,
+        differences.attribute_changed,
+    ]:
+        assert frame.nrows == 0
+
+
+def test_write_delta(releases):
+    path = os.path.join(DATA_DIR, "diff-delta.json")
+    diff(*releases).write_delta(*releases, path)
+    with open(path) as f:
+        dataSets = json.load(f)["data"]["dataSets"]
+
+    assert [d["action"] for d in dataSets] == ["Replace", "Delete"]
+    assert dataSets[0]["series"]["0:0"]["observations"] == {
+        "0": [1.6, 0],
+        "2": [1.7, 0],
+    }
+    assert list(dataSets[0]["series"]["0:1"]["observations"]) == ["1"]
+    assert list(dataSets[1]["series"]) == ["1:1"]
+
+
+def test_write_delta_removed_only(exr_data_obj):
+    old = sdmx_json.SdmxJsonData(copy.deepcopy(exr_data_obj))
+    # The new structure only has the codes which are still used
+    del exr_data_obj["dataSets"][0]["series"]["1:1"]
+    exr_data_obj["structure"]["dimensions"]["series"][0]["values"].pop()
+    new = sdmx_json.SdmxJsonData(exr_data_obj)
+    path = os.path.join(DATA_DIR, "diff-delta-removed.json")
+    diff(old, new).write_delta(old, new, path)
+
+    message = sdmx_json.SdmxJsonDataMessage(_read(path), validate=False)
+    assert [d.action for d in message.data.dataSets] == ["Delete"]
+    message.data.dataSets[0].action = "Information"
+    assert message.get_observations()[:, ["Frequency", "Currency"]].to_list() == [
+        ["Monthly"],
+        ["Russian rouble"],
+    ]
+
+
+def test_write_delta_no_differences(releases):
+    path = os.path.join(DATA_DIR, "diff-delta-none.json")
+    diff(releases[0], releases[0]).write_delta(releases[0], releases[0], path)
+
+    assert _read(path)["data"]["dataSets"] == []
+
+
+def _read(path):
+    with open(path) as f:
+        return json.load(f)
@@ -0,0 +1,61 @@
+import time
+
+import pytest
+import requests
+
+from sdmx_dt import sdmx_json
+from sdmx_dt.budget import MemoryBudget, MemoryBudgetExceeded
+
+
+@pytest.mark.parametrize("gzip", [True, False])
+def test_fread_json_url(fixture_server, exr_data_obj, gzip, helpers):
+    fixture_server.gzip = gzip
+    # The served message's schema is also served locally, so validation is offline
+    context = sdmx_json.ParserContext()
+    message = sdmx_json.fread_json(
+        f"{fixture_server.url}/data/EXR/all", context=context
+    )
+
+    helpers.check_dt_Frames_eq(
+        message.get_observations(),
+        sdmx_json.SdmxJsonData(exr_data_obj).get_observations(),
+    )
+    assert fixture_server.requests[-1]["path"] == "/schema"
+
+
+def test_synthetic_message(fixture_server):
+    url = f"{fixture_server.url}/data/SYNTH/all?series=20&observations=5"
+    message = sdmx_json.fread_json(url, validate=False)
+
+    assert message.get_observations().shape == (100, 6)
+
+
+def test_etag(fixture_server):
+    url = f"{fixture_server.url}/data/EXR/all"
+    first = requests.get(url)
+    second = requests.get(url, headers={"If-None-Match": first.headers["ETag"]})
+
+    assert first.status_code == 200
+    assert second.status_code == 304
+    assert second.content == b""
+
+
+def test_throttling(fixture_server):
+    fixture_server.latency = 0.2
+    start = time.perf_counter()
+    sdmx_json.fread_json(f"{fixture_server.url}/data/EXR/all", validate=False)
+
+    assert time.perf_counter() - start >= 0.2
+
+
+def test_not_found(fixture_server):
+    with pytest.raises(sdmx_json.InvalidSdmxJsonException):
+        sdmx_json.fread_json(f"{fixture_server.url}/files/missing.json")
+
+
+def test_budget_content_length(fixture_server):
+    fixture_server.gzip = False
+    url = f"{fixture_server.url}/data/SYNTH/all?series=20&observations=5"
+
+    with pytest.raises(MemoryBudgetExceeded):
+        sdmx_json.fread_json(url, budget=MemoryBudget(max_input_bytes=100))
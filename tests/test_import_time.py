@@ -0,0 +1,53 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Budget for `import sdmx_dt.sdmx_json`, excluding interpreter startup
+IMPORT_BUDGET_SECONDS = 0.1
+HEAVY_MODULES = ["datatable", "jsonschema", "requests", "pyarrow"]
+
+SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+heavy = [m for m in {heavy!r} if m in sys.modules]
+print(json.dumps({{"elapsed": elapsed, "heavy": heavy}}))
+"""
+
+
+def run_import(module: str) -> dict:
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    script = SCRIPT.format(module=module, heavy=HEAVY_MODULES)
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        env=env,
+        stdout=subprocess.PIPE,
+        check=True,
+        universal_newlines=True,
+    )
+    return json.loads(result.stdout)
+
+
+@pytest.mark.parametrize(
+    "module", ["sdmx_dt", "sdmx_dt.sdmx_json", "sdmx_dt.writers", "sdmx_dt.store"]
+)
+def test_heavy_dependencies_not_imported(module):
+    assert run_import(module)["heavy"] == []
+
+
+def test_import_time_budget():
+    # Take the best of a few runs, to reduce noise from the machine
+    elapsed = min(run_import("sdmx_dt.sdmx_json")["elapsed"] for _ in range(3))
+    assert elapsed < IMPORT_BUDGET_SECONDS
+
+
+def test_dependencies_loaded_on_first_use(exr_data_obj):
+    from sdmx_dt import sdmx_json
+
+    frame = sdmx_json.SdmxJsonData(exr_data_obj).get_observations()
+    assert "datatable" in sys.modules
+    assert frame.shape == (5, 6)
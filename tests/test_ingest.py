@@ -0,0 +1,93 @@
+import io
+import json
+import os
+
+import pytest
+
+from sdmx_dt import ingest
+from sdmx_dt.store import DataStore
+from tests import DATA_DIR
+
+TIME = "Time period or range"
+
+
+@pytest.fixture
+def landing(request, exr_data_obj):
+    """Landing directory with an initial message, then an update"""
+    path = os.path.join(DATA_DIR, "ingest", request.node.name)
+    os.makedirs(os.path.join(path, "in"))
+    update_obj = json.loads(json.dumps(exr_data_obj))
+    update_obj["dataSets"] = [
+        {"action": "Replace", "series": {"0:0": {"observations": {"0": [2.0]}}}},
+        {"action": "Delete", "series": {"0:1": {"observations": {"1": [None]}}}},
+    ]
+    _write_message(os.path.join(path, "in", "a.json"), exr_data_obj)
+    _write_message(os.path.join(path, "in", "b.json"), update_obj)
+    return path
+
+
+def _write_message(path, data_obj):
+    with open(path, "w") as f:
+        json.dump({"data": data_obj}, f)
+
+
+def _ingest(path, sources, jobs=1):
+    ingester = ingest.Ingester(DataStore(os.path.join(path, "store")), "EXR")
+    return list(ingester.run(sources, jobs))
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_ingest_applies_actions_in_order(landing, jobs):
+    sources = ingest.watch_directory(os.path.join(landing, "in"), min_age=0, once=True)
+    results = _ingest(landing, sources, jobs)
+
+    assert [r.error for r in results] == [None, None]
+    assert [r.outputs for r in results] == [["EXR/2013"], ["EXR/2013", "EXR/2013"]]
+    stored = DataStore(os.path.join(landing, "store")).read("EXR")
+    # The first observation was replaced, and the fourth deleted
+    assert sorted(stored["Value"].to_list()[0]) == [1.5925, 2.0, 40.3426, 41.0]
+
+
+def test_restart_skips_unchanged_files(landing):
+    in_dir = os.path.join(landing, "in")
+    _ingest(landing, ingest.watch_directory(in_dir, min_age=0, once=True))
+
+    results = _ingest(landing, ingest.watch_directory(in_dir, min_age=0, once=True))
+    assert [r.skipped for r in results] == [True, True]
+
+    with open(os.path.join(in_dir, "b.json"), "a") as f:
+        f.write("\n")
+    results = _ingest(landing, ingest.watch_directory(in_dir, min_age=0, once=True))
+    assert [(os.path.basename(r.source), r.skipped) for r in results] == [
+        ("a.json", True),
+        ("b.json", False),
+    ]
+
+
+def test_failed_files_are_checkpointed(landing):
+    bad_path = os.path.join(landing, "in", "c.json")
+    with open(bad_path, "w") as f:
+        f.write("{")
+    results = _ingest(landing, [bad_path])
+    assert results[0].error.startswith("InvalidSdmxJsonException")
+
+    checkpoint = ingest.Checkpoint(
+        os.path.join(landing, "store", "ingest_checkpoint.jsonl")
+    )
+    assert checkpoint.is_processed(bad_path, ingest.file_signature(bad_path))
+
+
+def test_watch_waits_for_files_to_settle(landing):
+    sources = ingest.watch_directory(os.path.join(landing, "in"), min_age=60, once=True)
+    assert list(sources) == []
+
+
+def test_main_reads_paths_from_stdin(landing, monkeypatch, capsys):
+    paths = [os.path.join(landing, "in", name) for name in ["a.json", "b.json"]]
+    monkeypatch.setattr("sys.stdin", io.StringIO("\n".join(paths) + "\n"))
+    store_dir = os.path.join(landing, "store")
+    argv = ["--stdin", "--store", store_dir, "--dataflow", "EXR", "-j", "1"]
+    assert ingest.main(argv) == 0
+
+    assert DataStore(store_dir).read("EXR").nrows == 4
+    assert "Converted 2, skipped 0, failed 0" in capsys.readouterr().err
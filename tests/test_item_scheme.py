@@ -0,0 +1,86 @@
+import pytest
+from datatable import Frame
+
+from sdmx_dt.information_model.codelist import Code, CodeList
+from sdmx_dt.information_model.item_scheme import HierarchyIndex
+
+REGIONS = {
+    "W": None,
+    "EU": "W",
+    "FR": "EU",
+    "PAR": "FR",
+    "DE": "EU",
+    "US": "W",
+    "NY": "US",
+}
+
+
+@pytest.fixture
+def hierarchy():
+    return HierarchyIndex(list(REGIONS.keys()), list(REGIONS.values()))
+
+
+def test_descendants(hierarchy):
+    assert hierarchy.descendants("EU") == ["FR", "PAR", "DE"]
+    assert hierarchy.descendants("PAR") == []
+    assert hierarchy.children("W") == ["EU", "US"]
+    assert hierarchy.is_descendant("PAR", "W")
+    assert hierarchy.is_descendant("PAR", "EU")
+    assert not hierarchy.is_descendant("NY", "EU")
+    assert not hierarchy.is_descendant("EU", "EU")
+
+
+def test_ancestors(hierarchy):
+    assert hierarchy.ancestors("PAR") == ["W", "EU", "FR"]
+    assert hierarchy.depth[hierarchy.positions["PAR"]] == 3
+    assert hierarchy.ancestor_at_level("PAR", 1) == "EU"
+    assert hierarchy.ancestor_at_level("W", 1) is None
+    assert hierarchy.ancestors_at_level(["PAR", "NY", "W", None, "??"], 1) == [
+        "EU",
+        "US",
+        None,
+        None,
+        None,
+    ]
+
+
+def test_add_ancestor_column(hierarchy):
+    frame = Frame(REF_AREA=["PAR", "NY", "DE"], Value=[1.0, 2.0, 3.0])
+    actual = hierarchy.add_ancestor_column(frame, "REF_AREA", 1, name="REGION")
+
+    assert actual.names == ("REF_AREA", "Value", "REGION")
+    assert actual["REGION"].to_list() == [["EU", "US", "EU"]]
+
+
+@pytest.mark.parametrize(
+    "parents", [["B", "A"], ["A", "missing"]], ids=["cycle", "unknown"]
+)
+def test_invalid_hierarchy(parents):
+    with pytest.raises(ValueError):
+        HierarchyIndex(["A", "B"], parents)
+
+
+def test_codelist_hierarchy():
+    def code(id_, parent=None):
+        return Code(id=id_, uri=None, urn=None, name={id_: "en"}, parent=parent)
+
+    total = code("_T")
+    codes = [total, code("A", total), code("B", total)]
+    codelist = CodeList(
+        is_partial=False,
+        items=codes,
+        final=True,
+        is_external_reference=False,
+        service_url=None,
+        structure_url=None,
+        version="1.0",
+        valid_from=None,
+        valid_to=None,
+        id="CL_TEST",
+        uri=None,
+        urn=None,
+        name={"Test": "en"},
+    )
+
+    assert codelist.hierarchy.descendants("_T") == ["A", "B"]
+    assert codelist.hierarchy is codelist.hierarchy
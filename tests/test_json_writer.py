@@ -0,0 +1,64 @@
+import json
+import os
+
+import pytest
+
+from sdmx_dt import sdmx_json
+from sdmx_dt.json_writer import write_json
+from tests import DATA_DIR
+
+
+@pytest.fixture
+def data(exr_data_obj):
+    return sdmx_json.SdmxJsonData(exr_data_obj)
+
+
+def _read(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+@pytest.mark.parametrize("level", ["series", "observation"])
+@pytest.mark.parametrize("chunk_size", [2, 100])
+def test_round_trip(data, level, chunk_size, helpers):
+    path = os.path.join(DATA_DIR, f"json-writer-{level}-{chunk_size}.json")
+    write_json(data.get_observations(), data, path, level=level, chunk_size=chunk_size)
+    message = sdmx_json.SdmxJsonDataMessage(_read(path), validate=False)
+
+    assert message.data is not None
+    assert (message.data.dataSets[0].series is None) == (level == "observation")
+    helpers.check_dt_Frames_eq(message.get_observations(), data.get_observations())
+
+
+def test_series_keys(data, exr_data_obj):
+    path = os.path.join(DATA_DIR, "json-writer-keys.json")
+    write_json(data.get_observations(), data.structure, path, meta={"id": "EXR"})
+    message_obj = _read(path)
+
+    assert message_obj["meta"] == {"id": "EXR"}
+    series = message_obj["data"]["dataSets"][0]["series"]
+    expected = exr_data_obj["dataSets"][0]["series"]
+    assert list(series) == list(expected)
+    assert series["0:1"]["observations"] == expected["0:1"]["observations"]
+    # Default attribute values are written explicitly
+    assert series["0:0"]["observations"]["1"] == [1.5925, 0]
+
+
+def test_unknown_labels(data):
+    frame = data.get_observations()
+    frame[0, "Currency"] = "Euro"
+    path = os.path.join(DATA_DIR, "json-writer-unknown.json")
+
+    with pytest.raises(ValueError, match="Currency"):
+        write_json(frame, data, path)
+
+
+def test_ambiguous_labels(exr_data_obj):
+    # Two currencies with the same name
+    currencies = exr_data_obj["structure"]["dimensions"]["series"][1]["values"]
+    currencies[1]["name"] = currencies[0]["name"]
+    data = sdmx_json.SdmxJsonData(exr_data_obj)
+    path = os.path.join(DATA_DIR, "json-writer-ambiguous.json")
+
+    with pytest.raises(ValueError, match="several codes: \\['New Zealand dollar'\\]"):
+        write_json(data.get_observations(), data, path)
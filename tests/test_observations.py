@@ -0,0 +1,161 @@
+import pytest
+
+from sdmx_dt import sdmx_json
+
+
+@pytest.fixture
+def data(exr_data_obj):
+    return sdmx_json.SdmxJsonData(exr_data_obj)
+
+
+@pytest.fixture
+def observation_level_obj(exr_data_obj):
+    """The EXR data object, with all components at observation-level"""
+    dims = exr_data_obj["structure"]["dimensions"]
+    dims["observation"] = dims["series"] + dims["observation"]
+    dims["series"] = []
+    exr_data_obj["structure"]["attributes"]["series"] = []
+    dataSet = exr_data_obj["dataSets"][0]
+    dataSet["observations"] = {
+        f"{series_key}:{obs_key}": obs
+        for series_key, series in dataSet.pop("series").items()
+        for obs_key, obs in series["observations"].items()
+    }
+    return exr_data_obj
+
+
+def test_series_runs(data, helpers):
+    series = data.dataSets[0].series
+    runs = data._parse_series_runs(series.items())
+
+    # Series-level columns are stored once per series
+    assert runs.runs.names == ("Frequency", "Currency", "Series title")
+    assert runs.runs.nrows == 3
+    assert runs.run_lengths == [2, 2, 1]
+    assert runs.rows.nrows == runs.nrows == 5
+    helpers.check_dt_Frames_eq(runs.expand(), data.get_observations())
+
+
+def test_series_without_attributes(exr_data_obj):
+    del exr_data_obj["dataSets"][0]["series"]["1:1"]["attributes"]
+    actual = sdmx_json.SdmxJsonData(exr_data_obj).get_observations()
+
+    assert actual["Series title"].to_list()[0][-1] is None
+
+
+def _add_group_attribute(exr_data_obj):
+    exr_data_obj["structure"]["attributes"]["dimensionGroup"] = [
+        {
+            "id": "DECIMALS",
+            "name": "Decimals",
+            "values": [{"id": "2", "name": "Two"}, {"id": "4", "name": "Four"}],
+        }
+    ]
+    # Daily series are given to 4 decimals, Russian rouble series to 2
+    exr_data_obj["dataSets"][0]["dimensionGroupAttributes"] = {
+        "0::": [1],
+        ":1:": [0],
+    }
+    return exr_data_obj
+
+
+def test_all_attributes_series(exr_data_obj):
+    data = sdmx_json.SdmxJsonData(_add_group_attribute(exr_data_obj))
+    actual = data.get_observations(all_attributes=True)
+
+    assert actual.names == data.get_observations().names + (
+        "Unit multiplier",
+        "Decimals",
+    )
+    assert actual["Unit multiplier"].to_list()[0] == ["Units"] * 5
+    assert actual["Decimals"].to_list()[0] == ["Four"] * 4 + ["Two"]
+    # Series-level runs are still one per series
+    runs = data._parse_series_runs(data.dataSets[0].series.items(), data.dataSets[0])
+    assert runs.runs.nrows == 3
+
+
+def test_all_attributes_observations(observation_level_obj):
+    data = sdmx_json.SdmxJsonData(_add_group_attribute(observation_level_obj))
+
+    chunks = list(data.iter_observations(chunk_size=2, all_attributes=True))
+    assert [chunk.nrows for chunk in chunks] == [2, 2, 1]
+    actual = data.get_observations(all_attributes=True)
+    assert actual.names[-2:] == ("Unit multiplier", "Decimals")
+    assert actual["Decimals"].to_list()[0] == ["Four"] * 4 + ["Two"]
+    assert chunks[2]["Decimals"].to_list()[0] == ["Two"]
+
+
+def test_all_attributes_not_given(data, helpers):
+    actual = data.get_observations(all_attributes=True)
+
+    helpers.check_dt_Frames_eq(actual[:, :-1], data.get_observations())
+    assert actual.names[-1] == "Unit multiplier"
+
+
+def test_annotations(data):
+    actual = data.get_annotations()
+
+    assert actual.to_dict() == {
+        "dataSet": [0, 0],
+        "series": [None, "0:1"],
+        "id": ["A1", "A1"],
+        "title": ["Rates are indicative"] * 2,
+        "type": ["NOTE"] * 2,
+        "text": [None, None],
+    }
+
+
+def test_links(exr_data_obj):
+    exr_data_obj["dataSets"][0]["links"] = [
+        {"href": "https://example.org/data/EXR", "rel": "self"}
+    ]
+    actual = sdmx_json.SdmxJsonData(exr_data_obj).get_links()
+
+    assert actual["dataSet"].to_list() == [[None, 0]]
+    assert actual["rel"].to_list() == [["datastructure", "self"]]
+    assert actual[1, "href"] == "https://example.org/data/EXR"
+
+
+def test_wide_series(data):
+    actual = data.get_observations(shape="wide")
+
+    assert actual.names == (
+        "Frequency",
+        "Currency",
+        "Series title",
+        "2013-01-18",
+        "2013-01-21",
+        "2013-01",
+    )
+    assert actual.to_list()[3:] == [
+        [1.5931, 40.3426, None],
+        [1.5925, 40.3, None],
+        [None, None, 41.0],
+    ]
+
+
+def test_wide_observations(observation_level_obj):
+    actual = sdmx_json.SdmxJsonData(observation_level_obj).get_observations(
+        shape="wide", all_attributes=True
+    )
+
+    assert actual.names[:3] == ("Frequency", "Currency", "Unit multiplier")
+    assert actual.shape == (3, 6)
+    assert actual["2013-01"].to_list() == [[None, None, 41.0]]
+
+
+def test_wide_name_clash(exr_data_obj):
+    # A time period labelled like a dimension
+    time_period = exr_data_obj["structure"]["dimensions"]["observation"][0]
+    time_period["values"][0]["name"] = "Currency"
+    data = sdmx_json.SdmxJsonData(exr_data_obj)
+
+    with pytest.raises(ValueError, match="\\['Currency'\\]"):
+        data.get_observations(shape="wide")
+
+
+def test_wide_invalid(data):
+    with pytest.raises(ValueError):
+        data.get_observations(shape="tall")
+    with pytest.raises(ValueError):
+        data.get_observations(shape="wide", parse_time_periods=True)
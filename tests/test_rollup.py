@@ -0,0 +1,69 @@
+import pytest
+
+from sdmx_dt import sdmx_json
+from sdmx_dt.information_model.item_scheme import HierarchyIndex
+from sdmx_dt.rollup import rollup
+
+
+@pytest.fixture
+def data(exr_data_obj):
+    currencies = exr_data_obj["structure"]["dimensions"]["series"][1]["values"]
+    for currency in currencies:
+        currency["parent"] = "ALL"
+    currencies.append({"id": "ALL", "name": "All currencies"})
+    return sdmx_json.SdmxJsonData(exr_data_obj)
+
+
+def test_rollup_structure_hierarchy(data):
+    actual = rollup(data, {"CURRENCY": 0})
+
+    assert actual.names == ("Frequency", "Currency", "Time period or range", "Value")
+    assert actual.to_list() == [
+        ["Daily", "Daily", "Monthly"],
+        ["All currencies"] * 3,
+        ["2013-01-18", "2013-01-21", "2013-01"],
+        [1.5931 + 40.3426, 1.5925 + 40.3, 41.0],
+    ]
+
+
+def test_rollup_given_hierarchy(data):
+    months = HierarchyIndex(
+        ["2013", "2013-01", "2013-01-18", "2013-01-21"],
+        [None, "2013", "2013-01", "2013-01"],
+    )
+    actual = rollup(data, {"TIME_PERIOD": 0}, {"TIME_PERIOD": months}, agg="count")
+
+    assert actual[:, ["Currency", "Time period or range", "Value"]].to_list() == [
+        ["New Zealand dollar", "Russian rouble", "Russian rouble"],
+        ["2013", "2013", "2013"],
+        [2, 2, 1],
+    ]
+
+
+def test_rollup_drops_higher_levels(data):
+    # Series of "ALL" (which is above level 1) are dropped
+    data.dataSets[0].series["0:2"] = {"attributes": [0], "observations": {"0": [9.9]}}
+    actual = rollup(data, {"CURRENCY": 1}, agg="max")
+
+    assert actual[:, ["Currency", "Value"]].to_list() == [
+        ["New Zealand dollar"] * 2 + ["Russian rouble"] * 3,
+        [1.5931, 1.5925, 40.3426, 40.3, 41.0],
+    ]
+
+
+def test_rollup_unknown_dimension(data):
+    with pytest.raises(ValueError, match="REF_AREA"):
+        rollup(data, {"REF_AREA": 1})
+
+
+def test_rollup_parent_not_in_structure(exr_data_obj):
+    # Structure values only list the codes used, so "ALL" is not a value
+    currencies = exr_data_obj["structure"]["dimensions"]["series"][1]["values"]
+    for currency in currencies:
+        currency["parent"] = "ALL"
+    actual = rollup(sdmx_json.SdmxJsonData(exr_data_obj), {"CURRENCY": 0})
+
+    assert actual[:, ["Currency", "Value"]].to_list() == [
+        ["ALL"] * 3,
+        [1.5931 + 40.3426, 1.5925 + 40.3, 41.0],
+    ]
@@ -0,0 +1,49 @@
+import pytest
+
+from sdmx_dt import sdmx_json
+from sdmx_dt.sdmx_csv import fread_sdmx_csv
+
+EXR_CSV = """DATAFLOW,FREQ,CURRENCY,CURRENCY_DENOM,TIME_PERIOD,OBS_VALUE,TITLE,OBS_STATUS
+ECB:EXR(1.0),D,NZD,EUR,2013-01-18,1.5931,New Zealand dollar (NZD),A
+ECB:EXR(1.0),D,NZD,EUR,2013-01-21,1.5925,New Zealand dollar (NZD),A
+ECB:EXR(1.0),D,RUB,EUR,2013-01-18,40.3426,Russian rouble (RUB),E
+ECB:EXR(1.0),D,RUB,EUR,2013-01-21,40.3,Russian rouble (RUB),A
+ECB:EXR(1.0),M,RUB,EUR,2013-01,41,Russian rouble (RUB),
+"""
+
+
+@pytest.fixture
+def data(exr_data_obj):
+    return sdmx_json.SdmxJsonData(exr_data_obj)
+
+
+@pytest.mark.parametrize("structure_type", ["data", "compiled", "dict"])
+def test_same_as_get_observations(data, exr_data_obj, structure_type, helpers):
+    structure = {
+        "data": data,
+        "compiled": data.compiled,
+        "dict": exr_data_obj["structure"],
+    }[structure_type]
+    actual = fread_sdmx_csv(EXR_CSV, structure)
+
+    helpers.check_dt_Frames_eq(actual, data.get_observations())
+
+
+def test_unknown_codes(data):
+    text = EXR_CSV.replace("NZD,EUR,2013-01-18", "XXX,EUR,2014-01-01")
+    actual = fread_sdmx_csv(text, data)
+
+    assert actual[0, "Currency"] is None
+    # Time periods outside of the structure are kept as they are
+    assert actual[0, "Time period or range"] == "2014-01-01"
+
+
+def test_non_numeric_values(data):
+    actual = fread_sdmx_csv(EXR_CSV.replace("1.5931", "n/a"), data)
+
+    assert actual["Value"].to_list()[0][:2] == ["n/a", "1.5925"]
+
+
+def test_missing_value_column(data):
+    with pytest.raises(ValueError):
+        fread_sdmx_csv(EXR_CSV.replace("OBS_VALUE", "VALUE"), data)
@@ -104,18 +104,45 @@ expected_all = {
     },
 }
 
+# Local copies of the samples (and optionally the schema, as "schema.json"),
+# served by the fixture server so these tests run offline. They keep the
+# samples' typos, which are fixed by `sdmx_json_msg_local`. Set
+# SDMX_DT_REMOTE_SAMPLES=1 to fetch the samples from GitHub instead.
+SAMPLES_DIR = os.environ.get(
+    "SDMX_DT_SAMPLES_DIR", os.path.join(os.path.dirname(__file__), "samples")
+)
+REMOTE_SAMPLES = os.environ.get("SDMX_DT_REMOTE_SAMPLES") == "1"
+
 pytestmark = pytest.mark.parametrize("name", expected_all.keys())
 
 
+@pytest.fixture(scope="module")
+def samples_url():
+    if REMOTE_SAMPLES:
+        yield sdmx_json_samples_url
+        return
+
+    from tests.fixture_server import FixtureServer
+
+    with FixtureServer(root=SAMPLES_DIR) as server:
+        schema_url = sdmx_json.DEFAULT_SCHEMA_URL
+        if os.path.exists(os.path.join(SAMPLES_DIR, "schema.json")):
+            sdmx_json.DEFAULT_SCHEMA_URL = f"{server.url}/files/schema.json"
+        else:
+            sdmx_json.DEFAULT_SCHEMA_URL = f"{server.url}/schema"
+        yield f"{server.url}/files/"
+        sdmx_json.DEFAULT_SCHEMA_URL = schema_url
+
+
 @pytest.fixture
-def sdmx_json_msg_remote(name):
-    return sdmx_json.fread_json(sdmx_json_samples_url + name)
+def sdmx_json_msg_remote(name, samples_url):
+    return sdmx_json.fread_json(samples_url + name)
 
 
 @pytest.fixture
-def sdmx_json_msg_local(name):
+def sdmx_json_msg_local(name, samples_url):
     path = os.path.join(DATA_DIR, name.split("/")[-1])
-    r = requests.get(sdmx_json_samples_url + name)
+    r = requests.get(samples_url + name)
     raw_msg = json.loads(r.content.decode())
 
     # Fix typos in agri.json. This doesn't preserve original ordering
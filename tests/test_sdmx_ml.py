@@ -0,0 +1,115 @@
+import gzip
+import os
+
+import pytest
+
+from sdmx_dt import sdmx_json
+from sdmx_dt.sdmx_ml import fread_sdmx_ml, iter_sdmx_ml
+from tests import DATA_DIR
+
+STRUCTURE_SPECIFIC = """<?xml version="1.0" encoding="UTF-8"?>
+<message:StructureSpecificData
+    xmlns:message="http://www.sdmx.org/resources/sdmxml/schemas/v2_1/message"
+    xmlns:ss="http://www.sdmx.org/resources/sdmxml/schemas/v2_1/data/structurespecific">
+  <message:Header><message:ID>EXR</message:ID></message:Header>
+  <message:DataSet ss:dataScope="DataStructure" ss:structureRef="ECB_EXR1">
+    <Series FREQ="D" CURRENCY="NZD" CURRENCY_DENOM="EUR"
+        TITLE="New Zealand dollar (NZD)">
+      <Obs TIME_PERIOD="2013-01-18" OBS_VALUE="1.5931" OBS_STATUS="A"/>
+      <Obs TIME_PERIOD="2013-01-21" OBS_VALUE="1.5925" OBS_STATUS="A"/>
+    </Series>
+    <Series FREQ="D" CURRENCY="RUB" CURRENCY_DENOM="EUR"
+        TITLE="Russian rouble (RUB)">
+      <Obs TIME_PERIOD="2013-01-18" OBS_VALUE="40.3426" OBS_STATUS="E"/>
+      <Obs TIME_PERIOD="2013-01-21" OBS_VALUE="40.3" OBS_STATUS="A"/>
+    </Series>
+    <Series FREQ="M" CURRENCY="RUB" CURRENCY_DENOM="EUR"
+        TITLE="Russian rouble (RUB)">
+      <Obs TIME_PERIOD="2013-01" OBS_VALUE="41"/>
+    </Series>
+  </message:DataSet>
+</message:StructureSpecificData>
+"""
+
+
+def _generic_series(key, title, observations):
+    values = "".join(
+        f'<generic:Value id="{id_}" value="{value}"/>'
+        for id_, value in zip(["FREQ", "CURRENCY", "CURRENCY_DENOM"], key)
+    )
+    obs = ""
+    for time_period, value, status in observations:
+        attrs = (
+            f'<generic:Attributes><generic:Value id="OBS_STATUS" value="{status}"/>'
+            "</generic:Attributes>"
+            if status
+            else ""
+        )
+        obs += (
+            f'<generic:Obs><generic:ObsDimension value="{time_period}"/>'
+            f'<generic:ObsValue value="{value}"/>{attrs}</generic:Obs>'
+        )
+    return (
+        f"<generic:Series><generic:SeriesKey>{values}</generic:SeriesKey>"
+        f'<generic:Attributes><generic:Value id="TITLE" value="{title}"/>'
+        f"</generic:Attributes>{obs}</generic:Series>"
+    )
+
+
+GENERIC = f"""<?xml version="1.0" encoding="UTF-8"?>
+<message:GenericData
+    xmlns:message="http://www.sdmx.org/resources/sdmxml/schemas/v2_1/message"
+    xmlns:generic="http://www.sdmx.org/resources/sdmxml/schemas/v2_1/data/generic">
+  <message:Header><message:ID>EXR</message:ID></message:Header>
+  <message:DataSet>
+    {_generic_series(
+        ["D", "NZD", "EUR"],
+        "New Zealand dollar (NZD)",
+        [("2013-01-18", "1.5931", "A"), ("2013-01-21", "1.5925", "A")],
+    )}
+    {_generic_series(
+        ["D", "RUB", "EUR"],
+        "Russian rouble (RUB)",
+        [("2013-01-18", "40.3426", "E"), ("2013-01-21", "40.3", "A")],
+    )}
+    {_generic_series(
+        ["M", "RUB", "EUR"],
+        "Russian rouble (RUB)",
+        [("2013-01", "41", None)],
+    )}
+  </message:DataSet>
+</message:GenericData>
+"""
+
+
+@pytest.fixture
+def data(exr_data_obj):
+    return sdmx_json.SdmxJsonData(exr_data_obj)
+
+
+def _write(name, text, compress=False):
+    path = os.path.join(DATA_DIR, name)
+    with (gzip.open if compress else open)(path, "wb") as f:
+        f.write(text.encode("utf-8"))
+    return path
+
+
+@pytest.mark.parametrize(
+    "message_type, text",
+    [("structure-specific", STRUCTURE_SPECIFIC), ("generic", GENERIC)],
+)
+def test_same_as_get_observations(data, message_type, text, helpers):
+    path = _write(f"sdmx-ml-{message_type}.xml", text)
+    actual = fread_sdmx_ml(path, data)
+
+    helpers.check_dt_Frames_eq(actual, data.get_observations())
+
+
+def test_chunks(data, helpers):
+    path = _write("sdmx-ml-chunks.xml.gz", STRUCTURE_SPECIFIC, compress=True)
+    chunks = list(iter_sdmx_ml(path, data, chunk_size=2))
+
+    assert [chunk.nrows for chunk in chunks] == [2, 2, 1]
+    for chunk in chunks:
+        assert chunk.names == data.get_observations().names
+    helpers.check_dt_Frames_eq(chunks[1], data.get_observations()[2:4, :])
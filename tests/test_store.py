@@ -0,0 +1,78 @@
+import os
+
+import pytest
+from datatable import dt, f
+
+from sdmx_dt import sdmx_json
+from sdmx_dt.store import DataStore
+from tests import DATA_DIR
+
+TIME = "Time period or range"
+KEY = ["Frequency", "Currency", TIME]
+
+
+@pytest.fixture
+def store(request):
+    return DataStore(os.path.join(DATA_DIR, "store", request.node.name))
+
+
+@pytest.fixture
+def data(exr_data_obj):
+    return sdmx_json.SdmxJsonData(exr_data_obj)
+
+
+def test_write_message(store, data, helpers):
+    written = store.write_message("EXR", data)
+
+    assert written == ["2013"]
+    assert store.dataflows() == ["EXR"]
+    manifest = store.get_manifest("EXR")
+    assert manifest["partition_column"] == TIME
+    assert manifest["key_columns"] == KEY
+    assert manifest["partitions"]["2013"]["nrows"] == 5
+    helpers.check_dt_Frames_eq(store.read("EXR"), data.get_observations())
+
+
+def test_update_rewrites_affected_partitions(store, data):
+    frame = data.get_observations()
+    frame[f[TIME] == "2013-01", TIME] = "2012-12"
+    store.write("EXR", frame, TIME, KEY)
+    assert store.partitions("EXR") == ["2012", "2013"]
+    before = store.get_manifest("EXR")["partitions"]["2012"]
+
+    incoming = frame[0, :]
+    incoming[0, "Value"] = 2.0
+    incoming.rbind(
+        dt.Frame(
+            {
+                "Frequency": ["Daily"],
+                "Currency": ["Euro"],
+                TIME: ["2013-01-22"],
+                "Value": [1.0],
+                "Series title": [None],
+                "Observation status": ["Normal value"],
+            }
+        )
+    )
+    assert store.update("EXR", incoming) == ["2013"]
+
+    assert store.get_manifest("EXR")["partitions"]["2012"] == before
+    actual = store.read("EXR", ["2013"])
+    assert actual.nrows == 5
+    assert actual[f.Currency == "New Zealand dollar", "Value"].to_list() == [
+        [1.5925, 2.0]
+    ]
+
+
+def test_delete(store, data):
+    frame = data.get_observations()
+    store.write("EXR", frame, TIME, KEY)
+
+    assert store.delete("EXR", frame[:2, :]) == ["2013"]
+    assert store.read("EXR").nrows == 3
+    assert store.get_manifest("EXR")["partitions"]["2013"]["nrows"] == 3
+
+
+def test_missing_dataflow(store):
+    with pytest.raises(KeyError):
+        store.read("NOPE")
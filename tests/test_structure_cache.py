@@ -0,0 +1,122 @@
+import copy
+
+import pytest
+
+from sdmx_dt import sdmx_json
+
+
+@pytest.fixture
+def cache():
+    return sdmx_json.StructureCache(maxsize=2)
+
+
+def test_structure_reused_across_messages(exr_data_obj, cache):
+    data_1 = sdmx_json.SdmxJsonData(exr_data_obj, structure_cache=cache)
+    data_2 = sdmx_json.SdmxJsonData(exr_data_obj, structure_cache=cache)
+
+    assert len(cache) == 1
+    assert data_1.compiled is data_2.compiled
+    assert data_1.structure is data_2.structure
+
+
+def test_equal_structures_reused(exr_data_obj, cache):
+    # Each message has its own (but equal) "structure" object
+    compiled = cache.get(copy.deepcopy(exr_data_obj["structure"]))
+    assert cache.get(copy.deepcopy(exr_data_obj["structure"])) is compiled
+    assert len(cache) == 1
+
+
+def test_compiled_lookups(exr_data_obj, cache):
+    compiled = cache.get(exr_data_obj["structure"])
+
+    currency = compiled.dimensions["series"][1]
+    assert currency.name == "Currency"
+    assert currency.labels == ["New Zealand dollar", "Russian rouble"]
+    assert compiled.attributes["observation"][0].default_label == "Normal value"
+    assert compiled.key[0].endswith("DataStructure=ECB:ECB_EXR1(1.0)")
+
+
+def test_different_values_not_shared(exr_data_obj, cache):
+    # Same DSD, but the message-specific "values" differ
+    data_1 = sdmx_json.SdmxJsonData(exr_data_obj, structure_cache=cache)
+    exr_data_obj["structure"]["dimensions"]["series"][1]["values"].pop()
+    data_2 = sdmx_json.SdmxJsonData(exr_data_obj, structure_cache=cache)
+
+    assert len(cache) == 2
+    assert data_1.compiled.key[0] == data_2.compiled.key[0]
+    assert data_1.compiled != data_2.compiled
+
+
+def test_lru_eviction(exr_data_obj, cache):
+    structures = []
+    for name in ["a", "b", "c"]:
+        exr_data_obj["structure"]["name"] = name
+        structures.append(dict(exr_data_obj["structure"]))
+        cache.get(structures[-1])
+
+    assert len(cache) == 2
+    assert structures[0] not in cache
+    assert structures[1] in cache and structures[2] in cache
+
+
+def test_invalidate(exr_data_obj, cache):
+    dsd_urn = cache.get(exr_data_obj["structure"]).key[0]
+    cache.invalidate("urn:sdmx:some.other.DataStructure=X:Y(1.0)")
+    assert len(cache) == 1
+
+    cache.invalidate(dsd_urn)
+    assert len(cache) == 0
+
+    cache.get(exr_data_obj["structure"])
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_get_observations_with_cached_structure(exr_data_obj, cache, helpers):
+    data_1 = sdmx_json.SdmxJsonData(exr_data_obj, structure_cache=cache)
+    data_2 = sdmx_json.SdmxJsonData(exr_data_obj, structure_cache=cache)
+    actual = data_2.get_observations()
+
+    helpers.check_dt_Frames_eq(actual, data_1.get_observations())
+    assert actual.names == (
+        "Frequency",
+        "Currency",
+        "Time period or range",
+        "Value",
+        "Series title",
+        "Observation status",
+    )
+    assert actual["Series title"].to_list()[0] == 2 * [
+        "New Zealand dollar (NZD)"
+    ] + 3 * ["Russian rouble (RUB)"]
+    assert actual["Observation status"].to_list()[0] == [
+        "Normal value",
+        "Normal value",
+        "Estimated value",
+        "Normal value",
+        None,
+    ]
+
+
+def test_components_cached(exr_data_obj):
+    structure = sdmx_json.DataStructureDefinition(**exr_data_obj["structure"])
+    dimensions = structure.get_dimensions(include_values=True)
+    dimensions[0, "id"] = "CHANGED"
+
+    cached = structure.get_dimensions(include_values=True)
+    assert cached[0, "id"] == "FREQ"
+    assert cached["keyPosition"].to_list() == [[0, 0, 1, 1, 2, 3, 3, 3]]
+    assert structure.get_dimensions().nrows == 4
+    assert structure == sdmx_json.DataStructureDefinition(**exr_data_obj["structure"])
+
+
+def test_changed_structure_not_reused(exr_data_obj, cache):
+    data_1 = sdmx_json.SdmxJsonData(exr_data_obj, structure_cache=cache)
+    exr_data_obj["structure"]["dimensions"]["series"][1]["values"][0]["name"] = "NZD"
+    data_2 = sdmx_json.SdmxJsonData(exr_data_obj, structure_cache=cache)
+    data_3 = sdmx_json.SdmxJsonData(copy.deepcopy(exr_data_obj), structure_cache=cache)
+
+    assert data_1.compiled.dimensions["series"][1].labels[0] == "New Zealand dollar"
+    assert data_2.compiled.dimensions["series"][1].labels[0] == "NZD"
+    assert data_3.compiled is data_2.compiled
+    assert data_2.get_observations()["Currency"].to_list()[0][0] == "NZD"
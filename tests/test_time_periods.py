@@ -0,0 +1,76 @@
+from datetime import date
+
+import pytest
+from datatable import dt
+
+from sdmx_dt import sdmx_json
+from sdmx_dt.time_periods import add_period_columns, parse_period
+
+
+@pytest.mark.parametrize(
+    "period, expected",
+    [
+        ("2014", (date(2014, 1, 1), date(2014, 12, 31), "A")),
+        ("2014-A1", (date(2014, 1, 1), date(2014, 12, 31), "A")),
+        ("2020-S2", (date(2020, 7, 1), date(2020, 12, 31), "S")),
+        ("2020-T2", (date(2020, 5, 1), date(2020, 8, 31), "T")),
+        ("2020-Q1", (date(2020, 1, 1), date(2020, 3, 31), "Q")),
+        ("2021-M02", (date(2021, 2, 1), date(2021, 2, 28), "M")),
+        ("2020-02", (date(2020, 2, 1), date(2020, 2, 29), "M")),
+        ("2019-W05", (date(2019, 1, 28), date(2019, 2, 3), "W")),
+        ("2020-W53", (date(2020, 12, 28), date(2021, 1, 3), "W")),
+        ("2013-01-18", (date(2013, 1, 18), date(2013, 1, 18), "D")),
+        ("2020-D060", (date(2020, 2, 29), date(2020, 2, 29), "D")),
+    ],
+)
+def test_parse_period(period, expected):
+    assert parse_period(period) == expected
+
+
+@pytest.mark.parametrize(
+    "period", [None, "", "Q1", "2020-Q5", "2020-13", "2021-W53", "2021-D366"]
+)
+def test_parse_invalid_period(period):
+    assert parse_period(period) == (None, None, None)
+
+
+def test_add_period_columns():
+    frame = dt.Frame(TIME_PERIOD=["2020-Q2", "2014", None, "2020-Q2"], v=[1, 2, 3, 4])
+    actual = add_period_columns(frame, "TIME_PERIOD")
+
+    assert actual.names == (
+        "TIME_PERIOD",
+        "v",
+        "Period start",
+        "Period end",
+        "Period frequency",
+    )
+    assert actual["Period start"].types == [dt.Type.date32]
+    assert actual["Period end"].to_list()[0] == [
+        date(2020, 6, 30),
+        date(2014, 12, 31),
+        None,
+        date(2020, 6, 30),
+    ]
+    assert actual["Period frequency"].to_list()[0] == ["Q", "A", None, "Q"]
+
+
+def test_get_observations(exr_data_obj):
+    data = sdmx_json.SdmxJsonData(exr_data_obj)
+    actual = data.get_observations(parse_time_periods=True)
+
+    assert actual.names[:-3] == data.get_observations().names
+    assert actual["Period frequency"].to_list()[0] == ["D"] * 4 + ["M"]
+    assert actual[4, "Period end"] == date(2013, 1, 31)
+
+
+def test_get_observations_parses_codes(exr_data_obj):
+    # Period names need not be in SDMX format, but their ids are
+    time_period = exr_data_obj["structure"]["dimensions"]["observation"][0]
+    for value in time_period["values"]:
+        value["name"] = "Period " + value["id"]
+    data = sdmx_json.SdmxJsonData(exr_data_obj)
+    actual = data.get_observations(parse_time_periods=True)
+
+    assert actual["Period frequency"].to_list()[0] == ["D"] * 4 + ["M"]
+    assert actual[4, "Period end"] == date(2013, 1, 31)
@@ -0,0 +1,86 @@
+import os
+
+import pytest
+from datatable import dt
+
+from sdmx_dt import sdmx_json, writers
+from tests import DATA_DIR
+
+
+@pytest.fixture
+def data(exr_data_obj):
+    return sdmx_json.SdmxJsonData(exr_data_obj)
+
+
+def test_iter_observations_chunks(data, helpers):
+    chunks = list(data.iter_observations(chunk_size=2))
+
+    # Series are not split between chunks
+    assert [chunk.nrows for chunk in chunks] == [2, 2, 1]
+    combined = dt.Frame()
+    combined.rbind(*chunks)
+    helpers.check_dt_Frames_eq(combined, data.get_observations())
+
+
+def test_to_csv(data, helpers):
+    path = os.path.join(DATA_DIR, "writers.csv")
+    writers.to_csv(data, path, chunk_size=2)
+
+    expected = dt.fread(data.get_observations().to_csv())
+    helpers.check_dt_Frames_eq(dt.fread(path), expected)
+
+
+def test_to_jay(data, helpers):
+    path = os.path.join(DATA_DIR, "writers.jay")
+    writers.to_jay(data, path, chunk_size=2)
+
+    helpers.check_dt_Frames_eq(dt.fread(path), data.get_observations())
+
+
+@pytest.mark.parametrize("writer", ["to_arrow", "to_parquet"])
+def test_arrow_writers(data, writer):
+    pa = pytest.importorskip("pyarrow")
+    path = os.path.join(DATA_DIR, f"writers.{writer}")
+    getattr(writers, writer)(data, path, chunk_size=2)
+
+    if writer == "to_arrow":
+        table = pa.ipc.open_file(path).read_all()
+    else:
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(path)
+        assert pq.ParquetFile(path).num_row_groups == 3
+
+    assert pa.types.is_dictionary(table.schema.field("Currency").type)
+    assert table.schema.field("Value").type == pa.float64()
+    expected = data.get_observations().to_arrow()
+    for name in expected.column_names:
+        assert table[name].to_pylist() == expected[name].to_pylist()
+
+
+def test_to_arrow_table(data):
+    pytest.importorskip("pyarrow")
+    table = writers.to_arrow(data, chunk_size=2)
+
+    assert table.num_rows == 5
+    assert table["Observation status"].to_pylist()[-1] is None
+
+
+def test_to_arrow_empty(exr_data_obj):
+    pytest.importorskip("pyarrow")
+    exr_data_obj["dataSets"][0]["action"] = "Delete"
+    table = sdmx_json.SdmxJsonData(exr_data_obj).to_arrow()
+
+    assert table.num_rows == 0
+
+
+@pytest.mark.parametrize("library", ["polars", "pandas"])
+def test_dataframe_libraries(data, library):
+    pytest.importorskip("pyarrow")
+    pytest.importorskip(library)
+    frame = getattr(data, f"to_{library}")()
+
+    assert frame.shape == (5, 6)
+    assert list(frame.columns) == list(data.get_observations().names)
+    assert str(frame["Currency"].dtype).lower().startswith("categor")
+    assert list(frame["Value"]) == data.get_observations()["Value"].to_list()[0]